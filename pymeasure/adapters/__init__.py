@@ -21,20 +21,44 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import importlib
 import logging
+import sys
 
 from .adapter import Adapter, FakeAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-try:
-    from pymeasure.adapters.visa import VISAAdapter
-except ImportError:
-    log.warning("PyVISA library could not be loaded")
+# Adapters with optional dependencies are imported on first access, so that
+# PyVISA and PySerial are only loaded when they are used
+_backends = {
+    'VISAAdapter': ('.visa', "PyVISA"),
+    'SerialAdapter': ('.serial', "PySerial"),
+    'PrologixAdapter': ('.prologix', "PySerial"),
+}
 
-try:
-    from pymeasure.adapters.serial import SerialAdapter
-    from pymeasure.adapters.prologix import PrologixAdapter
-except ImportError:
-    log.warning("PySerial library could not be loaded")
+
+def __getattr__(name):
+    if name in _backends:
+        module, library = _backends[name]
+        try:
+            return getattr(importlib.import_module(module, __name__), name)
+        except ImportError:
+            log.warning("%s library could not be loaded" % library)
+            raise
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_backends))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) is not supported, so import eagerly
+    for _name in _backends:
+        try:
+            globals()[_name] = __getattr__(_name)
+        except ImportError:
+            pass
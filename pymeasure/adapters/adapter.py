@@ -26,6 +26,47 @@ import numpy as np
 from copy import copy
 
 
+def decode_block(raw, dtype=np.float32):
+    """ Returns a numpy array from an IEEE 488.2 binary block, which starts
+    with a definite length header (e.g. :code:`#42048`) or the indefinite
+    length header :code:`#0`. Any bytes before the block are skipped and
+    trailing termination characters are dropped.
+
+    :param raw: The bytes of the response
+    :param dtype: The NumPy data type of the values, including the byte order
+    :returns: NumPy array of values
+    """
+    dtype = np.dtype(dtype)
+    start = raw.find(b'#')
+    if start < 0:
+        raise ValueError("Response does not contain an IEEE 488.2 block")
+    digits = int(raw[start + 1:start + 2])
+    offset = start + 2 + digits
+    if digits == 0:
+        data = raw[offset:]
+        data = data[:len(data) - len(data) % dtype.itemsize]
+    else:
+        length = int(raw[start + 2:offset])
+        data = raw[offset:offset + length]
+        if len(data) < length:
+            raise ValueError("Binary block is incomplete, %d of %d bytes "
+                             "received" % (len(data), length))
+    return np.frombuffer(data, dtype=dtype)
+
+
+def encode_block(values, dtype=np.float32):
+    """ Returns the bytes of an IEEE 488.2 definite length binary block,
+    such as :code:`#42048<data>`, from an array of values.
+
+    :param values: An array of values
+    :param dtype: The NumPy data type of the values, including the byte order
+    :returns: Bytes of the block
+    """
+    data = np.ascontiguousarray(values, dtype=dtype).tobytes()
+    length = str(len(data)).encode()
+    return b"".join([b"#", str(len(length)).encode(), length, data])
+
+
 class Adapter(object):
     """ Base class for Adapter child classes, which adapt between the Instrument 
     object and the connection, to allow flexible use of different connection 
@@ -41,6 +82,24 @@ class Adapter(object):
         """
         raise NameError("Adapter (sub)class has not implemented writing")
 
+    def write_raw(self, data):
+        """ Writes bytes to the instrument, without encoding them
+
+        :param data: Bytes to be sent to the instrument
+        """
+        raise NameError("Adapter (sub)class has not implemented raw writing")
+
+    def write_block(self, command, values, dtype=np.float32):
+        """ Writes a command followed by an IEEE 488.2 binary block of
+        values, such as :code:`DATA:DAC VOLATILE, #42048<data>`
+
+        :param command: SCPI command string, which is followed directly by the block
+        :param values: An array of values
+        :param dtype: The NumPy data type to send the values as, including
+                      the byte order (e.g. :code:`'>i2'` for big-endian integers)
+        """
+        self.write_raw(command.encode() + encode_block(values, dtype))
+
     def ask(self, command):
         """ Writes the command to the instrument and returns the resulting 
         ASCII response
@@ -59,6 +118,24 @@ class Adapter(object):
         """
         raise NameError("Adapter (sub)class has not implemented reading")
 
+    def read_raw(self):
+        """ Reads until the buffer is empty and returns the resulting
+        bytes, without decoding them
+
+        :returns: Bytes response of the instrument.
+        """
+        raise NameError("Adapter (sub)class has not implemented raw reading")
+
+    def read_bytes(self, count):
+        """ Reads a fixed number of bytes from the instrument, such as
+        from a stream of binary data without termination characters
+
+        :param count: Integer number of bytes to read
+        :returns: Bytes response of the instrument.
+        """
+        raise NameError("Adapter (sub)class has not implemented reading "
+                        "a number of bytes")
+
     def values(self, command, separator=',', cast=float):
         """ Writes a command to the instrument and returns a list of formatted
         values from the result 
@@ -93,6 +170,18 @@ class Adapter(object):
         raise NameError("Adapter (sub)class has not implemented the "
                         "binary_values method")
 
+    def binary_block(self, command, dtype=np.float32):
+        """ Returns a numpy array from a query that responds with an
+        IEEE 488.2 binary block, such as :code:`#42048<data>`
+
+        :param command: SCPI command to be sent to the instrument
+        :param dtype: The NumPy data type to format the values with, including
+                      the byte order (e.g. :code:`'>f4'` for big-endian floats)
+        :returns: NumPy array of values
+        """
+        self.write(command)
+        return decode_block(self.read_raw(), dtype)
+
 
 class FakeAdapter(Adapter):
     """Provides a fake adapter for debugging purposes,
@@ -122,11 +211,23 @@ class FakeAdapter(Adapter):
         self._buffer = ""
         return result
 
+    def read_raw(self):
+        """ Returns the last commands given after the last read
+        call as bytes, with each character mapped to one byte.
+        """
+        return self.read().encode('latin-1')
+
     def write(self, command):
         """ Writes the command to a buffer, so that it can
         be read back.
         """
         self._buffer += command
 
+    def write_raw(self, data):
+        """ Writes bytes to the buffer, with each byte mapped
+        to one character, so that they can be read back.
+        """
+        self._buffer += data.decode('latin-1')
+
     def __repr__(self):
         return "<FakeAdapter>"
@@ -99,6 +99,20 @@ class PrologixAdapter(SerialAdapter):
         command += "\n"
         self.connection.write(command.encode())
 
+    def write_raw(self, data):
+        """ Writes bytes to the GPIB address stored in the
+        :attr:`.address`, escaping the characters that the Prologix
+        controller would otherwise interpret
+
+        :param data: Bytes to be sent to the instrument
+        """
+        if self.address is not None:
+            address_command = "++addr %d\n" % self.address
+            self.connection.write(address_command.encode())
+        for special in (b"\x1b", b"\r", b"\n", b"+"):
+            data = data.replace(special, b"\x1b" + special)
+        self.connection.write(data + b"\n")
+
     def read(self):
         """ Reads the response of the instrument until timeout
 
@@ -107,6 +121,14 @@ class PrologixAdapter(SerialAdapter):
         self.write("++read")
         return b"\n".join(self.connection.readlines()).decode()
 
+    def read_raw(self):
+        """ Reads the response of the instrument until EOI or timeout
+
+        :returns: Bytes response of the instrument
+        """
+        self.write("++read eoi")
+        return b"".join(self.connection.readlines())
+
     def gpib(self, address, rw_delay=None):
         """ Returns and PrologixAdapter object that references the GPIB
         address specified, while sharing the Serial connection with other
@@ -122,10 +144,15 @@ class PrologixAdapter(SerialAdapter):
     def wait_for_srq(self, timeout=25, delay=0.1):
         """ Blocks until a SRQ, and leaves the bit high
 
-        :param timeout: Timeout duration in seconds
+        :param timeout: Timeout duration in seconds, or None to wait indefinitely
         :param delay: Time delay between checking SRQ in seconds
+        :raises: TimeoutError if no SRQ is asserted within the timeout
         """
-        while int(self.ask("++srq")) != 1:  # TODO: Include timeout!
+        start = time.time()
+        while int(self.ask("++srq")) != 1:
+            if timeout is not None and time.time() - start >= timeout:
+                raise TimeoutError("Timed out after %g seconds waiting for "
+                                   "a SRQ" % timeout)
             time.sleep(delay)
 
     def __repr__(self):
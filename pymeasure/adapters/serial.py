@@ -59,6 +59,13 @@ class SerialAdapter(Adapter):
         """
         self.connection.write(command.encode())  # encode added for Python 3
 
+    def write_raw(self, data):
+        """ Writes bytes to the instrument, without encoding them
+
+        :param data: Bytes to be sent to the instrument
+        """
+        self.connection.write(data)
+
     def read(self):
         """ Reads until the buffer is empty and returns the resulting
         ASCII respone
@@ -67,6 +74,14 @@ class SerialAdapter(Adapter):
         """
         return b"\n".join(self.connection.readlines()).decode()
 
+    def read_raw(self):
+        """ Reads until the buffer is empty and returns the resulting
+        bytes, without decoding them
+
+        :returns: Bytes response of the instrument.
+        """
+        return b"".join(self.connection.readlines())
+
     def binary_values(self, command, header_bytes=0, dtype=np.float32):
         """ Returns a numpy array from a query for binary data 
 
@@ -83,6 +83,14 @@ class VISAAdapter(Adapter):
         """
         self.connection.write(command)
 
+    def write_raw(self, data):
+        """ Writes bytes to the instrument, without encoding them or
+        adding a termination character
+
+        :param data: Bytes to be sent to the instrument
+        """
+        self.connection.write_raw(data)
+
     def read(self):
         """ Reads until the buffer is empty and returns the resulting
         ASCII respone
@@ -91,6 +99,23 @@ class VISAAdapter(Adapter):
         """
         return self.connection.read()
 
+    def read_raw(self):
+        """ Reads until the buffer is empty and returns the resulting
+        bytes, without decoding them
+
+        :returns: Bytes response of the instrument.
+        """
+        return self.connection.read_raw()
+
+    def read_bytes(self, count):
+        """ Reads a fixed number of bytes, without waiting for a
+        termination character or the end of the message
+
+        :param count: Integer number of bytes to read
+        :returns: Bytes response of the instrument.
+        """
+        return self.connection.read_bytes(count)
+
     def ask(self, command):
         """ Writes the command to the instrument and returns the resulting
         ASCII response
@@ -145,7 +170,15 @@ class VISAAdapter(Adapter):
     def wait_for_srq(self, timeout=25, delay=0.1):
         """ Blocks until a SRQ, and leaves the bit high
 
-        :param timeout: Timeout duration in seconds
+        :param timeout: Timeout duration in seconds, or None to wait indefinitely
         :param delay: Time delay between checking SRQ in seconds
+        :raises: TimeoutError if no SRQ is asserted within the timeout
         """
-        self.connection.wait_for_srq(timeout * 1000)
+        try:
+            self.connection.wait_for_srq(
+                None if timeout is None else timeout * 1000)
+        except visa.VisaIOError as e:
+            if e.error_code == visa.constants.VI_ERROR_TMO:
+                raise TimeoutError("Timed out after %g seconds waiting for "
+                                   "a SRQ" % timeout)
+            raise
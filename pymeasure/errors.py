@@ -31,5 +31,11 @@ class RangeError(Error):
     pass
 
 
+class InstrumentError(Error):
+    """ Raised when an instrument reports errors for the commands of an
+    operation that can not be completed. """
+    pass
+
+
 # TODO should be deprecated someday
 RangeException = RangeError
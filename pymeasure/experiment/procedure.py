@@ -202,6 +202,38 @@ class Procedure(object):
     def emit(self, topic, record):
         raise NotImplementedError('should be monkey patched by a worker')
 
+    def emit_block(self, topic, block, columns=None):
+        """ Emits a block of data, such as the results of a hardware-timed
+        sweep, as one record per row through :meth:`~.emit`.
+
+        .. code-block:: python
+
+            records = keithley.sweep(voltages)
+            self.emit_block('results', records, columns={
+                'voltage': 'Voltage (V)', 'current': 'Current (A)'})
+
+        :param topic: The topic of the records, usually 'results'
+        :param block: A structured numpy array, a dictionary of equal length
+                      arrays, or a pandas DataFrame
+        :param columns: An optional dictionary that maps the field names of the
+                        block to the data columns, where only the fields in the
+                        dictionary are emitted
+        """
+        if getattr(getattr(block, 'dtype', None), 'names', None):
+            names = block.dtype.names
+        else:
+            names = list(block.keys())
+        if columns is not None:
+            names = [name for name in names if name in columns]
+        else:
+            columns = {name: name for name in names}
+        labels = [columns[name] for name in names]
+        arrays = [block[name] for name in names]
+        arrays = [a.tolist() if hasattr(a, 'tolist') else list(a)
+                  for a in arrays]
+        for row in zip(*arrays):
+            self.emit(topic, dict(zip(labels, row)))
+
     def should_stop(self):
         raise NotImplementedError('should be monkey patched by a worker')
 
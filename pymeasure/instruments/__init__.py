@@ -22,25 +22,49 @@
 # THE SOFTWARE.
 #
 
-from ..errors import RangeError, RangeException
+import importlib
+import sys
+
+from ..errors import InstrumentError, RangeError, RangeException
 from .instrument import Instrument
 from .mock import Mock
 from .resources import list_resources
 from .validators import discreteTruncate
 
-from . import advantest
-from . import agilent
-from . import ametek
-from . import anritsu
-from . import danfysik
-from . import fwbell
-from . import hp
-from . import keithley
-from . import lakeshore
-from . import parker
-from . import signalrecovery
-from . import srs
-from . import tektronix
-from . import thorlabs
-from . import yokogawa
-from . import rohdeschwarz
+# Vendor packages are imported on first access, so that using one driver
+# does not import every other driver and its dependencies
+_vendors = [
+    'advantest',
+    'agilent',
+    'ametek',
+    'anritsu',
+    'danfysik',
+    'fwbell',
+    'hp',
+    'keithley',
+    'lakeshore',
+    'parker',
+    'signalrecovery',
+    'srs',
+    'tektronix',
+    'thorlabs',
+    'yokogawa',
+    'rohdeschwarz',
+]
+
+
+def __getattr__(name):
+    if name in _vendors:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + _vendors)
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) is not supported, so import eagerly
+    for _name in _vendors:
+        globals()[_name] = __getattr__(_name)
@@ -26,11 +26,11 @@ import logging
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-from pymeasure.instruments import (Instrument,
+from pymeasure.instruments import (Instrument, InstrumentError,
                                    RangeException)
 from pymeasure.instruments.validators import (strict_discrete_set,
                                               truncated_discrete_set,
-                                              strict_range)
+                                              strict_range, DiscreteSet)
 import numpy as np
 import time
 import pandas as pd
@@ -188,7 +188,7 @@ class Agilent4156(Instrument):
             instr.delay_time = 1 # delay time of 1-sec
         """,
         validator=truncated_discrete_set,
-        values=np.arange(0, 65.1, 0.1),
+        values=DiscreteSet(np.arange(0, 65.1, 0.1)),
         check_set_errors=True,
         check_get_errors=True
     )
@@ -203,7 +203,7 @@ class Agilent4156(Instrument):
             instr.hold_time = 2 # hold time of 2-secs.
         """,
         validator=truncated_discrete_set,
-        values=np.arange(0, 655, 1),
+        values=DiscreteSet(np.arange(0, 655, 1)),
         check_set_errors=True,
         check_get_errors=True
     )
@@ -247,19 +247,17 @@ class Agilent4156(Instrument):
         .. code-block:: python
 
             instr.disable_all()
+
+        :raises: :class:`~pymeasure.errors.InstrumentError` if the instrument
+                 reports errors for the disable commands
         """
-        self.smu1.disable
-        time.sleep(0.1)
-        self.smu2.disable
-        time.sleep(0.1)
-        self.smu3.disable
-        time.sleep(0.1)
-        self.smu4.disable
-        time.sleep(0.1)
-        self.vmu1.disable
-        time.sleep(0.1)
-        self.vmu2.disable
-        time.sleep(0.1)
+        channels = ['SMU1', 'SMU2', 'SMU3', 'SMU4', 'VMU1', 'VMU2']
+        self.ask(";".join(":PAGE:CHAN:{}:DIS".format(channel)
+                          for channel in channels) + ";*OPC?")
+        errors = self.sync_errors()
+        if errors:
+            raise InstrumentError("{} could not disable the channels: {}".format(
+                self.name, "; ".join(message for _, message, _ in errors)))
 
     def configure(self, config_file):
         """ Convenience function to configure the channel setup and sweep using a `JSON (JavaScript Object Notation)`_ configuration file.
@@ -371,29 +369,23 @@ class Agilent4156(Instrument):
         varlist = dlist + dvar
         return list(filter(None, varlist))
 
-    def get_data(self, path=None):
+    def get_data(self, path=None, data_format='REAL,64'):
         """
         Gets the measurement data from the instrument after completion. If the measurement period is set to :code:`INF` in the :meth:`~.Agilent4156.measure` method, then the measurement must be stopped using :meth:`~.Agilent4156.stop` before getting valid data.
 
+        The data of each variable is transferred in a binary block by default, and collected into a single preallocated array.
+
         :param path: Path for optional data export to CSV.
+        :param data_format: Format of the data transfer, which can be :code:`REAL,64`, :code:`REAL,32` or :code:`ASCII`.
         :returns: Pandas Dataframe
 
         .. code-block:: python
 
             df = instr.get_data(path='./datafolder/data1.csv')
         """
-        if int(self.ask('*OPC?')):
-            header = self.data_variables
-        self.write(":FORM:DATA ASC")
-        # recursively get data for each variable
-        for i, listvar in enumerate(header):
-            data = self.values(":DATA? \'{}\'".format(listvar))
-            time.sleep(0.01)
-            if i == 0:
-                lastdata = data
-            else:
-                data = np.column_stack((lastdata, data))
-                lastdata = data
+        self.ask('*OPC?')
+        header = self.data_variables
+        data = self._read_data(header, data_format)
 
         df = pd.DataFrame(data=data, columns=header, index=None)
         if path is not None:
@@ -404,6 +396,81 @@ class Agilent4156(Instrument):
 
         return df
 
+    def stream_data(self, should_stop=lambda: False, timeout=60,
+                    min_interval=0.1, max_interval=5, data_format='REAL,64'):
+        """
+        Returns a generator that yields structured numpy arrays of the samples acquired since the previous yield, while a sampling measurement runs. The measurement is not stopped, so this can watch a measurement started with a period of :code:`INF` in the :meth:`~.Agilent4156.measure` method. The fields of the arrays are the :attr:`~.Agilent4156.data_variables`.
+
+        The number of samples is polled at the sampling interval, limited to the range from :code:`min_interval` to :code:`max_interval`, and the data is only read once it has grown. The :code:`:DATA?` query has no index range, so each read transfers the whole dataset. To keep these transfers from taking over long measurements, the polling slows down as the dataset grows, to at least ten times the duration of the last read, which can exceed :code:`max_interval`. The generator returns when :code:`should_stop` returns True.
+
+        :param should_stop: A function that returns True when streaming should stop.
+        :param timeout: A time in seconds without new samples after which a TimeoutError is raised.
+        :param min_interval: The minimum time in seconds between polls.
+        :param max_interval: The maximum time in seconds between polls.
+        :param data_format: Format of the data transfer, which can be :code:`REAL,64`, :code:`REAL,32` or :code:`ASCII`.
+
+        .. code-block:: python
+
+            instr.measure(period="INF")
+            for block in instr.stream_data(procedure.should_stop):
+                procedure.emit_block('results', block)
+            instr.stop()
+        """
+        header = self.data_variables
+        sampling_interval = float(self.ask(":PAGE:MEAS:SAMP:IINT?"))
+        interval = min(max(sampling_interval, min_interval), max_interval)
+        dtype = np.dtype([(name, np.float64) for name in header])
+        index = 0
+        poll_interval = interval
+        while True:
+            if not self.wait_for(
+                    lambda: self._data_points(header[0]) > index,
+                    timeout=timeout, should_stop=should_stop,
+                    interval=poll_interval, max_interval=poll_interval):
+                return
+            # The :DATA? query has no index range, so new samples are sliced
+            start = time.time()
+            data = self._read_data(header, data_format)
+            poll_interval = max(interval, 10 * (time.time() - start))
+            if len(data) > index:
+                block = np.empty(len(data) - index, dtype)
+                for i, name in enumerate(header):
+                    block[name] = data[index:, i]
+                yield block
+                index = len(data)
+
+    def _data_points(self, variable):
+        """ Returns the number of samples of a data variable. """
+        return int(self.ask(":DATA:POIN? \'{}\'".format(variable)))
+
+    def _read_data(self, header, data_format='REAL,64'):
+        """ Returns the data of the variables in the header as the columns
+        of a single numpy array, reading each variable in a binary block
+        unless the data format is :code:`ASCII`.
+        """
+        data_format = strict_discrete_set(
+            data_format, ['REAL,64', 'REAL,32', 'ASCII'])
+        if data_format == 'ASCII':
+            read = lambda command: np.array(self.values(command))
+        else:
+            dtype = '>f8' if data_format == 'REAL,64' else '>f4'
+            read = lambda command: self.binary_block(command, dtype)
+            self.write(":FORM:BORD NORM")
+        self.write(":FORM:DATA {}".format(data_format))
+        try:
+            data = np.empty((0, len(header)), np.float64)
+            for i, listvar in enumerate(header):
+                values = read(":DATA? \'{}\'".format(listvar))
+                if i == 0:
+                    data = np.empty((len(values), len(header)), np.float64)
+                # Variables may gain samples while a measurement runs
+                points = min(len(values), len(data))
+                data = data[:points]
+                data[:, i] = values[:points]
+        finally:
+            self.write(":FORM:DATA ASC")
+        return data
+
 ##########
 # CHANNELS
 ##########
@@ -23,10 +23,11 @@
 #
 
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.listsweep import ListSweepMixin
 from pymeasure.instruments.validators import truncated_range, strict_discrete_set
 
 
-class Agilent8257D(Instrument):
+class Agilent8257D(ListSweepMixin, Instrument):
     """Represents the Agilent 8257D Signal Generator and 
     provides a high-level interface for interacting with 
     the instrument.
@@ -39,8 +40,28 @@ class Agilent8257D(Instrument):
         generator.frequency = 5                 # Sets the output frequency to 5 GHz
         generator.enable()                      # Enables the output
 
+    Frequency hopping is faster as a list sweep, where the points are
+    uploaded in bulk and stepped through by the instrument.
+
+    .. code-block:: python
+
+        generator.config_list_sweep(np.linspace(1e9, 2e9, 101), powers=-10,
+                                    trigger='bus')
+        generator.start_list_sweep()
+        for i in range(101):
+            generator.trigger()                 # Steps to the next point
+            # Measure ...
+        generator.stop_list_sweep()
+
     """
 
+    FREQUENCY_RANGE = [250e3, 67e9]
+    POWER_RANGE = [-135, 25]
+    DWELL_RANGE = [1e-3, 60]
+    MAX_LIST_POINTS = 1601
+    LIST_START_COMMAND = ":INIT:CONT OFF;:INIT"
+    LIST_STOP_COMMAND = ":ABOR;:SOUR:FREQ:MODE CW;:SOUR:POW:MODE FIX"
+
     power = Instrument.control(
         ":POW?;", ":POW %g dBm;",
         """ A floating point property that represents the output power
@@ -313,6 +334,20 @@ class Agilent8257D(Instrument):
                    ":SOUR:SWE:GEN STEP;"
                    ":SOUR:SWE:MODE AUTO;")
 
+    def _write_list_sweep(self, frequencies, powers, dwell, trigger):
+        commands = [":SOUR:LIST:TYPE LIST",
+                    ":SOUR:LIST:FREQ " + self._list_values(frequencies)]
+        if powers is not None:
+            commands.append(":SOUR:LIST:POW " + self._list_values(powers))
+        if dwell is not None:
+            commands += [":SOUR:LIST:DWEL:TYPE LIST",
+                         ":SOUR:LIST:DWEL " + self._list_values(dwell)]
+        commands += [":SOUR:LIST:TRIG:SOUR %s" % trigger,
+                     ":TRIG:SOUR IMM",
+                     ":SOUR:FREQ:MODE LIST",
+                     ":SOUR:POW:MODE %s" % ("LIST" if powers is not None else "FIX")]
+        self.write(";".join(commands))
+
     def enable_retrace(self):
         self.write(":SOUR:LIST:RETR 1")
 
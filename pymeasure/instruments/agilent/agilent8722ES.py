@@ -26,7 +26,6 @@ from pymeasure.instruments import Instrument, discreteTruncate, RangeException
 
 import numpy as np
 import re
-from io import BytesIO
 
 
 class Agilent8722ES(Instrument):
@@ -38,6 +37,13 @@ class Agilent8722ES(Instrument):
     SCAN_POINT_VALUES = [3, 11, 21, 26, 51, 101, 201, 401, 801, 1601]
     SCATTERING_PARAMETERS = ("S11", "S12", "S21", "S22")
     S11, S12, S21, S22 = SCATTERING_PARAMETERS
+    # Commands that change the frequencies of the sweep
+    SWEEP_COMMANDS = ("STAR", "STOP", "CENT", "SPAN", "POIN", "CWFREQ",
+                      "PRES", "RECA", "*RST")
+    CACHE_COMMANDS = {'_frequencies': SWEEP_COMMANDS}
+    # Binary trace formats of the complex data types
+    TRACE_FORMATS = {np.dtype(np.complex64): (2, '>f4'),
+                     np.dtype(np.complex128): (3, '>f8')}
 
     start_frequency = Instrument.control(
         "STAR?", "STAR %e Hz",
@@ -64,6 +70,7 @@ class Agilent8722ES(Instrument):
             "Agilent 8722ES Vector Network Analyzer",
             **kwargs
         )
+        self._frequencies = None
 
     def set_fixed_frequency(self, frequency):
         """ Sets the scan to be of only one frequency in Hz """
@@ -145,17 +152,24 @@ class Agilent8722ES(Instrument):
 
     def scan(self, averages=1, blocking=True, timeout=25, delay=0.1):
         """ Initiates a scan with the number of averages specified and
-        blocks until the operation is complete if blocking is True
+        blocks until the operation is complete if blocking is True, by
+        waiting on the operation complete query (:code:`OPC?`)
+
+        :param averages: The number of sweeps to average
+        :param blocking: Toggles waiting for the scan to complete
+        :param timeout: A time in seconds to wait for the scan
+        :param delay: Unused, and kept for compatibility
         """
         if averages == 1:
-            self.disableAveraging()
-            self.setSingleSweep()
+            self.disable_averaging()
+            command = "SING"
+        else:
+            self.set_averaging(averages)
+            command = "NUMG%d" % averages
+        if blocking:
+            self._ask_opc(timeout, "OPC?;%s" % command)
         else:
-            self.setAveraging(averages)
-            self.write("*CLS;SRE 4;ESNB 1;")
-            self.restartAveraging(averages)
-            if blocking:
-                self.adapter.wait_for_srq(timeout, delay)
+            self.write(command)
 
     def is_scan_complete():
         pass  # TODO: Implement method for determining if the scan is completed
@@ -170,25 +184,74 @@ class Agilent8722ES(Instrument):
 
     @property
     def frequencies(self):
-        """ Returns a list of frequencies from the last scan
+        """ Returns a numpy array of the frequencies of the sweep, which is
+        cached until a command changes the sweep. Changes made from the
+        front panel are not detected.
         """
-        return np.linspace(
-            self.start_frequency,
-            self.stop_frequency,
-            num=self.scan_points
-        )
+        if self._frequencies is None:
+            self._frequencies = np.linspace(
+                self.start_frequency,
+                self.stop_frequency,
+                num=self.scan_points
+            )
+        return self._frequencies
 
     @property
     def data(self):
         """ Returns the real and imaginary data from the last scan
         """
-        # TODO: Implement binary transfer instead of ASCII
-        data = np.loadtxt(
-            BytesIO(self.ask("FORM4;OUTPDATA")),
-            delimiter=',',
-            dtype=np.float32
-        )
-        return data[:, 0], data[:, 1]
+        trace = self.trace()
+        return trace.real, trace.imag
+
+    def trace(self, dtype=np.complex64):
+        """ Returns the complex data of the last scan as a numpy array,
+        from a binary transfer in the 32-bit (:code:`FORM2`) or 64-bit
+        (:code:`FORM3`) floating point format.
+
+        :param dtype: The complex data type, either :code:`np.complex64`
+                      or :code:`np.complex128`
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in self.TRACE_FORMATS:
+            raise ValueError("Invalid trace data type %s for Agilent 8722ES, "
+                             "which should be complex64 or complex128" % dtype)
+        form, binary_dtype = self.TRACE_FORMATS[dtype]
+        self.write("FORM%d;OUTPDATA" % form)
+        # The data follows a header of #A and the length in two bytes
+        header = self.adapter.read_bytes(4)
+        if header[:2] != b'#A':
+            raise ValueError("Agilent 8722ES trace has an invalid header")
+        length = int.from_bytes(header[2:4], 'big')
+        data = np.frombuffer(self.adapter.read_bytes(length),
+                             dtype=binary_dtype)
+        return data.astype(dtype.char.lower()).view(dtype)
+
+    def acquire(self, sweeps, should_stop=lambda: False, timeout=25,
+                dtype=np.complex64):
+        """ Returns a generator that takes a number of single sweeps, and
+        yields the complex trace of each one as a numpy array. Each sweep
+        is started with an operation complete query (:code:`OPC?;SING`),
+        which responds as soon as the sweep is done, so that the trace is
+        read and the next sweep started without polling.
+
+        .. code-block:: python
+
+            for trace in vna.acquire(100, procedure.should_stop):
+                procedure.emit('results', ...)
+
+        :param sweeps: The number of sweeps
+        :param should_stop: A function that returns True when no more
+                            sweeps should be taken
+        :param timeout: A time in seconds to wait for each sweep
+        :param dtype: The complex data type of the traces, either
+                      :code:`np.complex64` or :code:`np.complex128`
+        """
+        self.disable_averaging()
+        for _ in range(sweeps):
+            if should_stop():
+                return
+            self._ask_opc(timeout, "OPC?;SING")
+            yield self.trace(dtype)
 
     def log_magnitude(self, real, imaginary):
         """ Returns the magnitude in dB from a real and imaginary
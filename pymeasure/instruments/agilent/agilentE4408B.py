@@ -25,7 +25,6 @@
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range
 
-from io import StringIO
 import numpy as np
 import pandas as pd
 
@@ -36,6 +35,10 @@ class AgilentE4408B(Instrument):
     high-frequency spectrums
     """
 
+    # Commands that change the frequencies of the sweep
+    SWEEP_COMMANDS = ("FREQ", "POIN", "*RST", "SYST:PRES")
+    CACHE_COMMANDS = {'_frequencies': SWEEP_COMMANDS}
+
     start_frequency = Instrument.control(
         ":SENS:FREQ:STAR?;", ":SENS:FREQ:STAR %e Hz;",
         """ A floating point property that represents the start frequency
@@ -82,30 +85,83 @@ class AgilentE4408B(Instrument):
             "Agilent E4408B Spectrum Analyzer",
             **kwargs
         )
+        self._frequencies = None
 
     @property
     def frequencies(self):
         """ Returns a numpy array of frequencies in Hz that 
         correspond to the current settings of the instrument.
+        The array is cached until a command changes the sweep, so
+        changes made from the front panel are not detected.
         """
-        return np.linspace(
-            self.start_frequency, 
-            self.stop_frequency,
-            self.frequency_points,
-            dtype=np.float64
-        )
+        if self._frequencies is None:
+            self._frequencies = np.linspace(
+                self.start_frequency,
+                self.stop_frequency,
+                self.frequency_points,
+                dtype=np.float64
+            )
+        return self._frequencies
 
     def trace(self, number=1):
         """ Returns a numpy array of the data for a particular trace
-        based on the trace number (1, 2, or 3).
+        based on the trace number (1, 2, or 3), from a binary transfer
+        of 32-bit floating point values.
         """
-        self.write(":FORMat:TRACe:DATA ASCII;")
-        data = np.loadtxt(
-            StringIO(self.ask(":TRACE:DATA? TRACE%d;" % number)),
-            delimiter=',',
-            dtype=np.float64
-        )
-        return data
+        self.write(":FORMat:TRACe:DATA REAL,32;:FORMat:BORDer SWAP;")
+        return self.binary_block(":TRACE:DATA? TRACE%d;" % number, '<f4')
+
+    def markers(self, *numbers):
+        """ Returns a list of the frequency in Hz and amplitude of each
+        marker (1 to 4), which are read with a single query.
+
+        .. code-block:: python
+
+            (f1, level1), (f2, level2) = sa.markers(1, 2)
+        """
+        for number in numbers:
+            if number not in (1, 2, 3, 4):
+                raise ValueError("Invalid marker %s for Agilent E4408B, "
+                                 "which should be 1 to 4" % number)
+        values = self.values(";".join(
+            ":CALC:MARK%d:X?;:CALC:MARK%d:Y?" % (number, number)
+            for number in numbers), separator=';')
+        return list(zip(values[::2], values[1::2]))
+
+    def waterfall(self, traces, should_stop=lambda: False, number=1,
+                  sweeps=None, timeout=60, out=None):
+        """ Returns a generator that takes single sweeps and yields each
+        trace as a row of a ring buffer of shape :code:`(traces, points)`,
+        which is allocated up front. The trace of sweep :code:`i` is
+        stored in row :code:`i % traces`, so the buffer can be shown as
+        a live image while each trace is emitted.
+
+        .. code-block:: python
+
+            image = np.zeros((100, sa.frequency_points))
+            for trace in sa.waterfall(100, procedure.should_stop, out=image):
+                procedure.emit_block('results', {
+                    'Frequency (Hz)': sa.frequencies, 'Peak (dB)': trace})
+
+        :param traces: The number of traces in the ring buffer
+        :param should_stop: A function that returns True when no more
+                            sweeps should be taken
+        :param number: The trace number (1, 2, or 3)
+        :param sweeps: The number of sweeps, or None to sweep until stopped
+        :param timeout: A time in seconds to wait for each sweep
+        :param out: A float array of shape :code:`(traces, points)` to write
+                    the traces into, or None to allocate it
+        """
+        if out is None:
+            out = np.empty((traces, self.frequency_points), np.float64)
+        self.write(":INIT:CONT OFF;")
+        sweep = 0
+        while (sweeps is None or sweep < sweeps) and not should_stop():
+            self._ask_opc(timeout, ":INIT:IMM;*OPC?")
+            row = out[sweep % traces]
+            row[:] = self.trace(number)
+            yield row
+            sweep += 1
 
     def trace_df(self, number=1):
         """ Returns a pandas DataFrame containing the frequency
@@ -28,8 +28,10 @@ log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import modular_range, truncated_discrete_set, truncated_range
+from pymeasure.instruments.signalrecovery.buffer import DSPBuffer
 
-class Ametek7270(Instrument):
+
+class Ametek7270(Instrument, DSPBuffer):
     """This is the class for the Ametek DSP 7270 lockin amplifier"""
 
     SENSITIVITIES = [
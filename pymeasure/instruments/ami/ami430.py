@@ -27,12 +27,12 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument
-from pymeasure.adapters import VISAAdapter
+from pymeasure.instruments.scan import continuous_scan
+from pymeasure.adapters.visa import VISAAdapter
 from pymeasure.instruments.validators import (
     truncated_discrete_set, strict_discrete_set,
     truncated_range
 )
-from time import sleep, time
 import numpy as np
 import re
 
@@ -60,12 +60,15 @@ class AMI430(Instrument):
     
         magnet.ramp_to_current(5)             # Ramps the current to 5 A
 
+        # Measures while ramping the field to 1 kGauss at 0.01 kGauss/s
+        records = magnet.scan_field(1, 0.01, {'voltage': lambda: meter.voltage})
+
         magnet.shutdown()                     # Ramps the current to zero and disables output
 
     """
     def __init__(self, resourceName, **kwargs):
         adapter = VISAAdapter(resourceName, read_termination='\n')
-        super(ami430, self).__init__(
+        super(AMI430, self).__init__(
             adapter,
             "AMI superconducting magnet power supply.",
             includeSCPI=True,
@@ -206,15 +209,62 @@ class AMI430(Instrument):
 
     def wait_for_holding(self, should_stop=lambda: False,
                          timeout=800, interval=0.1):
+        """ Blocks the program until the magnet is holding, paused or at
+        zero current. This function returns early if the :code:`should_stop`
+        function returns True.
+
+        :param should_stop: A function that returns True when this function should return early
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param interval: The maximum time in seconds between checks of the state
         """
+        self.wait_for(lambda: self.state in (2, 3, 8), timeout=timeout,
+                      should_stop=should_stop, max_interval=interval)
+
+    def scan_field(self, field, rate, measurables, interval=0,
+                   should_stop=lambda: False, timeout=None,
+                   callback=lambda record: None, tolerance=1e-3):
+        """ Ramps the field with :meth:`~.ramp_to_field` while sampling the
+        measurables together with the magnet field, until the magnet is no
+        longer ramping (see :func:`~pymeasure.instruments.scan.continuous_scan`).
+        Since the state can still read as holding right after the ramp is
+        started, the scan only ends once the magnet has been seen ramping, or
+        the field is within the tolerance of the target.
+        The ramp is paused if the :code:`should_stop` function returns True.
+
+        :param field: The target field in kGauss
+        :param rate: The ramp rate in kGauss/s
+        :param measurables: A dictionary of names and functions that return the
+                            measured values
+        :param interval: A minimum time in seconds between samples
+        :param should_stop: A function that returns True to stop the scan early
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param callback: A function that is called with each sample as a dictionary
+        :param tolerance: A deviation in kGauss from the target at which the
+                          field has been reached
+        :returns: A structured numpy array with the fields 'time', 'position'
+                  (the field in kGauss), and the names of the measurables
         """
-        t = time()
-        while self.state != 2 and self.state != 3 and self.state != 8:
-            sleep(interval)
-            if should_stop():
-                return
-            if (time()-t) > timeout:
-                raise Exception("Timed out waiting for AMI430 switch to warm up.")
+        ramped = False
+
+        def is_done():
+            nonlocal ramped
+            state = self.state
+            if state == 1:
+                ramped = True
+                return False
+            # States other than holding, paused or at zero, such as a
+            # quench, end the scan as well
+            return (ramped or state not in (2, 3, 8) or
+                    abs(self.field - field) <= tolerance)
+
+        self.ramp_to_field(field, rate)
+        records = continuous_scan(
+            lambda: self.field, measurables, is_done,
+            interval, should_stop, timeout, callback
+        )
+        if should_stop():
+            self.pause()
+        return records
 
     def shutdown(self, ramp_rate=0.0357):
         """ Turns on the persistent switch,
@@ -23,11 +23,20 @@
 #
 
 from pymeasure.instruments import Instrument, discreteTruncate, RangeException
+from pymeasure.instruments.listsweep import ListSweepMixin
 
 
-class AnritsuMG3692C(Instrument):
+class AnritsuMG3692C(ListSweepMixin, Instrument):
     """ Represents the Anritsu MG3692C Signal Generator
     """
+    FREQUENCY_RANGE = [0.1, 20e9]
+    POWER_RANGE = [-130, 30]
+    DWELL_RANGE = [1e-3, 99]
+    LIST_DWELL_POINTS = False
+    MAX_LIST_POINTS = 2000
+    LIST_START_COMMAND = ":INIT:CONT OFF;:INIT"
+    LIST_STOP_COMMAND = ":ABOR;:FREQ:MODE CW"
+
     power = Instrument.control(
         ":POWER?;", ":POWER %g dBm;",
         """ A floating point property that represents the output power
@@ -70,6 +79,20 @@ class AnritsuMG3692C(Instrument):
         """
         self.output = False
 
+    def _write_list_sweep(self, frequencies, powers, dwell, trigger):
+        # Uses list 0, where the power is kept fixed if no powers are given
+        commands = [":LIST:IND 0",
+                    ":LIST:FREQ " + self._list_values(frequencies)]
+        if powers is not None:
+            commands.append(":LIST:POW " + self._list_values(powers))
+        if dwell is not None:
+            commands.append(":LIST:DWEL %r" % float(dwell))
+        commands += [":LIST:STAR 0",
+                     ":LIST:STOP %d" % (len(frequencies) - 1),
+                     ":TRIG:SOUR %s" % trigger,
+                     ":FREQ:MODE LIST"]
+        self.write(";".join(commands))
+
     def shutdown(self):
         """ Shuts down the instrument, putting it in a safe state.
         """
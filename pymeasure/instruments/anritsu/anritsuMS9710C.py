@@ -24,7 +24,7 @@
 import logging
 from time import sleep
 import numpy as np
-from pymeasure.instruments import Instrument
+from pymeasure.instruments import Instrument, InstrumentError
 from pymeasure.instruments.validators import (
     strict_discrete_set,
     truncated_discrete_set,
@@ -73,6 +73,17 @@ class AnritsuMS9710C(Instrument):
     ONOFF = ["ON", "OFF"]
     ONOFF_MAPPING = {True: 'ON', False: 'OFF', 1: 'ON', 0: 'OFF'}
 
+    # Commands that change the wavelength axis of the sweeps
+    SPAN_COMMANDS = ('CNT', 'SPN', 'STA', 'STO', 'MPT', 'PKC')
+    CACHE_COMMANDS = {'_wavelengths': SPAN_COMMANDS}
+
+    # Binary memory data, as 32-bit integers in units of 0.001 dBm
+    MEMORY_DTYPE = '>i4'
+    MEMORY_SCALE = 1e-3
+
+    # Bits of the ESR2 that are set at the end of a sweep
+    SWEEP_END = 0b11
+
     ######################
     #  Status Registers  #
     ######################
@@ -214,16 +225,6 @@ class AnritsuMS9710C(Instrument):
     #  Data Memory Commands  #
     ##########################
 
-    data_memory_a_size = Instrument.measurement(
-        'DBA?',
-        "Returns the number of points sampled in data memory register A."
-    )
-
-    data_memory_b_size = Instrument.measurement(
-        'DBB?',
-        "Returns the number of points sampled in data memory register B."
-    )
-
     data_memory_a_condition = Instrument.measurement(
         "DCA?",
         """Returns the data condition of data memory register A.
@@ -238,12 +239,12 @@ class AnritsuMS9710C(Instrument):
 
     data_memory_a_values = Instrument.measurement(
         "DMA?",
-        "Reads the binary data from memory register A."
+        "Reads the text data from memory register A."
     )
 
     data_memory_b_values = Instrument.measurement(
-        "DMA?",
-        "Reads the binary data from memory register B."
+        "DMB?",
+        "Reads the text data from memory register B."
     )
 
     data_memory_select = Instrument.control(
@@ -269,31 +270,88 @@ class AnritsuMS9710C(Instrument):
         get_process=_parse_trace_peak
     )
 
+    @property
+    def data_memory_a_size(self):
+        """Returns the number of points sampled in data memory register A."""
+        return int(self.data_memory_a_condition[2])
+
+    @property
+    def data_memory_b_size(self):
+        """Returns the number of points sampled in data memory register B."""
+        return int(self.data_memory_b_condition[2])
+
     def __init__(self, adapter, **kwargs):
         """Constructor."""
         self.analysis_mode = None
+        self._wavelengths = None
+        self._sweep_status = 0
         super(AnritsuMS9710C, self).__init__(adapter, "Anritsu MS9710C Optical Spectrum Analyzer", **kwargs)
 
     @property
     def wavelengths(self):
-        """Return a numpy array of the current wavelengths of scans."""
-        return np.linspace(
-            self.wavelength_start,
-            self.wavelength_stop,
-            self.sampling_points
-        )
-
-    def read_memory(self, slot="A"):
-        """Read the scan saved in a memory slot."""
-        cond_attr = "data_memory_{}_condition".format(slot.lower())
-        data_attr = "data_memory_{}_values".format(slot.lower())
-
-        scan = getattr(self, cond_attr)
+        """Return a numpy array of the current wavelengths of scans.
+
+        The array is cached until the span or sampling points are changed.
+        """
+        if self._wavelengths is None:
+            self._wavelengths = np.linspace(
+                self.wavelength_start,
+                self.wavelength_stop,
+                self.sampling_points
+            )
+        return self._wavelengths
+
+    def read_memory(self, slot="A", binary=True):
+        """Read the scan saved in a memory slot.
+
+        The power levels are transferred in binary (DBA?/DBB?) by default,
+        or as text (DMA?/DMB?) if binary is False.
+        """
+        slot = strict_discrete_set(slot.upper(), ["A", "B"])
+        scan = getattr(self, "data_memory_{}_condition".format(slot.lower()))
         wavelengths = np.linspace(scan[0], scan[1], int(scan[2]))
-        power = np.fromstring(getattr(self, data_attr), sep="\r\n")
+        if binary:
+            power = self._read_binary_memory(slot, len(wavelengths))
+        else:
+            data = getattr(self, "data_memory_{}_values".format(slot.lower()))
+            power = np.array(str(data).split(), dtype=float)
 
         return wavelengths, power
 
+    def _read_binary_memory(self, slot, points):
+        """Read the power levels of a memory slot in binary.
+
+        Raises an InstrumentError if the instrument stops sending before
+        all of the points have arrived.
+        """
+        dtype = np.dtype(self.MEMORY_DTYPE)
+        size = points * dtype.itemsize
+        self.write("DB{}?".format(slot))
+        raw = b""
+        # Bytes matching the termination can end a read early
+        while len(raw) < size:
+            chunk = self.adapter.read_raw()
+            if not chunk:
+                raise InstrumentError(
+                    "{} returned {} of the {} bytes of memory {}".format(
+                        self.name, len(raw), size, slot))
+            raw += chunk
+        return np.frombuffer(raw[:size], dtype=dtype) * self.MEMORY_SCALE
+
+    def is_sweep_done(self):
+        """Return True if the sweep end bits of the ESR2 have been set.
+
+        The ESR2 is cleared by reading it, so the bits are accumulated
+        until the sweep has ended.
+        """
+        esr2 = self.esr2
+        if esr2 > 0:
+            self._sweep_status |= esr2
+        if self._sweep_status & self.SWEEP_END == self.SWEEP_END:
+            self._sweep_status = 0
+            return True
+        return False
+
     def wait(self, n=3, delay=1):
         """Query OPC Command and waits for appropriate response."""
         log.info("Wait for OPC")
@@ -309,29 +367,67 @@ class AnritsuMS9710C(Instrument):
 
         log.debug(res)
 
-    def wait_for_sweep(self, n=20, delay=0.5):
+    def wait_for_sweep(self, n=20, delay=0.5, timeout=None,
+                       should_stop=lambda: False):
         """Wait for a sweep to stop.
 
-        This is performed by checking bit 1 of the ESR2.
+        This is performed by checking the sweep end bits of the ESR2, with
+        a timeout of n*delay seconds unless a timeout is given. Returns
+        False if should_stop stopped the waiting or the sweep timed out.
         """
         log.debug("Waiting for spectrum sweep")
+        if timeout is None:
+            timeout = n * delay
 
-        while(self.esr2 != 3 and n > 0):
-            log.debug("Wait for sweep [{}]".format(n))
-            # log.debug("ESR2: {}".format(esr2))
-            sleep(delay)
-            n -= 1
-
-        if n <= 0:
-            log.warning("Sweep Timeout Occurred ({} s)".format(int(delay * n)))
+        try:
+            return self.wait_for(self.is_sweep_done, timeout=timeout,
+                                 should_stop=should_stop, max_interval=delay)
+        except TimeoutError:
+            log.warning("Sweep Timeout Occurred ({:g} s)".format(timeout))
+            return False
 
     def single_sweep(self, **kwargs):
         """Perform a single sweep and wait for completion."""
         log.debug("Performing a Spectrum Sweep")
         self.clear()
+        self._sweep_status = 0
         self.write('SSI')
         self.wait_for_sweep(**kwargs)
 
+    def stream_sweeps(self, sweeps=None, should_stop=lambda: False,
+                      timeout=60, binary=True):
+        """Run repeated sweeps, yielding a (wavelength, power) tuple of
+        numpy arrays for each sweep.
+
+        The sweeps are read from memory A, and the wavelength array is shared
+        between the sweeps until the span is changed. The repeat sweep is
+        stopped when the generator is closed.
+
+        :param sweeps: Number of sweeps, or None to sweep until should_stop
+        :param should_stop: A function that returns True to stop sweeping
+        :param timeout: Time in seconds to wait for each sweep
+        :param binary: Transfer the power levels in binary
+        """
+        self.clear()
+        self._sweep_status = 0
+        self.write('SRT')
+        try:
+            count = 0
+            while sweeps is None or count < sweeps:
+                if not self.wait_for(self.is_sweep_done, timeout=timeout,
+                                     should_stop=should_stop):
+                    return
+                wavelengths = self.wavelengths
+                if binary:
+                    power = self._read_binary_memory("A", len(wavelengths))
+                else:
+                    power = np.array(str(self.data_memory_a_values).split(),
+                                     dtype=float)
+                yield wavelengths, power
+                count += 1
+        finally:
+            self.write('SST')
+
     def center_at_peak(self, **kwargs):
         """Center the spectrum at the measured peak."""
         self.write("PKC")
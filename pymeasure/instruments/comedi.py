@@ -80,12 +80,26 @@ def writeAO(device, channel, voltage, range=None):
     ao.data_write(converter.from_physical(voltage))
 
 
+def physical_polynomial(converter):
+    """ Returns the coefficients (lowest order first) and the expansion
+    origin of the polynomial that a converter uses to convert raw samples
+    into physical values, or None if the converter does not expose them
+    """
+    try:
+        coefficients = converter.get_to_physical_coefficients()
+        origin = converter.get_to_physical_expansion_origin()
+    except AttributeError:
+        return None
+    return np.asarray(coefficients, dtype=np.float64), float(origin)
+
+
 class SynchronousAI(object):
         
-    def __init__(self, channels, period, samples): 
+    def __init__(self, channels, period, samples, chunk_samples=1024):
         self.channels = channels
         self.samples = samples
         self.period = period
+        self.chunk_samples = chunk_samples
         self.scanPeriod = int(1e9*float(period)/float(samples)) # nano-seconds
         
         self.subdevice = self.channels[0].subdevice
@@ -116,50 +130,90 @@ class SynchronousAI(object):
             rc = self.subdevice.command_test() # Verify command is correct
             if rc == None: break
         
+    def _trigger(self):
+        """ Triggers the scan, which starts on an internal trigger
+        """
+        self.subdevice.device.do_insn(inttrig_insn(self.subdevice))
+
+    def convert(self, raw, converters, polynomials, out):
+        """ Converts the raw samples of shape (scans, channels) into
+        physical values in the out array, evaluating the polynomial of
+        each channel on the whole column at once. Channels without a
+        polynomial are converted by the converter on the column
+        """
+        for i, (converter, polynomial) in enumerate(
+                zip(converters, polynomials)):
+            if polynomial is None:
+                out[:, i] = converter.to_physical(raw[:, i])
+            else:
+                coefficients, origin = polynomial
+                out[:, i] = np.polynomial.polynomial.polyval(
+                    raw[:, i].astype(np.float64) - origin, coefficients)
+
+    def emit_block(self, block):
+        """ Passes a converted block of shape (scans, channels) to emit_data
+        one scan at a time, as before the samples were read in chunks.
+        Subclasses can reimplement this to handle the whole block at once
+        """
+        for scan in block:
+            self.emit_data(scan)
+
     def measure(self, hasAborted=lambda:False):
-        """ Initiates the scan after first checking the command
-        and does not block, returns the starting timestamp
+        """ Initiates the scan after first checking the command, and reads
+        the samples into self.data as they arrive. The samples are read in
+        chunks of up to chunk_samples scans into a preallocated buffer,
+        and each chunk is converted and passed to emit_block as an array
+        of shape (scans, channels)
         """
         self._verifyCommand()
         sleep(0.01)
         self.subdevice.command()
         
         length = len(self.channels)
-        dtype = self.subdevice.get_dtype()
+        dtype = np.dtype(self.subdevice.get_dtype())
         converters = [c.get_converter() for c in self.channels]
+        # The conversion polynomials are only looked up once
+        polynomials = [physical_polynomial(c) for c in converters]
 
         self.data = np.zeros((self.samples, length), dtype=np.float32)
 
         # Trigger AI
-        self.subdevice.device.do_insn(inttrig_insn(self.subdevice))
+        self._trigger()
                 
         # Measurement loop
         count = 0
-        size = int(self.data.itemsize/2)*length
-        previous_bin_slice = b''
+        scan_size = dtype.itemsize*length
+        buffer = bytearray(self.chunk_samples*scan_size)
+        view = memoryview(buffer)
+        filled = 0  # Bytes in the buffer, including a partial scan
+        file = self.subdevice.device.file
         
         while not hasAborted() and self.samples > count:
-            bin_slice = previous_bin_slice
-            while len(bin_slice) < size:
-                bin_slice += self.subdevice.device.file.read(size)
-            previous_bin_slice = bin_slice[size:]
-            bin_slice = bin_slice[:size]
-            slice = np.fromstring(
-                bin_slice,
-                dtype=dtype,
-                count=length
-            )
-
-            if len(slice) != length: # Reading finished
+            end = min(len(buffer), (self.samples - count)*scan_size)
+            read = file.readinto(view[filled:end])
+            if read is None:  # No data available yet
+                sleep(0.001)
+                continue
+            if read == 0:  # Reading finished
                 break
+            filled += read
+            scans = filled // scan_size
+            if scans == 0:
+                continue
+
+            raw = np.frombuffer(buffer, dtype=dtype, count=scans*length)
+            block = self.data[count:count + scans]
+            self.convert(raw.reshape(scans, length), converters,
+                         polynomials, block)
+
+            # Keep the partial scan for the next read
+            used = scans*scan_size
+            buffer[:filled - used] = bytes(view[used:filled])
+            filled -= used
+            count += scans
 
-            # Convert to physical values
-            for i, c in enumerate(converters):
-                self.data[count,i] = c.to_physical(slice[i])
-            
             self.emit_progress(100.*count/self.samples)
-            self.emit_data(self.data[count])
-            count += 1
+            self.emit_block(block)
             
         # Cancel measurement if it is still running (abort event)
         if self.subdevice.get_flags().running:             
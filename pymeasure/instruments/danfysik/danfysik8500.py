@@ -23,11 +23,13 @@
 #
 
 from pymeasure.instruments import Instrument, RangeException
+from pymeasure.instruments.scan import continuous_scan
+from pymeasure.instruments.validators import strict_range_array
 from .adapters import DanfysikAdapter
 
-from time import sleep
 import numpy as np
 import re
+from time import time
 
 
 class Danfysik8500(Instrument):
@@ -164,18 +166,24 @@ class Danfysik8500(Instrument):
         """
         return float(self.ask("R3"))
 
-    def wait_for_current(self, has_aborted=lambda: False, delay=0.01):
+    def wait_for_current(self, has_aborted=lambda: False, delay=0.01,
+                         timeout=None):
         """ Blocks the process until the current has stabilized. A
         provided function :code:`has_aborted` can be supplied, which
         is checked after each delay time (in seconds) in addition to the
         stability check. This allows an abort feature to be integrated.
 
         :param has_aborted: A function that returns True if the process should stop waiting
-        :param delay: The delay time in seconds between each check for stability
+        :param delay: The initial delay time in seconds between each check for stability
+        :param timeout: A time in seconds after which a TimeoutError is raised,
+                        or None to wait indefinitely
         """
-        self.wait_for_ready(has_aborted, delay)
-        while not has_aborted() and not self.is_current_stable():
-            sleep(delay)
+        # Both waits share one deadline, so that the timeout is not doubled
+        deadline = None if timeout is None else time() + timeout
+        if self.wait_for_ready(has_aborted, delay, timeout):
+            remaining = None if deadline is None else max(deadline - time(), 0)
+            self.wait_for(self.is_current_stable, timeout=remaining,
+                          should_stop=has_aborted, interval=delay)
 
     def is_current_stable(self):
         """ Returns True if the current is within 0.02 A of the
@@ -188,17 +196,21 @@ class Danfysik8500(Instrument):
         """
         return self.status_hex & 0b10 == 0
 
-    def wait_for_ready(self, has_aborted=lambda: False, delay=0.01):
+    def wait_for_ready(self, has_aborted=lambda: False, delay=0.01,
+                       timeout=None):
         """ Blocks the process until the instrument is ready. A
         provided function :code:`has_aborted` can be supplied, which
         is checked after each delay time (in seconds) in addition to the
         readiness check. This allows an abort feature to be integrated.
+        Returns False if :code:`has_aborted` stopped the waiting.
 
         :param has_aborted: A function that returns True if the process should stop waiting
-        :param delay: The delay time in seconds between each check for readiness
+        :param delay: The initial delay time in seconds between each check for readiness
+        :param timeout: A time in seconds after which a TimeoutError is raised,
+                        or None to wait indefinitely
         """
-        while not has_aborted() and not self.is_ready():
-            sleep(delay)
+        return self.wait_for(self.is_ready, timeout=timeout,
+                             should_stop=has_aborted, interval=delay)
 
     @property
     def status(self):
@@ -276,10 +288,11 @@ class Danfysik8500(Instrument):
         :param delay_time: A delay time in seconds 
         """
         initial_current = self.current
+        steps = np.linspace(initial_current, current, num=points)
+        steps = strict_range_array(steps, [-160, 160])
         self.clear_ramp_set()
         self.set_ramp_delay(delay_time)
-        steps = np.linspace(initial_current, current, num=points)
-        cmds = ["R %.6f" % (step/160.) for step in steps]
+        cmds = ["R %.6f" % step for step in (steps/160.).tolist()]
         self.write("\r".join(cmds))
 
     def ramp_to_current(self, current, points, delay_time=1):
@@ -288,27 +301,71 @@ class Danfysik8500(Instrument):
         self.set_ramp_to_current(current, points, delay_time)
         self.start_ramp()
 
+    def scan_to_current(self, current, points, delay_time, measurables,
+                        interval=0, should_stop=lambda: False, timeout=None,
+                        callback=lambda record: None):
+        """ Executes :meth:`~.ramp_to_current` while sampling the measurables
+        together with the actual current, until the current is stable at
+        the final current (see :func:`~pymeasure.instruments.scan.continuous_scan`).
+        The ramp rate is the change in current divided by the number of
+        points and the delay time. The ramp is stopped if the
+        :code:`should_stop` function returns True.
+
+        :param current: The final current in Amps
+        :param points: The number of linear points to traverse
+        :param delay_time: A delay time in seconds between the points
+        :param measurables: A dictionary of names and functions that return the
+                            measured values
+        :param interval: A minimum time in seconds between samples
+        :param should_stop: A function that returns True to stop the scan early
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param callback: A function that is called with each sample as a dictionary
+        :returns: A structured numpy array with the fields 'time', 'position'
+                  (the current in Amps), and the names of the measurables
+        """
+        self.ramp_to_current(current, points, delay_time)
+
+        def is_done():
+            return (abs(self.current_setpoint - current) <= 0.02 and
+                    self.is_current_stable())
+
+        records = continuous_scan(
+            lambda: self.current, measurables, is_done,
+            interval, should_stop, timeout, callback
+        )
+        if should_stop():
+            self.stop_ramp()
+        return records
+
     # self.setSequence(0, [0, 10], [0.01])
     def set_sequence(self, stack, currents, times, multiplier=999999):
         """ Sets up an arbitrary ramp profile with a list of currents (Amps)
         and a list of interval times (seconds) on the specified stack number
         (0-15)
+
+        The currents and times are validated as whole arrays before the
+        sequence is cleared, so an invalid profile leaves the stack untouched.
         """
-        self.clear_sequence(stack)
-        if min(times) >= 1 and max(times) <= 65535:
-            self.write("SLOW %i" % stack)
-        elif min(times) >= 0.1 and max(times) <= 6553.5:
-            self.write("FAST %i" % stack)
-            times = [0.1*x for x in times]
+        currents = strict_range_array(currents, [-160, 160])
+        times = np.asarray(times, dtype=float)
+        if len(currents) < len(times) + 1:
+            raise ValueError("Danfysik 8500 ramp sequence requires one more "
+                             "current than interval times")
+        if times.min() >= 1 and times.max() <= 65535:
+            mode = "SLOW"
+        elif times.min() >= 0.1 and times.max() <= 6553.5:
+            mode = "FAST"
+            times = 0.1*times
         else:
             raise RangeException("Timing for Danfysik 8500 ramp sequence is"
                                  " out of range")
-        for i in range(len(times)):
-            self.write("WSA %i,%i,%i,%i" % (
-                stack,
-                int(6250*abs(currents[i])),
-                int(6250*abs(currents[i+1])), times[i])
-            )
+        self.clear_sequence(stack)
+        self.write("%s %i" % (mode, stack))
+        steps = (6250*np.abs(currents)).astype(int).tolist()
+        cmds = ["WSA %i,%i,%i,%i" % (stack, start, stop, time)
+                for start, stop, time in zip(steps[:-1], steps[1:],
+                                             times.tolist())]
+        self.write("\r".join(cmds))
         self.write("MULT %i,%i" % (stack, multiplier))
 
     def clear_sequence(self, stack):
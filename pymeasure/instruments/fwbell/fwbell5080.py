@@ -24,7 +24,7 @@
 
 from pymeasure.instruments import Instrument, RangeException
 from pymeasure.instruments.validators import truncated_discrete_set, strict_discrete_set
-from pymeasure.adapters import SerialAdapter
+from pymeasure.adapters.serial import SerialAdapter
 from numpy import array, float64
 
 
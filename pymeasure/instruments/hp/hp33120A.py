@@ -26,16 +26,37 @@ import logging
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-from pymeasure.instruments import Instrument
-from pymeasure.instruments.validators import strict_discrete_set
+import hashlib
+import re
+
+import numpy as np
+
+from pymeasure.instruments import Instrument, InstrumentError
+from pymeasure.instruments.validators import (strict_discrete_set,
+                                              strict_range_array)
 
 
 class HP33120A(Instrument):
     """ Represents the Hewlett Packard 33120A Arbitrary Waveform
     Generator and provides a high-level interface for interacting
     with the instrument.
+
+    .. code-block:: python
+
+        generator = HP33120A("GPIB::10")
+
+        t = np.linspace(0, 1, 4000, endpoint=False)
+        generator.upload_waveform(np.sinc(20*(t - 0.5)), 'PULSE')
+        generator.frequency = 1e3           # Sets the waveform repetition to 1 kHz
+        generator.amplitude = 2             # Sets the amplitude to 2 Vpp
+
     """
 
+    WAVEFORM_POINTS = [8, 16000]
+    DAC_RANGE = 2047
+    BUILTIN_WAVEFORMS = ['SINC', 'NEG_RAMP', 'EXP_RISE', 'EXP_FALL',
+                         'CARDIAC', 'VOLATILE']
+
     SHAPES = {
         'sinusoid':'SIN', 'square':'SQU', 'triangle':'TRI', 
         'ramp':'RAMP', 'noise':'NOIS', 'dc':'DC', 'user':'USER'
@@ -112,7 +133,83 @@ class HP33120A(Instrument):
             **kwargs
         )
         self.amplitude_units = 'Vpp'
+        self._waveforms = {}
 
     def beep(self):
         """ Causes a system beep. """
         self.write("SYST:BEEP")
+
+    def upload_waveform(self, waveform, name, normalize=True, timeout=10):
+        """ Uploads an arbitrary waveform as 12-bit DAC values in a single
+        binary transfer (:code:`DATA:DAC VOLATILE`), copies it to the
+        non-volatile memory under a name, and outputs it. The content of
+        the uploaded waveforms is remembered, so that uploading the same
+        points again, even under another name, only selects the waveform
+        already in memory.
+
+        :param waveform: An array of 8 to 16000 points
+        :param name: A name of up to 8 letters, digits, or underscores,
+                     starting with a letter
+        :param normalize: Scales the waveform to a peak of 1 if True, otherwise
+                          the points must be between -1 and 1
+        :param timeout: A time in seconds to wait for the copy to complete
+        :raises: ValueError if the waveform or name are not valid
+        :raises: :class:`~pymeasure.errors.InstrumentError` if the instrument
+                 rejects the waveform, such as when its memory is full
+        """
+        name = name.upper()
+        if (not re.match(r"^[A-Z][A-Z0-9_]{0,7}$", name) or
+                name in self.BUILTIN_WAVEFORMS):
+            raise ValueError("Waveform name '%s' is not valid" % name)
+        waveform = np.asarray(waveform, dtype=float)
+        if not (waveform.ndim == 1 and
+                min(self.WAVEFORM_POINTS) <= len(waveform) <= max(self.WAVEFORM_POINTS)):
+            raise ValueError("HP 33120A waveforms require between %d and %d "
+                             "points" % tuple(self.WAVEFORM_POINTS))
+        if normalize:
+            peak = np.abs(waveform).max()
+            if peak > 0:
+                waveform = waveform / peak
+        waveform = strict_range_array(waveform, [-1, 1])
+        dac = np.rint(waveform * self.DAC_RANGE).astype('>i2')
+        digest = hashlib.sha1(dac.tobytes()).hexdigest()
+        if digest not in self._waveforms:
+            self._forget_waveform(name)
+            self.write("FORM:BORD NORM")
+            self.write_block("DATA:DAC VOLATILE, ", dac, '>i2')
+            self.write("DATA:COPY %s, VOLATILE" % name)
+            self._ask_opc(timeout)
+            errors = self.sync_errors()
+            if errors:
+                raise InstrumentError("{} could not upload waveform {}: {}".format(
+                    self.name, name, "; ".join(message for _, message, _ in errors)))
+            self._waveforms[digest] = name
+        self.select_waveform(self._waveforms[digest])
+
+    def _forget_waveform(self, name):
+        """ Removes a waveform that is overwritten or deleted from the
+        remembered content of the uploaded waveforms.
+        """
+        for digest in [d for d, n in self._waveforms.items() if n == name]:
+            del self._waveforms[digest]
+
+    def select_waveform(self, name):
+        """ Outputs a built-in or uploaded arbitrary waveform.
+
+        :param name: The name of the waveform
+        """
+        self.write("FUNC:USER %s;:FUNC:SHAP USER" % name.upper())
+
+    def delete_waveform(self, name):
+        """ Deletes an uploaded waveform from the non-volatile memory.
+
+        :param name: The name of the waveform
+        """
+        name = name.upper()
+        self._forget_waveform(name)
+        self.write("DATA:DEL %s" % name)
+
+    @property
+    def waveforms(self):
+        """ Reads a list of the names of the waveforms in memory. """
+        return [n.strip('" ') for n in self.ask("DATA:CAT?").split(',')]
@@ -24,16 +24,34 @@
 
 import logging
 import re
+from collections import deque
+from contextlib import contextmanager
+from time import sleep, time
 
 import numpy as np
 
 from pymeasure.adapters import FakeAdapter
-from pymeasure.adapters.visa import VISAAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+def _format_array(array):
+    """ Returns a comma separated string of the values in a numpy array,
+    with full precision.
+    """
+    return ",".join(repr(v) for v in array.ravel().tolist())
+
+
+def _header(command):
+    """ Returns the header of a SCPI command, such as :code:`:SOUR:VOLT` for
+    :code:`:SOUR:VOLT 10`.
+    """
+    header = command.strip().split(" ", 1)[0].rstrip("?")
+    # Very short headers would match any error message
+    return header if len(header) > 2 else "\0"
+
+
 class Instrument(object):
     """ This provides the base class for all Instruments, which is
     independent of the particular Adapter used to connect for
@@ -43,12 +61,23 @@ class Instrument(object):
     :param adapter: An :class:`Adapter<pymeasure.adapters.Adapter>` object
     :param name: A string name
     :param includeSCPI: A boolean, which toggles the inclusion of standard SCPI commands
+
+    :ivar history: The most recent commands sent through the instrument,
+                   which are used to attribute errors found by :meth:`.sync_errors`
     """
 
+    # Number of commands kept in the history
+    HISTORY_LENGTH = 100
+    # Cached attributes that are reset to None when a command changes them,
+    # as a dictionary of attribute names to tuples of command headers, which
+    # match a written command that contains one of them as a header node
+    CACHE_COMMANDS = {}
+
     # noinspection PyPep8Naming
     def __init__(self, adapter, name, includeSCPI=True, **kwargs):
         try:
             if isinstance(adapter, (int, str)):
+                from pymeasure.adapters.visa import VISAAdapter
                 adapter = VISAAdapter(adapter, **kwargs)
         except ImportError:
             raise Exception("Invalid Adapter provided for Instrument since "
@@ -57,6 +86,9 @@ class Instrument(object):
         self.name = name
         self.SCPI = includeSCPI
         self.adapter = adapter
+        self.history = deque(maxlen=self.HISTORY_LENGTH)
+        self._unchecked_commands = 0
+        self._deferred_errors = None
 
         class Object(object):
             pass
@@ -89,6 +121,7 @@ class Instrument(object):
 
         :param command: command string to be sent to the instrument
         """
+        self._record(command)
         return self.adapter.ask(command)
 
     def write(self, command):
@@ -96,8 +129,31 @@ class Instrument(object):
 
         :param command: command string to be sent to the instrument
         """
+        self._record(command)
+        if self.CACHE_COMMANDS:
+            self._clear_caches(command)
         self.adapter.write(command)
 
+    def _clear_caches(self, command):
+        """ Resets the attributes of :attr:`CACHE_COMMANDS` to None if the
+        command contains one of their headers.
+        """
+        command = re.sub(r";\s*:?", ";:", ":" + command.upper().lstrip(" :"))
+        for name, headers in self.CACHE_COMMANDS.items():
+            if any(":" + header in command for header in headers):
+                setattr(self, name, None)
+
+    def write_block(self, command, values, dtype=np.float32):
+        """ Writes the command followed by an IEEE 488.2 binary block of
+        values to the instrument through the adapter.
+
+        :param command: command string, which is followed directly by the block
+        :param values: An array of values
+        :param dtype: The NumPy data type to send the values as, including the byte order
+        """
+        self._record(command)
+        self.adapter.write_block(command, values, dtype)
+
     def read(self):
         """ Reads from the instrument through the adapter and returns the
         response.
@@ -108,11 +164,28 @@ class Instrument(object):
         """ Reads a set of values from the instrument through the adapter,
         passing on any key-word arguments.
         """
+        self._record(command)
         return self.adapter.values(command, **kwargs)
 
     def binary_values(self, command, header_bytes=0, dtype=np.float32):
+        self._record(command)
         return self.adapter.binary_values(command, header_bytes, dtype)
 
+    def binary_block(self, command, dtype=np.float32):
+        """ Returns a numpy array from a query that responds with an
+        IEEE 488.2 binary block, through the adapter.
+
+        :param command: command string to be sent to the instrument
+        :param dtype: The NumPy data type of the values, including the byte order
+        """
+        self._record(command)
+        return self.adapter.binary_block(command, dtype)
+
+    def _record(self, command):
+        """ Adds a command to the history, for the attribution of errors. """
+        self.history.append(command)
+        self._unchecked_commands += 1
+
     @staticmethod
     def control(get_command, set_command, docs,
                 validator=lambda v, vs: v, values=(), map_values=False,
@@ -138,6 +211,11 @@ class Instrument(object):
                             before value mapping, returning the processed value
         :param check_set_errors: Toggles checking errors after setting
         :param check_get_errors: Toggles checking errors after getting
+
+        Array-valued properties can use the array validators, such as
+        :func:`~pymeasure.instruments.validators.strict_range_array`. A numpy
+        array that reaches the command is written as comma separated values
+        into a :code:`%s` format specifier.
         """
 
         if map_values and isinstance(values, dict):
@@ -147,7 +225,7 @@ class Instrument(object):
         def fget(self):
             vals = self.values(get_command, **kwargs)
             if check_get_errors:
-                self.check_errors()
+                self._property_errors()
             if len(vals) == 1:
                 value = get_process(vals[0])
                 if not map_values:
@@ -178,9 +256,11 @@ class Instrument(object):
                     'Values of type `{}` are not allowed '
                     'for Instrument.control'.format(type(values))
                 )
+            if isinstance(value, np.ndarray):
+                value = _format_array(value)
             self.write(set_command % value)
             if check_set_errors:
-                self.check_errors()
+                self._property_errors()
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
@@ -215,7 +295,7 @@ class Instrument(object):
         def fget(self):
             vals = self.values(command_process(get_command), **kwargs)
             if check_get_errors:
-                self.check_errors()
+                self._property_errors()
             if len(vals) == 1:
                 value = get_process(vals[0])
                 if not map_values:
@@ -280,9 +360,11 @@ class Instrument(object):
                     'Values of type `{}` are not allowed '
                     'for Instrument.control'.format(type(values))
                 )
+            if isinstance(value, np.ndarray):
+                value = _format_array(value)
             self.write(set_command % value)
             if check_set_errors:
-                self.check_errors()
+                self._property_errors()
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
@@ -310,6 +392,178 @@ class Instrument(object):
         """
         pass
 
+    def read_errors(self):
+        """ Returns a list of (code, message) tuples for the errors in the
+        error queue of the instrument, which is emptied. For SCPI
+        instruments the error queue is only read if the error available
+        bit of the status byte is set. Subclasses can reimplement this
+        method to drain the queue more efficiently.
+        """
+        if not self.SCPI:
+            return []
+        errors = []
+        if int(self.ask("*STB?")) & 0b100:
+            for _ in range(self.HISTORY_LENGTH):
+                err = self.values(":SYST:ERR?")
+                code = int(err[0])
+                if code == 0:
+                    break
+                message = ",".join(str(e) for e in err[1:]).strip('"')
+                errors.append((code, message))
+        return errors
+
+    @contextmanager
+    def defer_errors(self, every=None):
+        """ Returns a context manager in which properties that check for
+        errors after each command (:code:`check_set_errors` and
+        :code:`check_get_errors`) no longer do so. Instead the errors are
+        read once by :meth:`.sync_errors`, at the end of the block and
+        after every :code:`every` commands if it is given.
+
+        .. code-block:: python
+
+            with instr.defer_errors():
+                for voltage in voltages:
+                    instr.source_voltage = voltage
+                    data.append(instr.current)
+                    instr.sync_errors()  # Check once per step
+
+        :param every: Number of commands after which the errors are read,
+                      or None to only read them at sync points
+        """
+        self._deferred_errors = every or 0
+        try:
+            yield self
+        finally:
+            self._deferred_errors = None
+            self.sync_errors()
+
+    def sync_errors(self):
+        """ Reads the errors of the instrument through :meth:`.read_errors`
+        and logs each of them, together with the command that likely caused
+        it. This is the command whose header appears in the error message,
+        and otherwise the commands sent since the last sync point.
+
+        :returns: A list of (code, message, commands) tuples, where commands
+                  are those the error is attributed to
+        """
+        count = min(self._unchecked_commands, len(self.history))
+        commands = list(self.history)[len(self.history) - count:]
+        errors = self.read_errors()
+        self._unchecked_commands = 0
+        attributed = []
+        for code, message in errors:
+            culprits = [c for c in commands
+                        if _header(c).lower() in message.lower()]
+            culprits = culprits[-1:] or commands
+            log.error("%s reported error %d, %s, caused by %s" % (
+                self.name, code, message,
+                " or ".join(repr(c) for c in culprits[-5:]) or "unknown command"))
+            attributed.append((code, message, culprits))
+        return attributed
+
+    def _property_errors(self):
+        """ Checks for errors after a property command, unless the errors
+        are deferred by :meth:`.defer_errors`.
+        """
+        if self._deferred_errors is None:
+            self.check_errors()
+        elif self._deferred_errors and \
+                self._unchecked_commands >= self._deferred_errors:
+            self.sync_errors()
+
+    def wait_for(self, condition=None, timeout=60, should_stop=lambda: False,
+                 srq=False, opc=False, interval=0.01, max_interval=0.5):
+        """ Blocks the program until the :code:`condition` function returns
+        True. If :code:`srq` is True and the adapter supports service
+        requests, the program waits for a service request before checking
+        the condition. Otherwise, if :code:`opc` is True and the instrument
+        supports SCPI, it waits on a :code:`*OPC?` query with a long timeout.
+        Remaining waiting is done by polling the condition, starting at
+        :code:`interval` and backing off to :code:`max_interval` seconds.
+
+        .. code-block:: python
+
+            instr.wait_for(instr.is_buffer_full, srq=True,
+                           should_stop=procedure.should_stop)
+
+        :param condition: A function that returns True when waiting is over,
+                          or None to only wait for the service request or
+                          operation complete
+        :param timeout: A time in seconds after which a TimeoutError is raised,
+                        or None to wait indefinitely
+        :param should_stop: A function that returns True when this function
+                            should return early
+        :param srq: Toggles waiting for a service request from the instrument
+        :param opc: Toggles waiting for the operation complete (:code:`*OPC?`)
+        :param interval: The initial time in seconds between polls
+        :param max_interval: The maximum time in seconds between polls
+        :returns: True if the condition is met, False if :code:`should_stop`
+                  stopped the waiting
+        :raises: TimeoutError if the timeout is reached
+        """
+        deadline = None if timeout is None else time() + timeout
+
+        def remaining():
+            return None if deadline is None else deadline - time()
+
+        def check_timeout():
+            if deadline is not None and time() > deadline:
+                raise TimeoutError(
+                    "Timed out after %g seconds waiting for %s" % (
+                        timeout, self.name))
+
+        if srq and hasattr(self.adapter, 'wait_for_srq'):
+            while True:
+                wait = max_interval
+                if deadline is not None:
+                    wait = max(0, min(wait, remaining()))
+                try:
+                    self.adapter.wait_for_srq(timeout=wait)
+                    break
+                except TimeoutError:
+                    pass
+                except (AttributeError, NotImplementedError):
+                    log.debug("Service requests are not supported by %s, "
+                              "polling instead" % self.adapter)
+                    break
+                if should_stop():
+                    return False
+                check_timeout()
+        elif opc and self.SCPI:
+            self._ask_opc(remaining())
+            check_timeout()
+
+        delay = interval
+        while condition is not None and not condition():
+            if should_stop():
+                return False
+            check_timeout()
+            if deadline is not None:
+                delay = max(0, min(delay, remaining()))
+            sleep(delay)
+            delay = min(delay*2, max_interval)
+        return True
+
+    def _ask_opc(self, timeout, command="*OPC?"):
+        """ Asks :code:`*OPC?`, or another query that responds once the
+        operations are complete, extending the timeout of VISA connections
+        so that the query can block until all operations are complete.
+        """
+        try:
+            from pymeasure.adapters.visa import VISAAdapter
+        except ImportError:
+            return self.ask(command)
+        if not isinstance(self.adapter, VISAAdapter):
+            return self.ask(command)
+        connection = self.adapter.connection
+        visa_timeout = connection.timeout
+        connection.timeout = None if timeout is None else 1e3*max(timeout, 0)
+        try:
+            return self.ask(command)
+        finally:
+            connection.timeout = visa_timeout
+
 
 class FakeInstrument(Instrument):
     """ Provides a fake implementation of the Instrument class
@@ -28,15 +28,37 @@ log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range
-from pymeasure.adapters import PrologixAdapter
 
 import numpy as np
-from time import sleep, time
 
 
 class KeithleyBuffer(object):
     """ Implements the basic buffering capability found in
-    many Keithley instruments. """
+    many Keithley instruments.
+
+    The buffer can be read as ASCII through :attr:`~.buffer_data`, or in the
+    binary format (:code:`:FORM:DATA SREAL`) through :meth:`~.buffer_records`,
+    which returns a structured numpy array with a field for each of the
+    :attr:`BUFFER_ELEMENTS`. The byte order of the binary transfer is set by
+    :attr:`buffer_byte_order`, which is either :code:`'little'` or :code:`'big'`.
+    Instruments set the :attr:`BUFFER_ELEMENTS` and :attr:`BUFFER_STATISTICS`
+    of their readings. Streaming with :meth:`~.stream_buffer` requires the instrument to provide
+    a :code:`buffer_count` property, with the number of stored readings.
+    """
+
+    # Fields of the buffer records and their :FORM:ELEM names, which are
+    # set by each instrument
+    BUFFER_ELEMENTS = []
+    # Statistics calculated by buffer_statistics, as in the CALC3 subsystem
+    BUFFER_STATISTICS = []
+
+    buffer_byte_order = 'little'
+
+    # Query for a range of readings by their start index and count, such as
+    # :code:`:TRAC:DATA:SEL? %d,%d` on instruments that support it, which is
+    # used by stream_buffer to read only the new readings, or None to read
+    # the whole buffer instead
+    BUFFER_RANGE_QUERY = None
 
     buffer_points = Instrument.control(
         ":TRAC:POIN?", ":TRAC:POIN %d",
@@ -74,21 +96,18 @@ class KeithleyBuffer(object):
                         timeout=60, interval=0.1):
         """ Blocks the program, waiting for a full buffer. This function 
         returns early if the :code:`should_stop` function returns True or
-        the timeout is reached before the buffer is full.
+        the timeout is reached before the buffer is full. The buffer full
+        service request enabled by :meth:`~.config_buffer` is used where
+        the adapter supports it. Returns False if :code:`should_stop`
+        stopped the waiting.
 
         :param should_stop: A function that returns True when this function should return early
-        :param timeout: A time in seconds after which this function should return early
-        :param interval: A time in seconds for how often to check if the buffer is full
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param interval: The maximum time in seconds between checks of the buffer
         """
-        # TODO: Use SRQ initially instead of constant polling
-        #self.adapter.wait_for_srq()
-        t = time()
-        while not self.is_buffer_full():
-            sleep(interval)
-            if should_stop():
-                return
-            if (time()-t)>10:
-                raise Exception("Timed out waiting for Keithley buffer to fill.")
+        return self.wait_for(self.is_buffer_full, timeout=timeout,
+                             should_stop=should_stop, srq=True,
+                             max_interval=interval)
 
     @property
     def buffer_data(self):
@@ -96,6 +115,121 @@ class KeithleyBuffer(object):
         self.write(":FORM:DATA ASCII")
         return np.array(self.values(":TRAC:DATA?"), dtype=np.float64)
 
+    def buffer_records(self, start=0, count=None):
+        """ Returns the readings in the buffer as a structured numpy array,
+        with the fields given by :attr:`BUFFER_ELEMENTS`, from a single binary
+        transfer. The data format and elements are restored afterwards, so
+        that other measurements are still read as ASCII.
+
+        .. code-block:: python
+
+            records = instr.buffer_records()
+            records['voltage']      # numpy array of the voltages
+
+        :param start: The index of the first reading, for a transfer of
+                      :code:`count` readings with :attr:`BUFFER_RANGE_QUERY`
+        :param count: The number of readings, or None for the whole buffer
+        """
+        if count is None:
+            query = ":TRAC:DATA?"
+        else:
+            query = self.BUFFER_RANGE_QUERY % (start, count)
+        names = [name for name, _ in self.BUFFER_ELEMENTS]
+        elements = ",".join(element for _, element in self.BUFFER_ELEMENTS)
+        if self.buffer_byte_order == 'little':
+            dtype, byte_order = np.dtype('<f4'), 'SWAP'
+        elif self.buffer_byte_order == 'big':
+            dtype, byte_order = np.dtype('>f4'), 'NORM'
+        else:
+            raise ValueError("Invalid buffer byte order '%s', which should "
+                             "be 'little' or 'big'" % self.buffer_byte_order)
+        previous = self.ask(":FORM:ELEM?").strip()
+        self.write(":FORM:ELEM %s;:FORM:DATA SREAL;:FORM:BORD %s" % (
+            elements, byte_order))
+        try:
+            data = self.binary_block(query, dtype)
+        finally:
+            self.write(":FORM:DATA ASC;:FORM:ELEM %s" % previous)
+        data = data[:len(data) - len(data) % len(names)]
+        return data.view(np.dtype([(name, dtype) for name in names]))
+
+    def stream_buffer(self, should_stop=lambda: False, timeout=60,
+                      interval=0.05):
+        """ Returns a generator that yields structured numpy arrays of the
+        readings added to the buffer since the previous yield, as the buffer
+        fills. The generator stops once :attr:`~.buffer_points` readings are
+        yielded, or :code:`should_stop` returns True. Only the new readings
+        are transferred, unless :attr:`BUFFER_RANGE_QUERY` is None.
+
+        .. code-block:: python
+
+            instr.start_buffer()
+            for records in instr.stream_buffer(procedure.should_stop):
+                procedure.emit_block(records)
+
+        :param should_stop: A function that returns True when streaming should stop
+        :param timeout: A time in seconds without new readings after which a
+                        TimeoutError is raised
+        :param interval: The maximum time in seconds between checks of the buffer
+        """
+        points = self.buffer_points
+        index = 0
+        while index < points:
+            if not self.wait_for(lambda: self.buffer_count > index,
+                                 timeout=timeout, should_stop=should_stop,
+                                 max_interval=interval):
+                return
+            if self.BUFFER_RANGE_QUERY is None:
+                records = self.buffer_records()[index:]
+            else:
+                count = min(self.buffer_count, points) - index
+                records = self.buffer_records(index, count)
+            if len(records):
+                yield records
+                index += len(records)
+
+    def buffer_statistics(self, records=None):
+        """ Returns a dictionary of the mean, maximum, minimum and standard
+        deviation of the :attr:`BUFFER_STATISTICS` fields, which are
+        calculated from a single transfer of the buffer, instead of querying
+        each statistic from the instrument. The keys are the names of the
+        equivalent properties, such as :code:`'mean_voltage'`.
+
+        :param records: Records from :meth:`~.buffer_records`, which are read
+                        from the buffer if not supplied
+        """
+        if records is None:
+            records = self.buffer_records()
+        statistics = {}
+        for name in self.BUFFER_STATISTICS:
+            values = records[name].astype(np.float64)
+            statistics['mean_' + name] = values.mean()
+            statistics['max_' + name] = values.max()
+            statistics['min_' + name] = values.min()
+            statistics['std_' + name] = values.std(ddof=1)
+        return statistics
+
+    def arm_on_external(self, points, line=1):
+        """ Configures the buffer for a number of points, each taken on an
+        external trigger (see :meth:`trigger_on_external`), and starts the
+        buffer, so that the instrument waits for the triggers. The readings
+        are read afterwards with :meth:`~.triggered_records`. This is used by
+        the :class:`~pymeasure.instruments.trigger.TriggerCoordinator`.
+
+        :param points: The number of points in the buffer
+        :param line: The trigger line of the external trigger
+        """
+        self.config_buffer(points)
+        self.trigger_on_external(line)
+        self.start_buffer()
+
+    def triggered_records(self):
+        """ Returns the readings taken on the external triggers armed by
+        :meth:`~.arm_on_external`, as a structured numpy array from
+        :meth:`~.buffer_records`.
+        """
+        return self.buffer_records()
+
     def start_buffer(self):
         """ Starts the buffer. """
         self.write(":INIT")
@@ -108,7 +242,11 @@ class KeithleyBuffer(object):
         """ Aborts the buffering measurement, by stopping the measurement
         arming and triggering sequence. If possible, a Selected Device 
         Clear (SDC) is used. """
-        if type(self.adapter) is PrologixAdapter:
+        try:
+            from pymeasure.adapters.prologix import PrologixAdapter
+        except ImportError:
+            PrologixAdapter = None
+        if PrologixAdapter is not None and type(self.adapter) is PrologixAdapter:
             self.write("++clr")
         else:
             self.write(":ABOR")
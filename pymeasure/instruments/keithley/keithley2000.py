@@ -29,9 +29,8 @@ log.addHandler(logging.NullHandler())
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import (
     truncated_range, truncated_discrete_set,
-    strict_discrete_set
+    strict_discrete_set, strict_range
 )
-from pymeasure.adapters import VISAAdapter
 from .buffer import KeithleyBuffer
 
 
@@ -54,6 +53,20 @@ class Keithley2000(Instrument, KeithleyBuffer):
         'temperature':'TEMP', 'diode':'DIOD',
         'continuity':'CONT'
     }
+    # Modes in which the integration period is set by the NPLC
+    NPLC_MODES = [
+        'current', 'current ac', 'voltage', 'voltage ac',
+        'resistance', 'resistance 4W', 'temperature'
+    ]
+
+    # Fields of the buffer records, with the timestamp of each reading
+    BUFFER_ELEMENTS = [
+        ('reading', 'READ'),
+        ('time', 'TST'),
+    ]
+    BUFFER_STATISTICS = ['reading']
+    # Number of readings that fill the memory of the buffer
+    BUFFER_CAPACITY = 1024
 
     mode = Instrument.control(
         ":CONF?", ":CONF:%s",
@@ -420,11 +433,48 @@ class Keithley2000(Instrument, KeithleyBuffer):
         values=[0, 999999.999]
     )
 
+    sample_count = Instrument.control(
+        ":SAMP:COUN?", ":SAMP:COUN %d",
+        """ An integer property that controls the number of readings taken
+        for each trigger, which can take values from 1 to 1024. """,
+        validator=truncated_range,
+        values=[1, 1024],
+        cast=int
+    )
+
+    ##########
+    # System #
+    ##########
+
+    autozero_enabled = Instrument.control(
+        ":SYST:AZER:STAT?", ":SYST:AZER:STAT %d",
+        """ A boolean property that controls whether the autozero is
+        enabled, which slows the measurements by taking reference readings
+        between each measurement. """,
+        validator=strict_discrete_set,
+        values={True: 1, False: 0},
+        map_values=True,
+        cast=int
+    )
+    display_enabled = Instrument.control(
+        ":DISP:ENAB?", ":DISP:ENAB %d",
+        """ A boolean property that controls whether the front display is
+        enabled, which slows the measurements when updated. """,
+        validator=strict_discrete_set,
+        values={True: 1, False: 0},
+        map_values=True,
+        cast=int
+    )
+
     def __init__(self, adapter, **kwargs):
         super(Keithley2000, self).__init__(
             adapter, "Keithley 2000 Multimeter", **kwargs
         )
         # Set up data transfer format
+        try:
+            from pymeasure.adapters.visa import VISAAdapter
+        except ImportError:
+            return
         if isinstance(self.adapter, VISAAdapter):
             self.adapter.config(
                 is_binary=False,
@@ -433,6 +483,15 @@ class Keithley2000(Instrument, KeithleyBuffer):
                 separator=','
             )
 
+    @property
+    def buffer_count(self):
+        """ Returns the number of readings stored in the buffer. The Keithley
+        2000 has no query for this, so it is calculated from the bytes of
+        memory that are free and in use (:code:`:TRAC:FREE?`), where the
+        whole memory holds :attr:`BUFFER_CAPACITY` readings. """
+        free, used = self.values(":TRAC:FREE?")
+        return int(round(used * self.BUFFER_CAPACITY / (free + used)))
+
     # TODO: Clean up error checking
     def check_errors(self):
         """ Read all errors from the instrument."""
@@ -569,6 +628,69 @@ class Keithley2000(Instrument, KeithleyBuffer):
         """
         self.write(":SENS:%s:AVER:STAT 0" % self._mode_command(mode))
 
+    def burst(self, points, nplc=0.01, delay=0, should_stop=lambda: False,
+              timeout=60):
+        """ Takes a burst of readings in the active
+        :attr:`~.Keithley2000.mode` as fast as possible, and returns them
+        with their timestamps from a single binary transfer of the buffer,
+        as a structured numpy array with the fields :code:`'reading'` and
+        :code:`'time'`. The autozero and display are disabled, and all of
+        the readings are taken on a single immediate trigger. The settings,
+        including the trigger source and counts, are restored afterwards.
+
+        .. code-block:: python
+
+            meter.measure_voltage(1)
+            records = meter.burst(1024, nplc=0.01)
+            records['reading']      # numpy array of the voltages
+
+        :param points: The number of readings, from 2 to 1024
+        :param nplc: The number of power line cycles of each reading
+        :param delay: The trigger delay in seconds before the readings
+        :param should_stop: A function that returns True when the burst should stop
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        """
+        points = int(strict_range(points, [2, 1024]))
+        mode = self.mode
+        if mode not in self.NPLC_MODES:
+            raise ValueError("Keithley 2000 burst mode is not supported in "
+                             "the '%s' mode" % mode)
+        nplc_command = ":SENS:%s:NPLC" % self._mode_command(mode)
+        trigger_source = self.ask(":TRIG:SOUR?").strip()
+        previous = dict(
+            nplc=float(self.ask(nplc_command + "?")),
+            autozero_enabled=self.autozero_enabled,
+            display_enabled=self.display_enabled,
+            sample_count=self.sample_count,
+            trigger_count=self.trigger_count,
+            trigger_delay=self.trigger_delay,
+        )
+        try:
+            self.write("%s %g" % (nplc_command, nplc))
+            self.autozero_enabled = False
+            self.display_enabled = False
+            self.config_buffer(points, delay)
+            self.write(":SAMP:COUN %d;:TRIG:COUN 1;:TRIG:SOUR IMM" % points)
+            self.start_buffer()
+            if not self.wait_for_buffer(should_stop, timeout=timeout):
+                self.stop_buffer()
+            return self.buffer_records()
+        finally:
+            self.write("%s %g;:TRIG:SOUR %s" % (
+                nplc_command, previous.pop('nplc'), trigger_source))
+            for name, value in previous.items():
+                setattr(self, name, value)
+
+    def trigger_on_external(self, line=None):
+        """ Configures each reading to be taken on a trigger from the
+        external trigger input, with a single sample per trigger.
+
+        :param line: Not used, since the external trigger input is a single
+                     line, but accepted for compatibility with the trigger
+                     link of other Keithley instruments
+        """
+        self.write(":ARM:SOUR IMM;:ARM:COUN 1;:TRIG:SOUR EXT;:SAMP:COUN 1")
+
     def local(self):
         """ Returns control to the instrument panel, and enables
         the panel if disabled. """
@@ -27,8 +27,9 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument, RangeException
-from pymeasure.adapters import PrologixAdapter
-from pymeasure.instruments.validators import truncated_range, strict_discrete_set
+from pymeasure.instruments.instrument import _format_array
+from pymeasure.instruments.validators import (truncated_range, strict_discrete_set,
+                                              strict_range_array)
 
 from .buffer import KeithleyBuffer
 
@@ -61,6 +62,28 @@ class Keithley2400(Instrument, KeithleyBuffer):
 
     """
 
+    # Limits of the source levels in each source mode
+    SOURCE_LIMITS = {'voltage': [-210, 210], 'current': [-1.05, 1.05]}
+    # Source levels above which the compliance must be reduced, and the
+    # maximum compliance for them (21 V at 1.05 A, or 210 V at 105 mA)
+    SOURCE_ENVELOPE = {'voltage': (21, 0.105), 'current': (0.105, 21)}
+    # Maximum number of points sent in a single :SOUR:LIST command
+    LIST_CHUNK_SIZE = 100
+    # Maximum number of points in a sweep, which is limited by the buffer
+    MAX_SWEEP_POINTS = 2500
+
+    # Fields of the buffer records and their :FORM:ELEM names
+    BUFFER_ELEMENTS = [
+        ('voltage', 'VOLT'),
+        ('current', 'CURR'),
+        ('resistance', 'RES'),
+        ('time', 'TIME'),
+        ('status', 'STAT'),
+    ]
+    BUFFER_STATISTICS = ['voltage', 'current', 'resistance']
+
+    _sweep_source = None
+
     # TODO: Add measurement mode property
 
     source_mode = Instrument.control(
@@ -209,6 +232,11 @@ class Keithley2400(Instrument, KeithleyBuffer):
         values=[1, 2500],
         cast=int
     )
+    buffer_count = Instrument.measurement(
+        ":TRAC:POIN:ACT?",
+        """ Returns the number of readings stored in the buffer. """,
+        cast=int
+    )
     means = Instrument.measurement(
         ":CALC3:FORM MEAN;:CALC3:DATA?;",
         """ Reads the calculated means (averages) for voltage,
@@ -391,16 +419,20 @@ class Keithley2400(Instrument, KeithleyBuffer):
         message = err[1].replace('"', '')
         return (code, message)
 
+    def read_errors(self):
+        """ Returns a list of (code, message) tuples for all of the errors
+        in the error queue, which are read with a single query.
+        """
+        response = self.ask(":SYST:ERR:ALL?")
+        errors = re.findall(r'([+-]?\d+),"([^"]*)"', response)
+        return [(int(code), message) for code, message in errors
+                if int(code) != 0]
+
     def check_errors(self):
         """ Logs any system errors reported by the instrument.
         """
-        code, message = self.error
-        while code != 0:
-            t = time.time()
+        for code, message in self.read_errors():
             log.info("Keithley 2400 reported error: %d, %s" % (code, message))
-            code, message = self.error
-            if (time.time()-t)>10:
-                log.warning("Timed out for Keithley 2400 error retrieval.")
 
     def reset(self):
         """ Resets the instrument and clears the queue.  """
@@ -440,6 +472,169 @@ class Keithley2400(Instrument, KeithleyBuffer):
             self.source_voltage = voltage
             time.sleep(pause)
 
+    def config_list_sweep(self, values, delay=0, compliance=None, source=None,
+                          source_range=None):
+        """ Configures a hardware-timed sweep through an array of source
+        levels, which are uploaded as a source list (:code:`:SOUR:LIST`).
+        The trigger count and buffer are configured for one reading per
+        level, so that :meth:`~.run_sweep` returns all of the readings.
+
+        .. code-block:: python
+
+            keithley.config_list_sweep(np.linspace(0, 1, 101), compliance=10e-3)
+            records = keithley.run_sweep()
+
+        :param values: An array of source levels in Volts or Amps
+        :param delay: A trigger delay in seconds before each measurement
+        :param compliance: An optional compliance current or voltage, for the
+                           voltage or current source respectively
+        :param source: The source mode, either 'voltage' or 'current', which
+                       is read from the instrument if not supplied
+        :param source_range: A fixed source range in Volts or Amps, or None
+                             for the best range for all of the levels
+        :raises: ValueError if the levels are outside of the source limits or
+                 range, or need a lower compliance
+        """
+        values = np.asarray(values, dtype=np.float64)
+        source = self._prepare_sweep(len(values), values, compliance, source,
+                                     source_range)
+        function = self._source_function(source)
+        self.write(":SOUR:%s:MODE LIST" % function)
+        for i in range(0, len(values), self.LIST_CHUNK_SIZE):
+            chunk = _format_array(values[i:i + self.LIST_CHUNK_SIZE])
+            append = ":APP" if i > 0 else ""
+            self.write(":SOUR:LIST:%s%s %s" % (function, append, chunk))
+        self._config_sweep_trigger(len(values), delay)
+
+    def config_staircase_sweep(self, start, stop, points, spacing='linear',
+                               delay=0, compliance=None, source=None,
+                               source_range=None):
+        """ Configures a hardware-timed staircase sweep from a start to a stop
+        source level, with linear or logarithmic steps. The trigger count and
+        buffer are configured for one reading per step, so that
+        :meth:`~.run_sweep` returns all of the readings.
+
+        :param start: The first source level in Volts or Amps
+        :param stop: The last source level in Volts or Amps
+        :param points: The number of source levels
+        :param spacing: Either 'linear' or 'log' spacing of the levels
+        :param delay: A trigger delay in seconds before each measurement
+        :param compliance: An optional compliance current or voltage, for the
+                           voltage or current source respectively
+        :param source: The source mode, either 'voltage' or 'current', which
+                       is read from the instrument if not supplied
+        :param source_range: A fixed source range in Volts or Amps, or None
+                             for the best range for all of the levels
+        :raises: ValueError if the levels are outside of the source limits or
+                 range, or need a lower compliance
+        """
+        source = self._prepare_sweep(points, [start, stop], compliance,
+                                     source, source_range)
+        spacing = {'linear': 'LIN', 'log': 'LOG'}[
+            strict_discrete_set(spacing, ['linear', 'log'])]
+        function = self._source_function(source)
+        self.write(
+            ":SOUR:%s:MODE SWE;:SOUR:SWE:SPAC %s;"
+            ":SOUR:%s:STAR %g;:SOUR:%s:STOP %g;:SOUR:SWE:POIN %d" % (
+                function, spacing,
+                function, start, function, stop, points)
+        )
+        self._config_sweep_trigger(points, delay)
+
+    def run_sweep(self, should_stop=lambda: False, timeout=60):
+        """ Runs a sweep configured by :meth:`~.config_list_sweep` or
+        :meth:`~.config_staircase_sweep` on the timing of the instrument, and
+        returns the readings from a single binary transfer of the buffer, as
+        a structured numpy array (see :meth:`~.buffer_records`). The source
+        is returned to a fixed level afterwards. If :code:`should_stop`
+        returns True, the sweep is aborted and the readings taken so far are
+        returned.
+
+        :param should_stop: A function that returns True when the sweep should stop
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        """
+        if self._sweep_source is None:
+            raise Exception("Keithley 2400 sweep must be configured with "
+                            "config_list_sweep or config_staircase_sweep "
+                            "before it is run")
+        self.enable_source()
+        self.start_buffer()
+        try:
+            if not self.wait_for_buffer(should_stop, timeout=timeout):
+                self.stop_buffer()
+            return self.buffer_records()
+        finally:
+            function = self._source_function(self._sweep_source)
+            self.write(":SOUR:%s:MODE FIX" % function)
+
+    def sweep(self, values, delay=0, compliance=None, source=None,
+              should_stop=lambda: False, timeout=60, source_range=None):
+        """ Executes a hardware-timed list sweep through an array of source
+        levels, using :meth:`~.config_list_sweep` and :meth:`~.run_sweep`,
+        and returns the readings as a structured numpy array.
+
+        .. code-block:: python
+
+            records = keithley.sweep(np.linspace(-1, 1, 201), source='voltage')
+            records['current']      # numpy array of the measured currents
+        """
+        self.config_list_sweep(values, delay, compliance, source,
+                               source_range)
+        return self.run_sweep(should_stop, timeout)
+
+    def _prepare_sweep(self, points, levels, compliance, source,
+                       source_range):
+        """ Checks the number of sweep points and the source levels against
+        the source limits or range and the compliance, then sets the source
+        mode, compliance and sweep ranging, and returns the source mode.
+        """
+        if not 0 < points <= self.MAX_SWEEP_POINTS:
+            raise ValueError("Keithley 2400 sweeps require between 1 and %d "
+                             "points" % self.MAX_SWEEP_POINTS)
+        if source is None:
+            source = current_source = self.source_mode
+        else:
+            current_source = None
+            strict_discrete_set(source, ['voltage', 'current'])
+        limits = self.SOURCE_LIMITS[source]
+        if source_range is not None:
+            source_range = abs(source_range)
+            limits = [max(limits[0], -source_range),
+                      min(limits[1], source_range)]
+        levels = strict_range_array(levels, limits)
+        # The compliance limits the other quantity of the source
+        compliance_name = {'voltage': 'compliance_current',
+                           'current': 'compliance_voltage'}[source]
+        low, reduced = self.SOURCE_ENVELOPE[source]
+        if np.max(np.abs(levels)) > low:
+            if compliance is None:
+                compliance = getattr(self, compliance_name)
+            if abs(compliance) > reduced:
+                raise ValueError("Keithley 2400 %s levels above %g require a "
+                                 "compliance of at most %g" % (
+                                     source, low, reduced))
+        if source != current_source:
+            self.source_mode = source
+        if compliance is not None:
+            setattr(self, compliance_name, compliance)
+        if source_range is None:
+            self.write(":SOUR:SWE:RANG BEST")
+        else:
+            setattr(self, 'source_%s_range' % source, source_range)
+            self.write(":SOUR:SWE:RANG FIX")
+        self._sweep_source = source
+        return source
+
+    def _source_function(self, source):
+        return {'voltage': 'VOLT', 'current': 'CURR'}[source]
+
+    def _config_sweep_trigger(self, points, delay):
+        """ Configures the trigger model and buffer for a sweep of a number
+        of points, each taken immediately after the previous one.
+        """
+        self.write(":ARM:SOUR IMM;:ARM:COUN 1;:TRIG:SOUR IMM;")
+        self.config_buffer(points, delay)
+
     def trigger(self):
         """ Executes a bus trigger, which can be used when 
         :meth:`~.trigger_on_bus` is configured. 
@@ -499,6 +694,21 @@ class Keithley2400(Instrument, KeithleyBuffer):
         cmd += ":ARM:ILIN %d;:TRIG:ILIN %d;" % (line, line)
         self.write(cmd)
 
+    def arm_on_external(self, points, line=1):
+        """ Configures the buffer for a number of points, each taken on a
+        trigger from a line of the trigger link, and starts the buffer. The
+        arm layer is passed immediately, unlike :meth:`~.trigger_on_external`,
+        so that the first trigger is not consumed by the arm layer and every
+        trigger takes a reading. This is used by the
+        :class:`~pymeasure.instruments.trigger.TriggerCoordinator`.
+
+        :param points: The number of points in the buffer
+        :param line: A trigger line from 1 to 4
+        """
+        self.config_buffer(points)
+        self.write(":ARM:SOUR IMM;:ARM:COUN 1;:TRIG:SOUR TLIN;:TRIG:ILIN %d;" % line)
+        self.start_buffer()
+
     def output_trigger_on_external(self, line=1, after='DEL'):
         """ Configures the output trigger on the specified trigger link
         line number, with the option of supplying the part of the
@@ -548,7 +758,7 @@ class Keithley2400(Instrument, KeithleyBuffer):
     @property
     def min_current(self):
         """ Returns the minimum current from the buffer """
-        return self.mininums[1]
+        return self.minimums[1]
 
     @property
     def std_current(self):
@@ -563,7 +773,7 @@ class Keithley2400(Instrument, KeithleyBuffer):
     @property
     def max_resistance(self):
         """ Returns the maximum resistance from the buffer """
-        return self.maximums()[2]
+        return self.maximums[2]
 
     @property
     def min_resistance(self):
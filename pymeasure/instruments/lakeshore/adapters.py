@@ -22,7 +22,7 @@
 # THE SOFTWARE.
 #
 
-from pymeasure.adapters import SerialAdapter
+from pymeasure.adapters.serial import SerialAdapter
 
 
 class LakeShoreUSBAdapter(SerialAdapter):
@@ -26,9 +26,10 @@ import logging
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-from time import sleep, time
+from time import time
 
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.stability import StabilityDetector
 from pymeasure.instruments.validators import strict_discrete_set
 
 
@@ -46,6 +47,9 @@ class LakeShore331(Instrument):
         controller.wait_for_temperature()   # Wait for the temperature to stabilize
         print(controller.temperature_A)     # Print the temperature at sensor A
 
+        controller.setpoint_1 = 60          # Change the setpoint to 60 K
+        controller.wait_for_stable_temperature(tolerance=0.05, rate=1e-3)
+
     """
 
     temperature_A = Instrument.measurement(
@@ -98,7 +102,7 @@ class LakeShore331(Instrument):
         :param interval: A time in seconds that controls the refresh rate
         :param sensor: The desired sensor to read, either A or B
         :param setpoint: The desired setpoint loop to read, either 1 or 2
-        :param timeout: A timeout in seconds after which an exception is raised
+        :param timeout: A timeout in seconds after which a TimeoutError is raised
         :param should_stop: A function that returns True if waiting should stop, by
                             default this always returns False
         """
@@ -108,14 +112,56 @@ class LakeShore331(Instrument):
         setpoint_value = getattr(self, setpoint_name)
         def percent_difference(temperature):
             return abs(100*(temperature - setpoint_value)/setpoint_value)
-        t = time()
-        while percent_difference(getattr(self, temperature_name)) > accuracy:
-            sleep(interval)
-            if (time()-t) > timeout:
-                raise Exception((
-                    "Timeout occurred after waiting %g seconds for "
-                    "the LakeShore 331 temperature to reach %g K."
-                ) % (timeout, setpoint))
-            if should_stop():
-                return
+        try:
+            self.wait_for(
+                lambda: percent_difference(
+                    getattr(self, temperature_name)) <= accuracy,
+                timeout=timeout, should_stop=should_stop,
+                max_interval=interval
+            )
+        except TimeoutError:
+            raise TimeoutError((
+                "Timeout occurred after waiting %g seconds for "
+                "the LakeShore 331 temperature to reach %g K."
+            ) % (timeout, setpoint_value))
+
+    def wait_for_stable_temperature(self, tolerance=0.1, rate=1e-3, window=60,
+            interval=0.5, sensor='A', setpoint=1, timeout=360,
+            should_stop=lambda: False, lookahead=0):
+        """ Blocks the program, waiting for the temperature to become stable at
+        the setpoint, as predicted by a :class:`~pymeasure.instruments.stability.StabilityDetector`
+        that fits the recent temperatures with an exponential approach. This
+        returns as soon as the temperature and its predicted final value are
+        within the tolerance, and it changes slower than the rate, or as soon
+        as they are predicted to be after the lookahead.
 
+        :param tolerance: An acceptable deviation in Kelvin between the
+                          setpoint and temperature
+        :param rate: An acceptable rate of change in Kelvin per second
+        :param window: A time in seconds of the temperatures that are fitted
+        :param interval: A time in seconds between temperature readings
+        :param sensor: The desired sensor to read, either A or B
+        :param setpoint: The desired setpoint loop to read, either 1 or 2
+        :param timeout: A timeout in seconds after which a TimeoutError is raised
+        :param should_stop: A function that returns True if waiting should stop, by
+                            default this always returns False
+        :param lookahead: A time in seconds ahead at which the temperature and
+                          its rate are predicted
+        :returns: True if the temperature is stable, False if waiting was stopped
+        """
+        temperature_name = 'temperature_%s' % sensor
+        # Only get the setpoint once, assuming it does not change
+        setpoint_value = getattr(self, 'setpoint_%d' % setpoint)
+        detector = StabilityDetector(setpoint_value, tolerance, rate, window,
+                                     lookahead=lookahead)
+        try:
+            return self.wait_for(
+                lambda: detector.update(time(), getattr(self, temperature_name)),
+                timeout=timeout, should_stop=should_stop,
+                interval=interval, max_interval=interval
+            )
+        except TimeoutError:
+            raise TimeoutError((
+                "Timeout occurred after waiting %g seconds for "
+                "the LakeShore 331 temperature to stabilize at %g K."
+            ) % (timeout, setpoint_value))
@@ -0,0 +1,125 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from abc import ABCMeta, abstractmethod
+
+import numpy as np
+
+from pymeasure.instruments.instrument import _format_array
+from pymeasure.instruments.validators import (strict_discrete_set,
+                                              strict_range_array)
+
+
+class ListSweepMixin(metaclass=ABCMeta):
+    """ Implements list sweeps of signal generators, where arrays of
+    frequencies and powers are uploaded in bulk and stepped through by the
+    instrument, so that hopping does not cost a round trip per point.
+
+    The points are validated against the :attr:`FREQUENCY_RANGE`,
+    :attr:`POWER_RANGE`, :attr:`DWELL_RANGE` and :attr:`MAX_LIST_POINTS` of
+    the instrument, and the trigger names are translated by
+    :attr:`LIST_TRIGGERS`. Instruments must implement the abstract
+    :code:`_write_list_sweep`, which uploads the validated points, and set
+    the commands that start and stop the sweep.
+    """
+
+    FREQUENCY_RANGE = [0, np.inf]
+    POWER_RANGE = [-np.inf, np.inf]
+    # Range of the dwell times, or None if the list is stepped by triggers only
+    DWELL_RANGE = None
+    # Whether each point has its own dwell time, or the list has one
+    LIST_DWELL_POINTS = True
+    MAX_LIST_POINTS = 1
+    # Trigger names and the instrument settings they correspond to
+    LIST_TRIGGERS = {'immediate': 'IMM', 'bus': 'BUS', 'external': 'EXT'}
+    LIST_START_COMMAND = None
+    LIST_STOP_COMMAND = None
+
+    def config_list_sweep(self, frequencies, powers=None, dwell=None,
+                          trigger='bus', **kwargs):
+        """ Configures a list sweep through arrays of frequencies and powers.
+        The sweep is started with :meth:`~.start_list_sweep`, after which
+        each point is stepped to by the trigger source: the dwell time
+        ('immediate'), a :code:`*TRG` from :meth:`~.trigger` ('bus'), or the
+        trigger input ('external').
+
+        :param frequencies: An array of frequencies in Hz
+        :param powers: An array of powers in dBm, or a single power for all
+                       of the points
+        :param dwell: An array of dwell times in seconds, or a single dwell
+                      time for all of the points, which is the only option
+                      if :attr:`LIST_DWELL_POINTS` is False
+        :param trigger: The point trigger, one of :attr:`LIST_TRIGGERS`
+        :param kwargs: Settings of the list that are specific to the
+                       instrument, such as the name of the list file
+        :raises: ValueError if the points are outside of the instrument ranges
+        """
+        trigger = self.LIST_TRIGGERS[
+            strict_discrete_set(trigger, self.LIST_TRIGGERS)]
+        frequencies = strict_range_array(frequencies, self.FREQUENCY_RANGE)
+        if not 0 < len(frequencies) <= self.MAX_LIST_POINTS:
+            raise ValueError("%s list sweeps require between 1 and %d "
+                             "points" % (self.name, self.MAX_LIST_POINTS))
+        if powers is not None:
+            powers = np.broadcast_to(
+                strict_range_array(powers, self.POWER_RANGE), frequencies.shape)
+        if dwell is not None:
+            if self.DWELL_RANGE is None:
+                raise ValueError("%s list sweeps are stepped by triggers "
+                                 "only" % self.name)
+            dwell = strict_range_array(dwell, self.DWELL_RANGE)
+            if self.LIST_DWELL_POINTS:
+                dwell = np.broadcast_to(dwell, frequencies.shape)
+            elif dwell.ndim:
+                raise ValueError("%s list sweeps have a single dwell "
+                                 "time" % self.name)
+        self._write_list_sweep(frequencies, powers, dwell, trigger, **kwargs)
+
+    @abstractmethod
+    def _write_list_sweep(self, frequencies, powers, dwell, trigger, **kwargs):
+        """ Uploads the validated points of a list sweep, where powers and
+        dwell are None if they are not given, and the trigger is the value in
+        :attr:`LIST_TRIGGERS`.
+        """
+
+    @staticmethod
+    def _list_values(array):
+        """ Returns the values of an array as a comma separated list, with
+        full precision.
+        """
+        return _format_array(np.asarray(array, dtype=float))
+
+    def start_list_sweep(self):
+        """ Starts the list configured by :meth:`~.config_list_sweep` from
+        the first point.
+        """
+        self.write(self.LIST_START_COMMAND)
+
+    def trigger(self):
+        """ Steps a list sweep with the 'bus' trigger to the next point. """
+        self.write("*TRG")
+
+    def stop_list_sweep(self):
+        """ Stops a list sweep and returns to a fixed frequency. """
+        self.write(self.LIST_STOP_COMMAND)
@@ -24,7 +24,10 @@
 
 from time import sleep
 
+import numpy as np
+
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.scan import continuous_scan, record_motion
 from pymeasure.instruments.validators import strict_discrete_set
 
 
@@ -138,6 +141,11 @@ class Axis(object):
         is stable.
         """
     )
+    velocity = Instrument.control(
+        "VA?", "VA%g",
+        """ A floating point property that controls the velocity of the
+        axis in units per second. """
+    )
     enabled = Instrument.measurement(
         "MO?",
         """ Returns a boolean value that is True if the motion for
@@ -228,6 +236,36 @@ class Axis(object):
         while not self.motion_done:
             sleep(interval)
 
+    def scan_to(self, position, velocity, measurables, interval=0,
+                should_stop=lambda: False, timeout=None,
+                callback=lambda record: None):
+        """ Moves the axis to a position at a constant velocity while sampling
+        the measurables together with the axis position, until the motion is
+        done (see :func:`~pymeasure.instruments.scan.continuous_scan`). The
+        motion is stopped if the :code:`should_stop` function returns True.
+        The velocity remains set afterwards.
+
+        :param position: The final position of the axis
+        :param velocity: The velocity in units per second
+        :param measurables: A dictionary of names and functions that return the
+                            measured values
+        :param interval: A minimum time in seconds between samples
+        :param should_stop: A function that returns True to stop the scan early
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param callback: A function that is called with each sample as a dictionary
+        :returns: A structured numpy array with the fields 'time', 'position',
+                  and the names of the measurables
+        """
+        self.velocity = velocity
+        self.position = position
+        records = continuous_scan(
+            lambda: self.position, measurables, lambda: self.motion_done,
+            interval, should_stop, timeout, callback
+        )
+        if should_stop():
+            self.write("ST")
+        return records
+
 
 class ESP300(Instrument):
     """ Represents the Newport ESP 300 Motion Controller
@@ -238,6 +276,22 @@ class ESP300(Instrument):
     can overwrite this depending on the avalible axes. Axes are controlled
     through an :class:`Axis <pymeasure.instruments.newport.esp300.Axis>`
     class.
+
+    Several axes can be moved together, and waited on with a single
+    status query for all of them.
+
+    .. code-block:: python
+
+        controller = ESP300("GPIB::1")
+
+        controller.move_group({controller.x: 10, controller.y: 5})
+        controller.wait_for_group([controller.x, controller.y])
+
+        # Logs the positions and following errors every 10 ms
+        controller.move_group({controller.x: 0, controller.y: 0})
+        log = controller.wait_for_group([controller.x, controller.y],
+                                        record_interval=0.01)
+        log['position_1'], log['error_1']
     """
 
     error = Instrument.measurement(
@@ -299,6 +353,67 @@ class ESP300(Instrument):
                 raise e
         return axes
 
+    def _axis(self, axis):
+        if isinstance(axis, Axis):
+            return axis
+        return Axis(axis, self)
+
+    def move_group(self, positions):
+        """ Starts moving several axes to absolute positions at the same
+        time, with a single command string.
+
+        :param positions: A dictionary of :class:`Axis` objects (or axis
+                          numbers) and their positions
+        """
+        self.write(";".join(
+            "%sPA%g" % (self._axis(axis).axis, position)
+            for axis, position in positions.items()
+        ))
+
+    def group_status(self, axes):
+        """ Returns arrays of whether the motion is done, the positions, and
+        the following errors of several axes, from a single combined query.
+
+        :param axes: A list of :class:`Axis` objects (or axis numbers)
+        """
+        axes = [self._axis(axis) for axis in axes]
+        values = self.values(";".join(
+            "{0}MD?;{0}TP;{0}DP?".format(axis.axis) for axis in axes))
+        done, position, desired = np.array(values, dtype=float).reshape(-1, 3).T
+        return done.astype(bool), position, desired - position
+
+    def wait_for_group(self, axes, should_stop=lambda: False, timeout=60,
+                       interval=0.05, record_interval=None):
+        """ Blocks the program until the motion of several axes is done,
+        with a single status query for all of the axes per check. If a
+        :code:`record_interval` is given, the positions and following errors
+        are logged at that rate during the motion.
+
+        :param axes: A list of :class:`Axis` objects (or axis numbers)
+        :param should_stop: A function that returns True to stop waiting early
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param interval: The time in seconds between checks, when not recording
+        :param record_interval: The time in seconds between logged samples,
+                                or None to not log the motion
+        :returns: A structured numpy array with the fields 'time',
+                  'position_<n>' and 'error_<n>' for each axis number n, if
+                  recording, otherwise False if should_stop stopped the waiting
+        """
+        axes = [self._axis(axis) for axis in axes]
+        if record_interval is None:
+            return self.wait_for(lambda: self.group_status(axes)[0].all(),
+                                 timeout=timeout, should_stop=should_stop,
+                                 interval=interval, max_interval=interval)
+
+        def status():
+            done, position, error = self.group_status(axes)
+            return done.all(), np.concatenate([position, error])
+
+        names = (["position_%s" % axis.axis for axis in axes] +
+                 ["error_%s" % axis.axis for axis in axes])
+        return record_motion(status, names, record_interval, should_stop,
+                             timeout)
+
     def enable(self):
         """ Enables all of the axes associated with this controller.
         """
@@ -26,11 +26,19 @@
 # http://www.scipy.org/Cookbook/Data_Acquisition_with_NIDAQmx
 
 import ctypes
+import logging
 import numpy as np
+import queue
+import threading
 from sys import platform
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 if platform == "win32":
     nidaq = ctypes.windll.nicaiu
+else:
+    nidaq = None
 
 # Data Types
 int32 = ctypes.c_long
@@ -43,13 +51,34 @@ DAQmx_Val_Cfg_Default = int32(-1)
 DAQmx_Val_Volts = 10348
 DAQmx_Val_Rising = 10280
 DAQmx_Val_FiniteSamps = 10178
-DAQmx_Val_GroupByChannel = 1
+DAQmx_Val_ContSamps = 10123
+DAQmx_Val_GroupByChannel = 0
+DAQmx_Val_GroupByScanNumber = 1
+# Errors
+DAQmx_Err_SamplesNotYetAvailable = -200284
+DAQmx_Err_BufferOverwritten = -200279
 
 
 class DAQmx(object):
-    """Instrument object for interfacing with NI-DAQmx devices."""
-    def __init__(self, name, *args, **kwargs):
+    """Instrument object for interfacing with NI-DAQmx devices.
+
+    The NI-DAQmx library can be replaced through the :code:`library`
+    keyword argument, for example by a fake library for testing.
+
+    Besides the finite acquisitions of :meth:`acquire`, the analog inputs
+    can be acquired continuously into a circular buffer, with a reader
+    thread that hands each block to a callback or to :meth:`read_blocks`.
+
+    .. code-block:: python
+
+        daq.start_continuous([0, 1], 1000, sampleRate=10000)
+        for block in daq.read_blocks(procedure.should_stop):
+            procedure.emit_block('results', block)
+        daq.stop_continuous()
+    """
+    def __init__(self, name, *args, library=None, **kwargs):
         super(DAQmx, self).__init__()
+        self.nidaq = nidaq if library is None else library
         self.resourceName = name # NOTE: Device number, e.g. Dev1 or PXI1Slot2
         self.numChannels = 0
         self.numSamples = 0
@@ -57,6 +86,8 @@ class DAQmx(object):
         self.taskHandleAI = TaskHandle(0)
         self.taskHandleAO = TaskHandle(0)
         self.terminated = False
+        self.overruns = 0
+        self._reader = None
 
     def setup_analog_voltage_in(self, channelList, numSamples, sampleRate=10000, scale=3.0):
         resourceString = ""
@@ -68,20 +99,20 @@ class DAQmx(object):
         self.numSamples = numSamples
         self.taskHandleAI = TaskHandle(0)
         self.dataBuffer = np.zeros((self.numSamples,self.numChannels), dtype=np.float64)
-        self.CHK(nidaq.DAQmxCreateTask("",ctypes.byref(self.taskHandleAI)))
-        self.CHK(nidaq.DAQmxCreateAIVoltageChan(self.taskHandleAI,resourceString,"",
+        self.CHK(self.nidaq.DAQmxCreateTask("",ctypes.byref(self.taskHandleAI)))
+        self.CHK(self.nidaq.DAQmxCreateAIVoltageChan(self.taskHandleAI,resourceString,"",
                                    DAQmx_Val_Cfg_Default,
                                    float64(-scale),float64(scale),
                                    DAQmx_Val_Volts,None))
-        self.CHK(nidaq.DAQmxCfgSampClkTiming(self.taskHandleAI,"",float64(sampleRate),
+        self.CHK(self.nidaq.DAQmxCfgSampClkTiming(self.taskHandleAI,"",float64(sampleRate),
                                 DAQmx_Val_Rising,DAQmx_Val_FiniteSamps,
                                 uInt64(self.numSamples)));
 
     def setup_analog_voltage_out(self, channel=0):
         resourceString = self.resourceName + "/ao" + str(channel)
         self.taskHandleAO = TaskHandle(0)
-        self.CHK(nidaq.DAQmxCreateTask("", ctypes.byref( self.taskHandleAO )))
-        self.CHK(nidaq.DAQmxCreateAOVoltageChan( self.taskHandleAO,
+        self.CHK(self.nidaq.DAQmxCreateTask("", ctypes.byref( self.taskHandleAO )))
+        self.CHK(self.nidaq.DAQmxCreateAOVoltageChan( self.taskHandleAO,
                 resourceString, "",
                 float64(-10.0), float64(10.0),
                 DAQmx_Val_Volts, None))
@@ -93,15 +124,15 @@ class DAQmx(object):
                 resourceString += ", " # Add a comma before entries 2 and so on
             resourceString += self.resourceName + "/ao" + str(num)
         self.taskHandleAO = TaskHandle(0)
-        self.CHK(nidaq.DAQmxCreateTask("", ctypes.byref( self.taskHandleAO )))
-        self.CHK(nidaq.DAQmxCreateAOVoltageChan( self.taskHandleAO,
+        self.CHK(self.nidaq.DAQmxCreateTask("", ctypes.byref( self.taskHandleAO )))
+        self.CHK(self.nidaq.DAQmxCreateAOVoltageChan( self.taskHandleAO,
                 resourceString, "",
                 float64(-10.0), float64(10.0),
                 DAQmx_Val_Volts, None))
 
     def write_analog_voltage(self, value):
         timeout = -1.0
-        self.CHK(nidaq.DAQmxWriteAnalogScalarF64( self.taskHandleAO,
+        self.CHK(self.nidaq.DAQmxWriteAnalogScalarF64( self.taskHandleAO,
             1, # Autostart
             float64(timeout),
             float64(value),
@@ -109,7 +140,7 @@ class DAQmx(object):
 
     def write_analog_voltage_multiple_channels(self, values):
         timeout = -1.0
-        self.CHK(nidaq.DAQmxWriteAnalogF64( self.taskHandleAO,
+        self.CHK(self.nidaq.DAQmxWriteAnalogF64( self.taskHandleAO,
             1, # Samples per channel
             1, # Autostart
             float64(timeout),
@@ -119,8 +150,8 @@ class DAQmx(object):
 
     def acquire(self):
         read = int32()
-        self.CHK(nidaq.DAQmxReadAnalogF64(self.taskHandleAI ,self.numSamples,float64(10.0),
-                                DAQmx_Val_GroupByChannel, self.dataBuffer.ctypes.data,
+        self.CHK(self.nidaq.DAQmxReadAnalogF64(self.taskHandleAI ,self.numSamples,float64(10.0),
+                                DAQmx_Val_GroupByScanNumber, self.dataBuffer.ctypes.data,
                                 self.numChannels*self.numSamples,ctypes.byref(read),None))
         return self.dataBuffer.transpose()
 
@@ -131,27 +162,168 @@ class DAQmx(object):
         else:
             return np.zeros(3)
 
+    def start_continuous(self, channelList, blockSamples, sampleRate=10000,
+                         scale=3.0, blocks=8, callback=None, timeout=10.0):
+        """ Starts acquiring the analog input channels continuously into a
+        circular buffer of :code:`blocks` blocks of :code:`blockSamples`
+        scans, which a reader thread reads in turn. Each block is a
+        structured numpy array with a field for each channel (e.g.
+        :code:`'ai0'`), which is handed over without copying.
+
+        If :code:`callback` is given, it is called with each block from the
+        reader thread, and the block can be overwritten once it returns.
+        Otherwise the blocks are returned by :meth:`read_blocks`, and each one
+        is valid until the next one is requested. Blocks that cannot be handed
+        over in time, and samples lost to the DAQmx buffer being overwritten,
+        are counted in :attr:`overruns`.
+
+        :param channelList: A list of the analog input channel numbers
+        :param blockSamples: The number of scans in each block
+        :param sampleRate: The sample rate in Hz
+        :param scale: The input range in Volts, from -scale to scale
+        :param blocks: The number of blocks in the buffer, at least 3
+        :param callback: A function called with each block, or None
+        :param timeout: A time in seconds to wait for each block
+        """
+        if blocks < 3:
+            raise ValueError("DAQmx continuous acquisition needs at least "
+                             "3 blocks")
+        self.stop_continuous()
+        resourceString = ", ".join(
+            "%s/ai%s" % (self.resourceName, channel) for channel in channelList)
+        dtype = np.dtype([('ai%s' % channel, np.float64)
+                          for channel in channelList])
+        # Scans of the channels are laid out as the rows of the blocks
+        self._ring = np.zeros((blocks, blockSamples), dtype=dtype)
+        self._callback = callback
+        self._read_timeout = timeout
+        self._queue = queue.Queue(maxsize=blocks - 2)
+        self._stop_event = threading.Event()
+        self._error = None
+        self.overruns = 0
+
+        self.taskHandleAI = TaskHandle(0)
+        self.CHK(self.nidaq.DAQmxCreateTask("", ctypes.byref(self.taskHandleAI)))
+        self.CHK(self.nidaq.DAQmxCreateAIVoltageChan(self.taskHandleAI, resourceString, "",
+                                   DAQmx_Val_Cfg_Default,
+                                   float64(-scale), float64(scale),
+                                   DAQmx_Val_Volts, None))
+        self.CHK(self.nidaq.DAQmxCfgSampClkTiming(self.taskHandleAI, "", float64(sampleRate),
+                                DAQmx_Val_Rising, DAQmx_Val_ContSamps,
+                                uInt64(blocks*blockSamples)))
+        self.CHK(self.nidaq.DAQmxStartTask(self.taskHandleAI))
+        self._reader = threading.Thread(target=self._read_continuous)
+        self._reader.daemon = True
+        self._reader.start()
+
+    def _read_continuous(self):
+        """ Reads blocks into the circular buffer until stopped, with short
+        reads so that the stop flag is checked while waiting for samples """
+        read = int32()
+        index = 0
+        blocks, blockSamples = self._ring.shape
+        channels = len(self._ring.dtype.names)
+        poll = min(self._read_timeout, 0.1)
+        filled = waited = 0
+        while not self._stop_event.is_set():
+            block = self._ring[index % blocks]
+            remaining = block[filled:]
+            read.value = 0
+            err = self.nidaq.DAQmxReadAnalogF64(self.taskHandleAI, blockSamples - filled,
+                                float64(poll),
+                                DAQmx_Val_GroupByScanNumber, remaining.ctypes.data,
+                                (blockSamples - filled)*channels, ctypes.byref(read), None)
+            filled += read.value
+            if err == DAQmx_Err_SamplesNotYetAvailable:
+                waited += poll
+                if waited > self._read_timeout:
+                    self._error = TimeoutError("Timed out waiting for a DAQmx block")
+                    return
+                continue
+            elif err == DAQmx_Err_BufferOverwritten:
+                # Restart the task to resume after the lost samples
+                self.overruns += 1
+                filled = 0
+                self.nidaq.DAQmxStopTask(self.taskHandleAI)
+                self.nidaq.DAQmxStartTask(self.taskHandleAI)
+                continue
+            try:
+                self.CHK(err)
+            except RuntimeError as e:
+                self._error = e
+                return
+            if filled < blockSamples:
+                continue
+            filled = waited = 0
+            if self._callback is not None:
+                self._callback(block)
+            else:
+                try:
+                    self._queue.put_nowait(block)
+                except queue.Full:
+                    # The slot is reused, so the queued blocks stay valid
+                    self.overruns += 1
+                    continue
+            index += 1
+
+    def read_blocks(self, should_stop=lambda: False, timeout=None):
+        """ Returns a generator that yields the blocks of the continuous
+        acquisition started by :meth:`start_continuous`, as structured
+        numpy arrays that can be passed to :meth:`Procedure.emit_block
+        <pymeasure.experiment.procedure.Procedure.emit_block>`.
+
+        :param should_stop: A function that returns True when this generator should stop
+        :param timeout: A time in seconds without blocks after which a
+                        TimeoutError is raised, or None to wait indefinitely
+        """
+        waited = 0
+        while not should_stop():
+            try:
+                block = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._error is not None:
+                    raise self._error
+                if self._reader is None or not self._reader.is_alive():
+                    return
+                waited += 0.1
+                if timeout is not None and waited > timeout:
+                    raise TimeoutError("Timed out waiting for a DAQmx block")
+                continue
+            waited = 0
+            yield block
+
+    def stop_continuous(self):
+        """ Stops the continuous acquisition and its reader thread """
+        if self._reader is None:
+            return
+        self._stop_event.set()
+        self._reader.join()
+        self._reader = None
+        self.nidaq.DAQmxStopTask(self.taskHandleAI)
+        self.nidaq.DAQmxClearTask(self.taskHandleAI)
+        self.taskHandleAI = TaskHandle(0)
+
     def stop(self):
         if self.taskHandleAI.value != 0:
-            nidaq.DAQmxStopTask(self.taskHandleAI)
-            nidaq.DAQmxClearTask(self.taskHandleAI)
+            self.nidaq.DAQmxStopTask(self.taskHandleAI)
+            self.nidaq.DAQmxClearTask(self.taskHandleAI)
         if self.taskHandleAO.value != 0:
-            nidaq.DAQmxStopTask(self.taskHandleAO)
-            nidaq.DAQmxClearTask(self.taskHandleAO)
+            self.nidaq.DAQmxStopTask(self.taskHandleAO)
+            self.nidaq.DAQmxClearTask(self.taskHandleAO)
 
     def CHK(self, err):
-        """a simple error checking routine"""
-        if err < 0:
+        """a simple error checking routine, which raises on errors and logs
+        warnings, so that a warning does not stop the acquisition"""
+        if err != 0:
             buf_size = 100
-            buf = ctypes.create_string_buffer('\000' * buf_size)
-            nidaq.DAQmxGetErrorString(err,ctypes.byref(buf),buf_size)
+            buf = ctypes.create_string_buffer(buf_size)
+            self.nidaq.DAQmxGetErrorString(err,ctypes.byref(buf),buf_size)
+        if err < 0:
             raise RuntimeError('nidaq call failed with error %d: %s'%(err,repr(buf.value)))
         if err > 0:
-            buf_size = 100
-            buf = ctypes.create_string_buffer('\000' * buf_size)
-            nidaq.DAQmxGetErrorString(err,ctypes.byref(buf),buf_size)
-            raise RuntimeError('nidaq generated warning %d: %s'%(err,repr(buf.value)))
+            log.warning('nidaq generated warning %d: %s', err, repr(buf.value))
 
     def shutdown(self):
+        self.stop_continuous()
         self.stop()
         self.terminated = True
@@ -24,8 +24,10 @@
 
 # Requires 'instrumental' package: https://github.com/mabuchilab/Instrumental
 
+from instrumental import u
 from instrumental.drivers.daq import ni
 from pymeasure.instruments import Instrument
+import numpy as np
 
 def get_dict_attr(obj,attr):
     for obj in [obj]+obj.__class__.mro():
@@ -36,9 +38,23 @@ def get_dict_attr(obj,attr):
 class NIDAQ(Instrument):
 	'''
 	Instrument driver for NIDAQ card.
+
+	Each channel is a property, such as :code:`daq.ai0`. Several channels
+	are read or written together through one task with
+	:meth:`read_channels` and :meth:`write_channels`.
+
+	.. code-block:: python
+
+		voltages = daq.read_channels(['ai0', 'ai1', 'ai2'])
+		daq.write_channels({'ao0': 1.5, 'ao1': -0.5})
 	'''
 	def __init__(self, name='Dev1', *args, **kwargs):
 		self._daq  = ni.NIDAQ(name)
+		self._tasks = {}
+		# The channels are looked up by name in __getattr__ and __setattr__,
+		# with the last voltages written to the outputs
+		self._inputs = []
+		self._outputs = {}
 		super(NIDAQ, self).__init__(
 			None,
 			"NIDAQ",
@@ -51,18 +67,65 @@ class NIDAQ(Instrument):
 
 	def add_property(self, chan, set=False):
 		if set:
-			fset = lambda self, value: self.set_chan(chan, value)
-			fget = lambda self: getattr(self, '_%s' %chan)
-			setattr(self, '_%s' %chan, None)
-			setattr(self.__class__,chan,property(fset=fset, fget=fget))
+			self._outputs[chan] = None
 		else:
-			fget = lambda self: self.get_chan(chan)
-			setattr(self.__class__,chan,property(fget=fget))
+			self._inputs.append(chan)
 		setattr(self.get, chan, lambda: getattr(self, chan))
 
+	def __getattr__(self, name):
+		# Only called for names that are not regular attributes
+		if name in self.__dict__.get('_inputs', ()):
+			return self.get_chan(name)
+		outputs = self.__dict__.get('_outputs', {})
+		if name in outputs:
+			return outputs[name]
+		raise AttributeError("'%s' object has no attribute '%s'" % (
+			type(self).__name__, name))
+
+	def __setattr__(self, name, value):
+		if name in self.__dict__.get('_outputs', ()):
+			self.set_chan(name, value)
+		elif name in self.__dict__.get('_inputs', ()):
+			raise AttributeError("Input channel '%s' can not be set" % name)
+		else:
+			super(NIDAQ, self).__setattr__(name, value)
+
 	def get_chan(self, chan):
-		return getattr(self._daq,chan).read().magnitude
+		return self.read_channels([chan])[0]
 	
 	def set_chan(self, chan, value):
-		setattr(self, '_%s' %chan, value)
-		getattr(self._daq,chan).write('%sV' %value)
\ No newline at end of file
+		self.write_channels({chan: value})
+
+	def _task(self, channels):
+		""" Returns the task of the channels, which is created once """
+		key = tuple(channels)
+		if key not in self._tasks:
+			self._tasks[key] = ni.Task(
+				*[getattr(self._daq, chan) for chan in channels])
+		return self._tasks[key]
+
+	def read_channels(self, channels):
+		""" Returns a numpy array of the voltages of the analog input
+		channels, which are read together with one task.
+
+		:param channels: A list of the channel names, such as :code:`'ai0'`
+		"""
+		data = self._task(channels).read()
+		return np.array([np.atleast_1d(data[chan].to('V').magnitude)[-1]
+						 for chan in channels], dtype=np.float64)
+
+	def write_channels(self, values):
+		""" Writes voltages to analog output channels together with
+		one task.
+
+		:param values: A dictionary of the voltages of the channels, such
+		               as :code:`{'ao0': 1.5}`
+		"""
+		channels = list(values)
+		voltages = u.Quantity(
+			np.array([values[chan] for chan in channels], dtype=np.float64),
+			'V')
+		self._task(channels).write(
+			{chan: voltages[i:i + 1] for i, chan in enumerate(channels)})
+		for chan in channels:
+			self._outputs[chan] = values[chan]
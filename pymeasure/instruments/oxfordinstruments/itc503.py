@@ -26,6 +26,7 @@ from time import sleep, time
 import numpy
 
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.stability import StabilityDetector
 from pymeasure.instruments.validators import strict_discrete_set, \
     truncated_range, strict_range
 
@@ -46,6 +47,11 @@ class ITC503(Instrument):
         itc.wait_for_temperature()      # Wait for the temperature to stabilize
         print(itc.temperature_1)        # Print the temperature at sensor 1
 
+        # Ramp through a programmed sweep while logging the temperature
+        itc.program_sweep([100, 200], sweep_time=10, hold_time=5)
+        for t, temperature, status in itc.run_sweep(interval=2):
+            print(t, temperature)
+
     """
 
     control_mode = Instrument.control(
@@ -236,11 +242,56 @@ class ITC503(Instrument):
 
         return
 
+    def wait_for_stable_temperature(self, tolerance=0.01, rate=1e-3,
+                                    window=60, interval=0.5, sensor=1,
+                                    timeout=3600, should_stop=lambda: False,
+                                    lookahead=0):
+        """
+        Wait for the ITC to become stable at the set-point temperature, as
+        predicted by a :class:`~pymeasure.instruments.stability.StabilityDetector`
+        that fits the recent temperatures with an exponential approach. Unlike
+        :meth:`~.wait_for_temperature`, this returns as soon as the temperature
+        and its predicted final value are within the tolerance, and it changes
+        slower than the rate, or as soon as they are predicted to be after the
+        lookahead.
+
+        :param tolerance: The maximum error in Kelvin of the temperature and
+                          the predicted final temperature
+        :param rate: The maximum rate of change in Kelvin per second
+        :param window: The time over which the temperatures are fitted.
+        :param interval: The time between temperature queries to the ITC.
+        :param sensor: The sensor to read, either 1 or 2.
+        :param timeout: The maximum time the waiting is allowed to take. If
+                        timeout is exceeded, a TimeoutError is raised. If
+                        timeout is set to None, no timeout will be used.
+        :param should_stop: Optional function (returning a bool) to allow the
+                            waiting to be stopped before its end.
+        :param lookahead: The time ahead at which the temperature and its rate
+                          are predicted.
+        :returns: True if the temperature is stable, False if the waiting
+                  was stopped.
+        """
+        temperature_name = "temperature_%d" % sensor
+        detector = StabilityDetector(self.temperature_setpoint, tolerance,
+                                     rate, window, lookahead=lookahead)
+        try:
+            return self.wait_for(
+                lambda: detector.update(time(), getattr(self, temperature_name)),
+                timeout=timeout, should_stop=should_stop,
+                interval=interval, max_interval=interval
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                "Timeout expired while waiting for the Oxford ITC503 to "
+                "stabilize at the set-point temperature"
+            )
+
     def program_sweep(self, temperatures, sweep_time, hold_time, steps=None):
         """
         Program a temperature sweep in the controller. Stops any running sweep.
         After programming the sweep, it can be started using
-        OxfordITC503.sweep_status = 1.
+        OxfordITC503.sweep_status = 1, or run while logging the temperature
+        using :meth:`~.run_sweep`.
 
         :param temperatures: An array containing the temperatures for the sweep
         :param sweep_time: The time (or an array of times) to sweep to a
@@ -303,3 +354,43 @@ class ITC503(Instrument):
 
             self.ypointer = 3
             self.sweep_table = hold
+
+    def run_sweep(self, interval=1, sensor=1, timeout=None,
+                  should_stop=lambda: False):
+        """
+        Start the sweep programmed with :meth:`~.program_sweep`, and yield
+        the elapsed time in seconds, the temperature and the sweep status
+        every interval while the controller ramps, so that the data can be
+        logged during the sweep. The generator ends with the sweep, and the
+        sweep is stopped if the generator is closed or should_stop returns
+        True before the end.
+
+        :param interval: The time between temperature queries to the ITC.
+        :param sensor: The sensor to read, either 1 or 2.
+        :param timeout: The maximum time the sweep is allowed to take. If
+                        timeout is exceeded, a TimeoutError is raised.
+        :param should_stop: Optional function (returning a bool) to allow the
+                            sweep to be stopped before its end.
+        """
+        temperature_name = "temperature_%d" % sensor
+        finished = False
+        self.sweep_status = 1
+        t0 = time()
+        try:
+            while True:
+                status = self.sweep_status
+                yield time() - t0, getattr(self, temperature_name), status
+                if status == 0:
+                    finished = True
+                    return
+                if should_stop():
+                    return
+                if timeout is not None and (time() - t0) > timeout:
+                    raise TimeoutError(
+                        "Timeout expired while running the Oxford ITC503 "
+                        "sweep"
+                    )
+                sleep(interval)
+        finally:
+            if not finished:
+                self.sweep_status = 0
@@ -23,7 +23,8 @@
 #
 
 from pymeasure.instruments import Instrument
-from pymeasure.adapters import SerialAdapter
+from pymeasure.instruments.scan import record_motion
+from pymeasure.adapters.serial import SerialAdapter
 from time import sleep
 import re
 
@@ -92,6 +93,57 @@ class ParkerGV6(Instrument):
         """ Returns True if the motor is currently moving """
         return self.position is None
 
+    def motion_status(self):
+        """ Returns a tuple of whether the motor is moving, the position
+        and the position error in counts, from a single combined query,
+        where the position and error are None on error
+        """
+        response = self.ask("TAS:TPE:TPER")
+        status = re.search(r'(?<=TAS)[01_]+', response)
+        position = re.search(r'(?<=TPE)-?\d+', response)
+        error = re.search(r'(?<=TPER)-?\d+', response)
+        # Bit 1 of the axis status is set while the motor is moving
+        moving = status is None or status.group(0).replace('_', '')[0] == '1'
+        return (
+            moving,
+            None if position is None else int(position.group(0)),
+            None if error is None else int(error.group(0))
+        )
+
+    def move_to(self, counts, should_stop=lambda: False, timeout=60,
+                interval=0.05, record_interval=None):
+        """ Moves the motor to a setpoint in counts, sending the setpoint
+        and the move in one command string, and blocks until the motion is
+        done, with a single status query per check. If a
+        :code:`record_interval` is given, the position and position error
+        are logged at that rate during the motion.
+
+        :param counts: The setpoint in counts
+        :param should_stop: A function that returns True to stop waiting early
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param interval: The time in seconds between checks, when not recording
+        :param record_interval: The time in seconds between logged samples,
+                                or None to not log the motion
+        :returns: A structured numpy array with the fields 'time', 'position'
+                  and 'position_error' if recording, otherwise False if
+                  should_stop stopped the waiting
+        """
+        self.write("D%d:GO" % int(counts))
+        if record_interval is None:
+            return self.wait_for(lambda: not self.motion_status()[0],
+                                 timeout=timeout, should_stop=should_stop,
+                                 interval=interval, max_interval=interval)
+
+        def status():
+            moving, position, error = self.motion_status()
+            return not moving, [
+                float('nan') if value is None else value
+                for value in (position, error)
+            ]
+
+        return record_motion(status, ['position', 'position_error'],
+                             record_interval, should_stop, timeout)
+
     @property
     def angle(self):
         """ Returns the angle in degrees based on the position
@@ -22,8 +22,6 @@
 # THE SOFTWARE.
 #
 
-import visa
-
 
 def list_resources():
     """
@@ -38,6 +36,7 @@ def list_resources():
         dmm = Agilent34410(resources[0])
     
     """
+    import visa
     rm = visa.ResourceManager()
     instrs = rm.list_resources()
     for n, instr in enumerate(instrs):
@@ -30,7 +30,7 @@ from pymeasure.instruments import (Instrument,
                                    RangeException)
 from pymeasure.instruments.validators import (strict_discrete_set,
                                               truncated_discrete_set,
-                                              strict_range)
+                                              strict_range, DiscreteSet)
 import numpy as np
 
 ######
@@ -69,6 +69,10 @@ class RohdeFSQ(Instrument):
 
     """
 
+    # Commands that change the frequencies of the sweep
+    SWEEP_COMMANDS = ("FREQ", "POIN", "*RST", "SYST:PRES")
+    CACHE_COMMANDS = {'_frequencies': SWEEP_COMMANDS}
+
     def __init__(self, resourceName, **kwargs):
         super().__init__(
             resourceName,
@@ -76,6 +80,7 @@ class RohdeFSQ(Instrument):
             **kwargs
         )
         self.freq_unit = "GHz"
+        self._frequencies = None
 
 #################
 # SENSE SUBSYSTEM
@@ -183,6 +188,23 @@ class RohdeFSQ(Instrument):
     def freq_stop(self, value):
         self.write(":FREQ:STOP {}{}".format(value, self.freq_unit))
 
+    @property
+    def frequencies(self):
+        """
+        Returns a numpy array of the frequencies in Hz of the sweep points. The array is cached until a command changes the sweep, so changes made from the front panel are not detected.
+
+        .. code-block:: python
+
+            freqs = sa.frequencies
+        """
+        if self._frequencies is None:
+            self._frequencies = np.linspace(
+                float(self.ask(":FREQ:STAR?")),
+                float(self.ask(":FREQ:STOP?")),
+                int(float(self.ask("SWE:POIN?")))
+            )
+        return self._frequencies
+
     #########
     # AVERAGE
     #########
@@ -200,7 +222,7 @@ class RohdeFSQ(Instrument):
             sa.average_count            # returns numeric value
         """,
         validator=truncated_discrete_set,
-        values=np.arange(0, 32767, 1),
+        values=DiscreteSet(np.arange(0, 32767, 1)),
         map_values=False,
         check_get_errors=True,
         check_set_errors=True
@@ -258,7 +280,7 @@ class RohdeFSQ(Instrument):
             sa.sweep_count            # returns numeric value
         """,
         validator=truncated_discrete_set,
-        values=np.arange(0, 32767, 1),
+        values=DiscreteSet(np.arange(0, 32767, 1)),
         map_values=False,
         check_get_errors=True,
         check_set_errors=True
@@ -388,6 +410,51 @@ class RohdeFSQ(Instrument):
         else:
             self.write('INIT;*OPC?')
 
+    #######
+    # TRACE
+    #######
+
+    def trace(self, num=1):
+        """
+        This command reads out the data of a trace (1 to 6) as a numpy array, from a binary transfer of 32-bit floating point values. The values are in the unit selected by :attr:`~.RohdeFSQ.power_unit`.
+
+        .. code-block:: python
+
+            power = sa.trace(1)
+        """
+        num_value = strict_range(num, [1, 6])
+        self.write("FORM REAL,32;:FORM:BORD SWAP")
+        return self.binary_block("TRAC:DATA? TRACE{:d}".format(int(num_value)), '<f4')
+
+    def waterfall(self, traces, should_stop=lambda: False, num=1, sweeps=None, timeout=60, out=None):
+        """
+        Takes single sweeps and yields each trace as a row of a ring buffer of shape :code:`(traces, points)`, which is allocated up front. The trace of sweep :code:`i` is stored in row :code:`i % traces`, so that the ring buffer can be displayed as an image while each trace is emitted. The continuous mode is switched off.
+
+        :param traces: Number of traces in the ring buffer.
+        :param should_stop: A function that returns True when no more sweeps should be taken.
+        :param num: Trace number (1 to 6).
+        :param sweeps: Number of sweeps, or None to sweep until stopped.
+        :param timeout: Time in seconds to wait for each sweep.
+        :param out: Float array of shape :code:`(traces, points)` to write the traces into, or None to allocate it.
+
+        .. code-block:: python
+
+            image = np.zeros((100, sa.sweep_points))
+            for trace in sa.waterfall(100, procedure.should_stop, out=image):
+                procedure.emit_block('results', {
+                    'Frequency (Hz)': sa.frequencies, 'Power (dBm)': trace})
+        """
+        if out is None:
+            out = np.empty((traces, len(self.frequencies)), np.float64)
+        self.continuous_mode = 'OFF'
+        sweep = 0
+        while (sweeps is None or sweep < sweeps) and not should_stop():
+            self._ask_opc(timeout, "INIT;*OPC?")
+            row = out[sweep % traces]
+            row[:] = self.trace(num)
+            yield row
+            sweep += 1
+
 ###########
 # CALCULATE
 ###########
@@ -432,7 +499,7 @@ class RohdeFSQ(Instrument):
             sa.nharmonics = 3
         """,
         validator=truncated_discrete_set,
-        values=np.arange(1, 26, 1),
+        values=DiscreteSet(np.arange(1, 26, 1)),
     )
 
     def get_harmonics(self, harmonic_power='Relative'):
@@ -530,6 +597,26 @@ class RohdeFSQ(Instrument):
         value = self.ask("CALC:MARK{}:Y?".format(num_value))
         return float(value)
 
+    def get_markers(self, *nums):
+        """
+        This command queries the frequency and the measured value of the selected markers with a single query. This is only possible in single-sweep mode.
+
+        :param nums: Markers whose values need to be obtained.
+
+        :returns value: Frequency in Hz and power output of each marker.
+
+        :rtype: List of tuples
+
+        .. code-block:: python
+
+            (f1, p1), (f2, p2) = sa.get_markers(1, 2)
+        """
+        num_values = [_validate_marker_number(num) for num in nums]
+        read_value = self.ask(";".join(
+            ":CALC:MARK{0}:X?;:CALC:MARK{0}:Y?".format(num) for num in num_values))
+        values = [float(x) for x in read_value.split(';')]
+        return list(zip(values[::2], values[1::2]))
+
     def all_markers_off(self):
         """
         This command switches off all active markers in the indicated measurement window.
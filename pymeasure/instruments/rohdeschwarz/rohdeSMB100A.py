@@ -27,10 +27,12 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import (Instrument,
+                                   InstrumentError,
                                    RangeException)
+from pymeasure.instruments.listsweep import ListSweepMixin
 from pymeasure.instruments.validators import (strict_discrete_set,
                                               truncated_discrete_set,
-                                              strict_range)
+                                              strict_range, DiscreteSet)
 import numpy as np
 
 ######
@@ -38,7 +40,7 @@ import numpy as np
 ######
 
 
-class RohdeSMB100A(Instrument):
+class RohdeSMB100A(ListSweepMixin, Instrument):
     """ Instrument code to control a Rohde & Schwarz SMB100A RF Signal Generator.
 
     .. code-block:: python
@@ -66,8 +68,34 @@ class RohdeSMB100A(Instrument):
         # turn off signal
         sig.output = "OFF"
 
+    Frequency hopping is faster in list mode, where the points are uploaded
+    in bulk and stepped through by the instrument.
+
+    .. code-block:: python
+
+        sig.config_list_sweep(np.linspace(1e9, 2e9, 101), powers=-20,
+                              trigger='bus')
+        sig.start_list_sweep()
+        for i in range(101):
+            sig.trigger() # steps to the next point
+            # perform any measurements needed.
+        sig.stop_list_sweep()
+
     """
 
+    FREQUENCY_RANGE = [9e3, 40e9]
+    POWER_RANGE = [-145, 30]
+    DWELL_RANGE = [1e-3, 100]
+    LIST_DWELL_POINTS = False
+    MAX_LIST_POINTS = 10000
+    LIST_TRIGGERS = {
+        'immediate': ('AUTO', 'AUTO'),
+        'bus': ('STEP', 'SING'),
+        'external': ('STEP', 'EXT')
+    }
+    LIST_START_COMMAND = "SOUR:LIST:RES;:SOUR:FREQ:MODE LIST"
+    LIST_STOP_COMMAND = "SOUR:FREQ:MODE CW"
+
     def __init__(self, resourceName, **kwargs):
         super().__init__(
             resourceName,
@@ -108,7 +136,7 @@ class RohdeSMB100A(Instrument):
             sig.power_offset = 5
         """,
         validator=truncated_discrete_set,
-        values=np.arange(-100, 100, 0.01),
+        values=DiscreteSet(np.arange(-100, 100, 0.01)),
         check_set_errors=True,
         check_get_errors=True
     )
@@ -188,6 +216,48 @@ class RohdeSMB100A(Instrument):
         check_get_errors=True
     )
 
+###########
+# LIST MODE
+###########
+
+    def config_list_sweep(self, frequencies, powers=None, dwell=None,
+                          trigger='bus', name='pymeasure'):
+        """
+        Configures a list sweep through arrays of frequencies and powers, which are uploaded in bulk to a list file on the instrument.
+
+        The sweep is started with :meth:`~.RohdeSMB100A.start_list_sweep`, after which each point is stepped to by the trigger source: the dwell time ('immediate'), a :code:`*TRG` from :meth:`~.RohdeSMB100A.trigger` ('bus'), or the trigger input ('external'). The frequencies are always in Hz, regardless of `freq_unit`, and the powers are in the :meth:`~.RohdeSMB100A.power_unit`.
+
+        .. code-block:: python
+
+            sig.config_list_sweep(np.linspace(1e9, 2e9, 101), powers=-20, dwell=10e-3, trigger='immediate')
+
+        :param frequencies: An array of frequencies in Hz
+        :param powers: An array of powers, or a single power for all of the points, otherwise the current `power_level` is used
+        :param dwell: A dwell time in seconds, which is the same for all of the points
+        :param trigger: The point trigger, either 'immediate', 'bus', or 'external'
+        :param name: The name of the list file
+        :raises: ValueError if the points are outside of the instrument ranges
+        :raises: :class:`~pymeasure.errors.InstrumentError` if the instrument rejects the list
+        """
+        super().config_list_sweep(frequencies, powers, dwell, trigger, name=name)
+
+    def _write_list_sweep(self, frequencies, powers, dwell, trigger, name):
+        mode, source = trigger
+        if powers is None:
+            powers = np.full(frequencies.shape, float(self.power_level))
+        commands = ["SOUR:LIST:SEL '%s'" % name,
+                    "SOUR:LIST:FREQ " + self._list_values(frequencies),
+                    "SOUR:LIST:POW " + self._list_values(powers)]
+        if dwell is not None:
+            commands.append("SOUR:LIST:DWEL %r" % float(dwell))
+        commands += ["SOUR:LIST:MODE %s" % mode,
+                     "SOUR:LIST:TRIG:SOUR %s" % source]
+        self.write(";:".join(commands))
+        errors = self.sync_errors()
+        if errors:
+            raise InstrumentError("{} could not configure the list sweep: {}".format(
+                self.name, "; ".join(message for _, message, _ in errors)))
+
 #########
 # GENERAL
 #########
@@ -0,0 +1,161 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from time import sleep, time
+
+import numpy as np
+
+
+def continuous_scan(position, measurables, is_done, interval=0,
+                    should_stop=lambda: False, timeout=None,
+                    callback=lambda record: None):
+    """ Samples measurables while an actuator moves at a constant rate,
+    instead of stepping, settling and measuring at each point. Each sample
+    records a host timestamp, the position (or field, current, etc.) that
+    the actuator reports, and the values of the measurables. Sampling ends
+    once :code:`is_done` returns True, after a final sample at the end
+    point. The samples can be averaged onto a grid with :func:`bin_scan`.
+    Instruments can wrap this function with a reliable :code:`is_done`, such
+    as :meth:`AMI430.scan_field <pymeasure.instruments.ami.AMI430.scan_field>`.
+
+    .. code-block:: python
+
+        records = magnet.scan_field(1, 0.01, {'voltage': lambda: meter.voltage})
+        binned = bin_scan(records, np.linspace(0, 1, 101))
+
+    :param position: A function that returns the position of the actuator
+    :param measurables: A dictionary of names and functions that return the
+                        measured values
+    :param is_done: A function that returns True once the actuator has stopped
+    :param interval: A minimum time in seconds between samples
+    :param should_stop: A function that returns True to stop sampling early
+    :param timeout: A time in seconds after which a TimeoutError is raised,
+                    or None to sample until the actuator stops
+    :param callback: A function that is called with each sample as a
+                     dictionary, such as to emit the data while scanning
+    :returns: A structured numpy array with the fields 'time', 'position',
+              and the names of the measurables
+    """
+    names = ['time', 'position'] + list(measurables)
+    records = []
+    start = time()
+    while True:
+        sampled = time()
+        done = is_done()
+        record = [sampled - start, position()]
+        record += [measure() for measure in measurables.values()]
+        records.append(tuple(record))
+        callback(dict(zip(names, record)))
+        if done or should_stop():
+            break
+        if timeout is not None and time() - start > timeout:
+            raise TimeoutError("Timed out after %g seconds waiting for the "
+                               "continuous scan to finish" % timeout)
+        remaining = interval - (time() - sampled)
+        if remaining > 0:
+            sleep(remaining)
+    return np.array(records, dtype=[(name, float) for name in names])
+
+
+def bin_scan(records, grid, field='position'):
+    """ Averages the samples of a :func:`continuous_scan` onto a grid of
+    positions, assigning each sample to the nearest grid point. Samples
+    more than half a grid spacing beyond the ends of the grid are dropped,
+    and grid points without samples are NaN.
+
+    :param records: A structured numpy array of samples
+    :param grid: An array of the positions to bin onto, in increasing or
+                 decreasing order
+    :param field: The name of the field of positions
+    :returns: A structured numpy array with the same fields, where the
+              positions are the grid, and a 'count' field of the number of
+              samples in each bin
+    """
+    grid = np.asarray(grid, dtype=float)
+    order = np.argsort(grid)
+    centers = grid[order]
+    if len(centers) > 1:
+        half = np.diff(centers) / 2
+        edges = np.concatenate([[centers[0] - half[0]], centers[:-1] + half,
+                                [centers[-1] + half[-1]]])
+    else:
+        edges = np.array([-np.inf, np.inf])
+    positions = records[field]
+    bins = np.searchsorted(edges, positions, side='right') - 1
+    valid = (bins >= 0) & (bins < len(centers))
+    bins = bins[valid]
+    counts = np.bincount(bins, minlength=len(centers))
+
+    names = [name for name in records.dtype.names if name != 'count']
+    result = np.empty(len(grid), dtype=[(name, float) for name in names] +
+                      [('count', int)])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for name in names:
+            sums = np.bincount(bins, weights=records[name][valid],
+                               minlength=len(centers))
+            result[name][order] = np.where(counts > 0, sums / counts, np.nan)
+    result[field] = grid
+    result['count'][order] = counts
+    return result
+
+
+def record_motion(status, names, interval=0.01, should_stop=lambda: False,
+                  timeout=None, size=1024):
+    """ Records values at a fixed rate into a numpy buffer while a motion is
+    in progress, with a single call to the :code:`status` function per
+    cycle, so that one combined query reports both whether the motion is
+    done and the values to record (e.g. positions and following errors).
+    The buffer is preallocated and doubled in size when it is full.
+
+    :param status: A function that returns a tuple of a boolean that is True
+                   once the motion is done, and a sequence of the values
+    :param names: The names of the values
+    :param interval: The time in seconds between samples
+    :param should_stop: A function that returns True to stop recording early
+    :param timeout: A time in seconds after which a TimeoutError is raised,
+                    or None to record until the motion is done
+    :param size: The initial number of samples in the buffer
+    :returns: A structured numpy array with the fields 'time' and the names
+    """
+    buffer = np.empty(size, dtype=[('time', float)] +
+                      [(name, float) for name in names])
+    count = 0
+    start = time()
+    deadline = start
+    while True:
+        sampled = time()
+        done, values = status()
+        if count == len(buffer):
+            buffer = np.resize(buffer, 2*len(buffer))
+        buffer[count] = (sampled - start,) + tuple(values)
+        count += 1
+        if done or should_stop():
+            break
+        if timeout is not None and sampled - start > timeout:
+            raise TimeoutError("Timed out after %g seconds waiting for the "
+                               "motion to finish" % timeout)
+        # Samples are scheduled at a fixed rate, without accumulating delays
+        deadline = max(deadline + interval, time())
+        sleep(max(0, deadline - time()))
+    return buffer[:count].copy()
@@ -0,0 +1,161 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+import numpy as np
+
+
+class DSPBuffer(object):
+    """ Implements the curve buffer found in the Signal Recovery and
+    Ametek DSP lock-in amplifiers, which stores the quantities selected
+    by :meth:`~.set_buffer` at a fixed interval.
+
+    Each curve is read with a single binary dump (:code:`DCB`) of its
+    integer values, which are scaled to Volts and degrees. Simultaneous
+    values of the outputs are read with :meth:`~.snap`.
+    """
+
+    # Bits of the quantities in the curve buffer definition (CBD)
+    curve_bits = {
+        'x': 1,
+        'y': 2,
+        'mag': 4,
+        'phase': 8,
+        'ADC1': 32,
+        'ADC2': 64,
+        'ADC3': 128
+    }
+
+    def set_buffer(self, points, quantities=['x'], interval=10.0e-3):
+        """ Configures the curve buffer to store a number of points of the
+        quantities, which are taken at an interval in seconds.
+
+        :param points: The number of points in the buffer
+        :param quantities: A list of the quantities to store, from
+                           :attr:`curve_bits`
+        :param interval: The time between points in seconds, in increments
+                         of 5 ms
+        """
+        num = 0
+        for q in quantities:
+            num += self.curve_bits[q]
+        self.points = points
+        self.write("CBD %d" % int(num))
+        self.write("LEN %d" % int(points))
+        # interval in increments of 5ms
+        interval = int(float(interval)/5.0e-3)
+        self.write("STR %d" % interval)
+        self.write("NC")
+
+    def start_buffer(self):
+        """ Starts taking points in the curve buffer. """
+        self.write("TD")
+
+    def is_buffer_done(self):
+        """ Returns True if the curve buffer is not taking points. """
+        return int(self.values("M")[0]) == 0
+
+    @property
+    def buffer_count(self):
+        """ Returns the number of points stored in the curve buffer. """
+        return int(self.values("M")[3])
+
+    def get_buffer(self, quantity='x', timeout=1.00, average=False):
+        """ Waits for the curve buffer to finish, and returns the points of
+        a quantity as a numpy array, read with a single binary transfer.
+        Returns :code:`[0.0]` if the buffer is not finished in time.
+
+        :param quantity: The quantity to read, from :attr:`curve_bits`
+        :param timeout: A time in seconds to wait for the buffer to finish
+        :param average: Toggles returning the mean of the points instead
+        """
+        try:
+            self.wait_for(self.is_buffer_done, timeout=timeout,
+                          interval=0.05, max_interval=0.05)
+        except TimeoutError:
+            log.warning("Timed out waiting for the %s curve buffer" %
+                        self.name)
+            return [0.0]
+        data = self.buffer_records(quantity)
+        if average:
+            return np.mean(data)
+        else:
+            return data
+
+    def buffer_records(self, quantity='x'):
+        """ Returns the points of a quantity in the curve buffer as a numpy
+        array, from a single binary dump (:code:`DCB`) of the curve instead
+        of a query for each point.
+
+        :param quantity: The quantity to read, from :attr:`curve_bits`
+        """
+        points = self.buffer_count
+        if points == 0:
+            return np.empty(0, np.float64)
+        # The curves are selected by their bit number
+        self.write("DCB %d" % (self.curve_bits[quantity].bit_length() - 1))
+        data = np.frombuffer(self.adapter.read_bytes(2*points), dtype='>i2')
+        return data*self._curve_scale(quantity)
+
+    def _curve_scale(self, quantity):
+        """ Returns the factor that converts the integer curve values of
+        a quantity into Volts or degrees.
+        """
+        if quantity in ('x', 'y', 'mag'):
+            # 10000 represents the full scale
+            return self.sensitivity/10000.
+        elif quantity == 'phase':
+            # Hundredths of a degree
+            return 1e-2
+        elif quantity in ('ADC1', 'ADC2'):
+            # Millivolts
+            return 1e-3
+        return 1.
+
+    def snap(self, quantities=('x', 'y', 'mag', 'phase')):
+        """ Returns a dictionary of the quantities :code:`'x'`, :code:`'y'`,
+        :code:`'mag'` and :code:`'phase'`, which are calculated from a single
+        query of the :attr:`xy` property, so that they are simultaneous.
+
+        .. code-block:: python
+
+            values = lockin.snap(('x', 'y'))
+            values['x']     # X in Volts
+
+        :param quantities: The quantities to return
+        """
+        x, y = self.xy
+        record = {
+            'x': x, 'y': y,
+            'mag': np.hypot(x, y),
+            'phase': np.degrees(np.arctan2(y, x)),
+        }
+        for quantity in quantities:
+            if quantity not in record:
+                raise ValueError("%s snapshot quantity '%s' is invalid" % (
+                                 self.name, quantity))
+        return {quantity: record[quantity] for quantity in quantities}
@@ -23,10 +23,11 @@
 
 #
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.listsweep import ListSweepMixin
 from pymeasure.instruments.validators import truncated_range
 
 
-class SG380(Instrument):
+class SG380(ListSweepMixin, Instrument):
 
     MOD_TYPES_VALUES = ['AM', 'FM', 'PM', 'SWEEP', 'PULSE', 'BLANK', 'IQ']
 
@@ -36,6 +37,20 @@ class SG380(Instrument):
 
     MAX_RF = 4E9
 
+    # List sweeps are checked against the range of the frequency doubler,
+    # and the list is stepped by *TRG or the rear-panel trigger input only
+    FREQUENCY_RANGE = [MIN_RF, 2*MAX_RF]
+
+    POWER_RANGE = [-110, 16.5]
+
+    MAX_LIST_POINTS = 2000
+
+    LIST_TRIGGERS = {'bus': None, 'external': None}
+
+    LIST_START_COMMAND = "LSTI0;LSTE1"
+
+    LIST_STOP_COMMAND = "LSTE0"
+
     # TODO: restrict modulation depth to allowed values (depending on
     # frequency)
     fm_dev = Instrument.control(
@@ -110,3 +125,18 @@ class SG380(Instrument):
         else:
             index = SG380.MOD_FUNCTIONS.index(function)
         self.write("MFNC%d" % index)
+
+    def _write_list_sweep(self, frequencies, powers, dwell, trigger):
+        if frequencies.max() > SG380.MAX_RF and not self.has_doubler:
+            raise ValueError("SG380 list sweeps above %g Hz require the "
+                             "frequency doubler" % SG380.MAX_RF)
+        if powers is None:
+            powers = ["N"] * len(frequencies)
+        else:
+            powers = [repr(p) for p in powers.tolist()]
+        self.write("LSTD")
+        self.write("LSTC%d" % len(frequencies))
+        for i, (frequency, power) in enumerate(zip(frequencies.tolist(), powers)):
+            # Points are frequency, phase, LF amplitude and offset, RF
+            # amplitude, followed by ten unchanged settings
+            self.write("LSTP%d,%r,N,N,N,%s%s" % (i, frequency, power, ",N" * 10))
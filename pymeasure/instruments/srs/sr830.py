@@ -51,6 +51,12 @@ class SR830(Instrument):
     EXPANSION_VALUES = [1, 10, 100]
     RESERVE_VALUES = ['High Reserve', 'Normal', 'Low Noise']
     CHANNELS = ['X', 'Y', 'R']
+    SNAP_OUTPUTS = [
+        'x', 'y', 'r', 'theta', 'aux in 1', 'aux in 2', 'aux in 3',
+        'aux in 4', 'frequency', 'ch1', 'ch2'
+    ]
+    # Number of points stored for each channel in the buffer
+    BUFFER_SIZE = 16383
 
     sine_voltage = Instrument.control(
         "SLVL?", "SLVL%0.3f",
@@ -133,6 +139,28 @@ class SR830(Instrument):
             **kwargs
         )
 
+    def snap(self, outputs=('x', 'y', 'r', 'theta')):
+        """ Returns a dictionary of 2 to 6 outputs from a single
+        :code:`SNAP?` query, so that the values are taken at the same
+        time. The outputs are named in :attr:`SNAP_OUTPUTS`.
+
+        .. code-block:: python
+
+            values = lockin.snap(('x', 'y', 'frequency'))
+            values['x']     # X in Volts
+
+        :param outputs: The names of the outputs to return
+        """
+        if not 2 <= len(outputs) <= 6:
+            raise ValueError('SR830 snapshot takes 2 to 6 outputs')
+        for output in outputs:
+            if output not in self.SNAP_OUTPUTS:
+                raise ValueError("SR830 snapshot output '%s' is invalid" %
+                                 output)
+        values = self.values("SNAP?%s" % ",".join(
+            str(self.SNAP_OUTPUTS.index(output) + 1) for output in outputs))
+        return dict(zip(outputs, values))
+
     def auto_gain(self):
         self.write("AGAN")
 
@@ -238,45 +266,179 @@ class SR830(Instrument):
             return int(query)
 
     def fill_buffer(self, count, has_aborted=lambda: False, delay=0.001):
+        """ Starts the buffer and returns the two channels of :code:`count`
+        points as numpy arrays, which are read as the buffer fills through
+        :meth:`~.stream_buffer`. If :code:`has_aborted` stops the
+        acquisition, the arrays are cut to the points read.
+
+        :param count: The number of points to acquire
+        :param has_aborted: A function that returns True if the acquisition should stop
+        :param delay: The maximum time in seconds between checks of the buffer
+        """
+        return self.acquire_buffer(count, should_stop=has_aborted,
+                                   interval=delay)
+
+    def buffer_measure(self, count, stopRequest=None, delay=1e-3):
+        """ Acquires :code:`count` points in the buffer and returns the
+        mean and standard deviation of both channels, or zeros if the
+        :code:`stopRequest` event is set before the acquisition is complete.
+
+        :param count: The number of points to acquire
+        :param stopRequest: A :class:`threading.Event` that stops the acquisition
+        :param delay: The maximum time in seconds between checks of the buffer
+        """
+        if stopRequest is None:
+            should_stop = lambda: False
+        else:
+            should_stop = stopRequest.is_set
+        ch1, ch2 = self.acquire_buffer(count, should_stop=should_stop,
+                                       interval=delay)
+        if len(ch1) < count:
+            return (0, 0, 0, 0)
+        return (ch1.mean(), ch1.std(), ch2.mean(), ch2.std())
+
+    def acquire_buffer(self, count, should_stop=lambda: False, callback=None,
+                       fast=False, timeout=60, interval=0.05):
+        """ Acquires :code:`count` points of both channels through
+        :meth:`~.stream_buffer`, and returns them as two numpy arrays.
+        The :code:`callback` is called with each new chunk of both channels,
+        for example to update a live plot. If :code:`should_stop` stops
+        the acquisition, the arrays are cut to the points read.
+
+        .. code-block:: python
+
+            ch1, ch2 = lockin.acquire_buffer(
+                20000, should_stop=procedure.should_stop,
+                callback=lambda x, y: procedure.emit('progress', ...)
+            )
+
+        :param count: The number of points to acquire
+        :param should_stop: A function that returns True when the acquisition should stop
+        :param callback: A function called with the new points of each channel,
+                         or None
+        :param fast: Toggles streaming the points in the :code:`FAST2` mode
+        :param timeout: A time in seconds without new points after which a
+                        TimeoutError is raised
+        :param interval: The maximum time in seconds between checks of the buffer
+        """
         ch1 = np.empty(count, np.float32)
         ch2 = np.empty(count, np.float32)
-        currentCount = self.buffer_count
         index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.buffer_data(1, index, currentCount)
-                ch2[index:currentCount] = self.buffer_data(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if has_aborted():
-                self.pause_buffer()
-                return ch1, ch2
-        self.pauseBuffer()
-        ch1[index:count+1] = self.buffer_data(1, index, count)
-        ch2[index:count+1] = self.buffer_data(2, index, count)
-        return ch1, ch2
+        for chunk1, chunk2 in self.stream_buffer(
+                count, should_stop=should_stop, fast=fast, timeout=timeout,
+                interval=interval, out=(ch1, ch2)):
+            index += len(chunk1)
+            if callback is not None:
+                callback(chunk1, chunk2)
+        return ch1[:index], ch2[:index]
 
-    def buffer_measure(self, count, stopRequest=None, delay=1e-3):
-        self.write("FAST0;STRD")
-        ch1 = np.empty(count, np.float64)
-        ch2 = np.empty(count, np.float64)
-        currentCount = self.buffer_count
+    def stream_buffer(self, count, should_stop=lambda: False, fast=False,
+                      timeout=60, interval=0.05, out=None):
+        """ Resets and starts the buffer, and returns a generator that yields
+        the points of both channels added since the previous yield, as numpy
+        arrays. Each chunk of a channel is read with a single binary
+        :code:`TRCB` transfer, into arrays of :code:`count` points that are
+        allocated up front. The buffer is paused once :code:`count` points
+        are yielded, or :code:`should_stop` returns True.
+
+        The buffer holds :attr:`BUFFER_SIZE` points, so longer acquisitions
+        restart it each time it fills, which misses a few samples unless
+        the samples are triggered. In the :code:`fast` mode the points are
+        instead streamed continuously over GPIB (:code:`FAST2`), as X and Y
+        in Volts from the sensitivity, without applying offsets or expands.
+        The sample frequency should be at most 512 Hz in this mode.
+
+        .. code-block:: python
+
+            for x, y in lockin.stream_buffer(1000, procedure.should_stop):
+                procedure.emit('results', ...)
+
+        :param count: The number of points to acquire
+        :param should_stop: A function that returns True when the acquisition should stop
+        :param fast: Toggles streaming the points in the :code:`FAST2` mode
+        :param timeout: A time in seconds without new points after which a
+                        TimeoutError is raised
+        :param interval: The maximum time in seconds between checks of the buffer
+        :param out: A tuple of two float32 arrays of :code:`count` points to
+                    read the channels into, or None to allocate them
+        """
+        if out is None:
+            out = (np.empty(count, np.float32), np.empty(count, np.float32))
+        if fast:
+            return self._stream_fast(count, should_stop, out)
+        return self._stream_buffer(count, should_stop, timeout, interval, out)
+
+    def _stream_buffer(self, count, should_stop, timeout, interval, out):
+        ch1, ch2 = out
+        self.write("REST;SEND0;FAST0;STRD")
+        index = 0  # Points read in total
+        offset = 0  # Points read before the buffer was last restarted
+        try:
+            while index < count:
+                if not self.wait_for(
+                        lambda: self.buffer_count > index - offset,
+                        timeout=timeout, should_stop=should_stop,
+                        max_interval=interval):
+                    return
+                stored = min(self.buffer_count, count - offset)
+                start = index - offset
+                end = offset + stored
+                ch1[index:end] = self.get_buffer(1, start, stored)
+                ch2[index:end] = self.get_buffer(2, start, stored)
+                yield ch1[index:end], ch2[index:end]
+                index = end
+                if stored >= self.BUFFER_SIZE and index < count:
+                    # The buffer stops once full, so it is restarted
+                    self.write("REST;STRT")
+                    offset = index
+        finally:
+            self.pause_buffer()
+
+    def _stream_fast(self, count, should_stop, out, points_per_read=64):
+        ch1, ch2 = out
+        scale = self.sensitivity / 30000.
+        self.write("REST;SEND0;FAST2;STRD")
         index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.buffer_data(1, index, currentCount)
-                ch2[index:currentCount] = self.buffer_data(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if stopRequest is not None and stopRequest.isSet():
-                self.pauseBuffer()
-                return (0, 0, 0, 0)
-        self.pauseBuffer()
-        ch1[index:count] = self.buffer_data(1, index, count)
-        ch2[index:count] = self.buffer_data(2, index, count)
-        return (ch1.mean(), ch1.std(), ch2.mean(), ch2.std())
+        try:
+            while index < count and not should_stop():
+                points = min(points_per_read, count - index)
+                data = np.frombuffer(self.adapter.read_bytes(4*points),
+                                     dtype='<i2').reshape(points, 2)
+                end = index + points
+                ch1[index:end] = data[:, 0]*scale
+                ch2[index:end] = data[:, 1]*scale
+                yield ch1[index:end], ch2[index:end]
+                index = end
+        finally:
+            self.write("PAUS;FAST0")
+
+    def arm_on_external(self, points, line=None):
+        """ Resets the buffer and arms it to store one point of both channels
+        on each rising edge at the rear panel trigger input (:code:`SRAT14`),
+        up to :code:`points` points. The points are read afterwards with
+        :meth:`~.triggered_records`. This is used by the
+        :class:`~pymeasure.instruments.trigger.TriggerCoordinator`.
+
+        :param points: The number of points, up to :attr:`BUFFER_SIZE`
+        :param line: Not used, since the SR830 has a single trigger input
+        """
+        if not 0 < points <= self.BUFFER_SIZE:
+            raise ValueError("SR830 triggered acquisitions require between "
+                             "1 and %d points" % self.BUFFER_SIZE)
+        self.write("REST;SEND0;FAST0;TSTR0;SRAT14;STRT")
+
+    def triggered_records(self):
+        """ Pauses the buffer and returns the points stored on the external
+        triggers armed by :meth:`~.arm_on_external`, as a structured numpy
+        array with the fields :code:`'ch1'` and :code:`'ch2'`, each from a
+        single binary transfer.
+        """
+        self.pause_buffer()
+        count = self.buffer_count
+        records = np.empty(count, dtype=[('ch1', np.float32), ('ch2', np.float32)])
+        records['ch1'] = self.get_buffer(1, 0, count)
+        records['ch2'] = self.get_buffer(2, 0, count)
+        return records
 
     def pause_buffer(self):
         self.write("PAUS")
@@ -289,23 +451,29 @@ class SR830(Instrument):
 
     def wait_for_buffer(self, count, has_aborted=lambda: False,
                         timeout=60, timestep=0.01):
-        """ Wait for the buffer to fill a certain count
+        """ Wait for the buffer to fill a certain count, and pause the
+        buffer. Returns False if :code:`has_aborted` stopped the waiting.
+
+        :param count: The number of points to wait for
+        :param has_aborted: A function that returns True if the process should stop waiting
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param timestep: The maximum time in seconds between checks of the buffer
         """
-        i = 0
-        while not self.buffer_count >= count and i < (timeout / timestep):
-            time.sleep(timestep)
-            i += 1
-            if has_aborted():
-                return False
-        self.pauseBuffer()
+        if not self.wait_for(lambda: self.buffer_count >= count,
+                             timeout=timeout, should_stop=has_aborted,
+                             max_interval=timestep):
+            return False
+        self.pause_buffer()
 
     def get_buffer(self, channel=1, start=0, end=None):
         """ Aquires the 32 bit floating point data through binary transfer
         """
         if end is None:
             end = self.buffer_count
+        if end <= start:
+            return np.empty(0, np.float32)
         return self.binary_values("TRCB?%d,%d,%d" % (
-                        channel, start, end-start))
+                        channel, start, end-start), dtype=np.dtype('<f4'))
 
     def reset_buffer(self):
         self.write("REST")
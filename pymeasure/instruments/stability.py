@@ -0,0 +1,127 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from collections import deque
+
+import numpy as np
+
+
+class StabilityDetector(object):
+    """ Detects when a quantity that settles towards a setpoint, such as the
+    temperature of a controlled stage, has become stable. The recent
+    trajectory is fitted online with an exponential approach,
+    :math:`dT/dt = (T_\\infty - T)/\\tau`, which predicts the final value
+    :math:`T_\\infty` and the present rate of change. The quantity is stable
+    once it is within the tolerance of the setpoint, the predicted final
+    value is within the tolerance, and the rate is below the maximum rate.
+    This does not require the quantity to stay in a band for a fixed time,
+    so that each setpoint of a sweep is reached sooner. With a lookahead,
+    the fit decides even earlier: the value and rate are those predicted
+    for the lookahead time in the future, so that the quantity is stable
+    once it is predicted to settle by then.
+
+    .. code-block:: python
+
+        detector = StabilityDetector(300, tolerance=0.05, rate=1e-3)
+        while not detector.update(time(), controller.temperature_A):
+            sleep(0.5)
+
+    :param setpoint: The value that the quantity is settling towards
+    :param tolerance: The maximum deviation from the setpoint, of both the
+                      present and the predicted final value
+    :param rate: The maximum rate of change per second
+    :param window: The time in seconds of the trajectory that is fitted
+    :param min_points: The minimum number of points in the window before
+                       the quantity can be stable
+    :param lookahead: The time in seconds ahead of the last point at which
+                      the value and rate are predicted by the fit
+    """
+
+    def __init__(self, setpoint, tolerance, rate, window=60, min_points=10,
+                 lookahead=0):
+        self.setpoint = setpoint
+        self.tolerance = tolerance
+        self.rate = rate
+        self.window = window
+        self.min_points = min_points
+        self.lookahead = lookahead
+        self.final_value = None
+        self.present_rate = None
+        self._points = deque()
+
+    def reset(self, setpoint=None):
+        """ Forgets the trajectory, for example after the setpoint changes.
+
+        :param setpoint: An optional new setpoint
+        """
+        if setpoint is not None:
+            self.setpoint = setpoint
+        self.final_value = None
+        self.present_rate = None
+        self._points.clear()
+
+    def update(self, time, value):
+        """ Adds a point to the trajectory and returns True if the quantity
+        is stable.
+
+        :param time: The time of the point in seconds
+        :param value: The value of the quantity
+        """
+        points = self._points
+        points.append((time, value))
+        while time - points[0][0] > self.window:
+            points.popleft()
+        if len(points) < max(self.min_points, 3):
+            return False
+        times, values = np.array(points, dtype=float).T
+        self.final_value, self.present_rate, decay = self._fit(times, values)
+        # The approach decays by the same factor in the value and the rate
+        factor = np.exp(-decay * self.lookahead)
+        value = self.final_value + (values[-1] - self.final_value) * factor
+        return bool(
+            abs(value - self.setpoint) <= self.tolerance and
+            abs(self.final_value - self.setpoint) <= self.tolerance and
+            abs(self.present_rate * factor) <= self.rate
+        )
+
+    @staticmethod
+    def _fit(times, values):
+        """ Returns the predicted final value, the present rate of change and
+        the decay rate :math:`1/\\tau` of an exponential approach fitted to
+        the trajectory, where the decay rate is zero if it is not an approach.
+        """
+        # The rate over the window is the fallback when the trajectory is
+        # not an approach, such as for a flat or diverging trajectory
+        linear_rate = np.polyfit(times - times[-1], values, 1)[0]
+        dt = np.diff(times)
+        valid = dt > 0
+        rates = np.diff(values)[valid] / dt[valid]
+        midpoints = (values[1:] + values[:-1])[valid] / 2
+        if len(rates) < 2 or np.ptp(midpoints) == 0:
+            return values[-1], linear_rate, 0
+        # Rates are linear in the value, dT/dt = a + b*T with b = -1/tau
+        b, a = np.polyfit(midpoints, rates, 1)
+        if b >= 0:
+            return values[-1], linear_rate, 0
+        return -a/b, a + b*values[-1], -b
@@ -23,6 +23,9 @@
 #
 
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.validators import strict_discrete_set
+
+import numpy as np
 
 
 class TDS2000(Instrument):
@@ -30,6 +33,24 @@ class TDS2000(Instrument):
     and provides a high-level for interacting with the instrument
     """
 
+    WAVEFORM_SOURCES = ['CH1', 'CH2', 'CH3', 'CH4', 'MATH']
+    # Data types of the CURVE? samples for each encoding and width
+    WAVEFORM_DTYPES = {
+        ('RIB', 1): 'i1', ('RIB', 2): '>i2',
+        ('RPB', 1): 'u1', ('RPB', 2): '>u2',
+    }
+    # Commands that change the waveform preambles
+    PREAMBLE_COMMANDS = (
+        'CH', 'HOR', 'DAT INIT', 'DAT:ENC', 'DAT:WID', 'DAT:STAR',
+        'DAT:STOP', 'WFMP', 'ACQ:MOD', 'ACQ:NUMAV', 'MATH', 'AUTOS', 'FAC',
+        'RECA', '*RST', '*RCL'
+    )
+    CACHE_COMMANDS = {
+        '_preambles': PREAMBLE_COMMANDS,
+        '_data_format': PREAMBLE_COMMANDS,
+    }
+    PREAMBLE_FIELDS = ['ymult', 'yoff', 'yzero', 'xincr', 'xzero', 'pt_off']
+
     class Measurement(object):
 
         SOURCE_VALUES = ['CH1', 'CH2', 'MATH']
@@ -92,3 +113,101 @@ class TDS2000(Instrument):
             **kwargs
         )
         self.measurement = TDS2000.Measurement(self)
+        self._preambles = None
+        self._data_format = None
+
+    def preamble(self, source='CH1'):
+        """ Returns a dictionary of the waveform preamble of a source,
+        with the fields of :attr:`PREAMBLE_FIELDS` that scale the samples
+        into Volts and seconds. The preamble is read with a single query,
+        and cached until a command changes it.
+        """
+        if self._preambles is None:
+            self._preambles = {}
+        if source not in self._preambles:
+            self.write("HEAD OFF;DAT:SOU %s" % source)
+            values = self.values(
+                "WFMP:YMU?;YOF?;YZE?;XIN?;XZE?;PT_O?", separator=';')
+            self._preambles[source] = dict(zip(self.PREAMBLE_FIELDS, values))
+        return self._preambles[source]
+
+    def acquire_single(self, timeout=10):
+        """ Takes a single acquisition and waits for it to complete,
+        so that all the channels are read from the same acquisition.
+
+        :param timeout: A time in seconds to wait for the trigger
+        """
+        self._ask_opc(timeout, "ACQ:STOPA SEQ;:ACQ:STATE RUN;*OPC?")
+
+    def capture(self, sources=('CH1',), encoding='RIB', width=1,
+                single=True, timeout=10):
+        """ Returns a dictionary of the time axis (:code:`'time'`) and the
+        waveform of each source in Volts, as numpy arrays. The samples are
+        read in a binary :code:`CURVE?` block and scaled all at once.
+
+        .. code-block:: python
+
+            waveform = scope.capture(['CH1', 'CH2'])
+            waveform['CH1']     # numpy array of Volts
+
+        :param sources: A list of the sources, from :attr:`WAVEFORM_SOURCES`
+        :param encoding: The binary encoding, :code:`RIB` (signed) or
+                         :code:`RPB` (positive)
+        :param width: The number of bytes per sample, 1 or 2
+        :param single: Toggles taking a single acquisition for the sources,
+                       instead of reading the current waveforms
+        :param timeout: A time in seconds to wait for the acquisition
+        """
+        for source in sources:
+            strict_discrete_set(source, self.WAVEFORM_SOURCES)
+        strict_discrete_set((encoding, width), self.WAVEFORM_DTYPES)
+        dtype = self.WAVEFORM_DTYPES[(encoding, width)]
+        if self._data_format != (encoding, width):
+            self.write("DAT:ENC %s;WID %d" % (encoding, width))
+            self._data_format = (encoding, width)
+        if single:
+            self.acquire_single(timeout)
+        waveform = {'time': None}
+        for source in sources:
+            preamble = self.preamble(source)
+            self.write("DAT:SOU %s" % source)
+            samples = self.binary_block("CURV?", dtype)
+            waveform[source] = ((samples - preamble['yoff']) *
+                                preamble['ymult'] + preamble['yzero'])
+            if waveform['time'] is None:
+                waveform['time'] = preamble['xzero'] + preamble['xincr'] * (
+                    np.arange(len(samples)) - preamble['pt_off'])
+        return waveform
+
+    def capture_segments(self, segments, sources=('CH1',), encoding='RIB',
+                         width=1, should_stop=lambda: False, timeout=10):
+        """ Takes a number of single acquisitions back to back, and returns
+        a dictionary of the time axis (:code:`'time'`) and the waveforms of
+        each source as a numpy array of shape :code:`(segments, points)`.
+        The preambles are read once, so each segment only costs the trigger
+        and the :code:`CURVE?` transfers. If :code:`should_stop` returns
+        True, the arrays are cut to the segments taken.
+
+        :param segments: The number of acquisitions
+        :param sources: A list of the sources, from :attr:`WAVEFORM_SOURCES`
+        :param encoding: The binary encoding, :code:`RIB` or :code:`RPB`
+        :param width: The number of bytes per sample, 1 or 2
+        :param should_stop: A function that returns True when no more
+                            acquisitions should be taken
+        :param timeout: A time in seconds to wait for each acquisition
+        """
+        waveform = self.capture(sources, encoding, width, timeout=timeout)
+        points = len(waveform['time'])
+        result = {'time': waveform['time']}
+        for source in sources:
+            result[source] = np.empty((segments, points), np.float64)
+            result[source][0] = waveform[source]
+        taken = 1
+        while taken < segments and not should_stop():
+            waveform = self.capture(sources, encoding, width, timeout=timeout)
+            for source in sources:
+                result[source][taken] = waveform[source]
+            taken += 1
+        for source in sources:
+            result[source] = result[source][:taken]
+        return result
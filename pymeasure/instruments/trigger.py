@@ -0,0 +1,179 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+from time import time
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class TriggerCoordinator(object):
+    """ Synchronizes a sweep of a source with readings of several meters by
+    hardware triggering, instead of triggering each point from Python. The
+    trigger graph is: the output trigger of the source drives an external
+    trigger line, which triggers each of the meters. All of the instruments
+    are armed, the sweep of the source is run once on its own timing, and
+    the buffers of every instrument are collected in bulk at the end, aligned
+    by their index.
+
+    The source must provide :code:`output_trigger_on_external(line)`,
+    :code:`disable_output_trigger()` and :code:`run_sweep(should_stop,
+    timeout)`, such as the :class:`~pymeasure.instruments.keithley.Keithley2400`
+    after :code:`config_list_sweep`. The meters must provide
+    :code:`arm_on_external(points, line)`, :code:`triggered_records()`,
+    :code:`buffer_count` and :code:`wait_for`, such as the
+    :class:`~pymeasure.instruments.keithley.Keithley2000` and the
+    :class:`~pymeasure.instruments.srs.SR830`.
+
+    .. code-block:: python
+
+        smu.config_list_sweep(np.linspace(0, 1, 501), delay=1e-3)
+        coordinator = TriggerCoordinator(smu, {'dmm': dmm, 'lockin': lockin},
+                                         line=2)
+        records = coordinator.run(501, should_stop=procedure.should_stop)
+        records['source_current'], records['dmm_reading'], records['lockin_ch1']
+
+    :param source: The instrument that sweeps and sends the output triggers
+    :param meters: A dictionary of names and instruments that are triggered
+    :param line: The trigger line that connects the source to the meters
+    :param source_name: The name of the source, which prefixes its fields
+    """
+
+    def __init__(self, source, meters, line=1, source_name='source'):
+        self.source = source
+        self.meters = dict(meters)
+        self.line = line
+        self.source_name = source_name
+        if source_name in self.meters:
+            raise ValueError("The name '%s' is used by both the source and "
+                             "a meter" % source_name)
+
+    def arm(self, points):
+        """ Arms the meters for a number of points on the trigger line, and
+        routes the output trigger of the source to the line.
+
+        :param points: The number of points of the sweep
+        """
+        for meter in self.meters.values():
+            meter.arm_on_external(points, self.line)
+        self.source.output_trigger_on_external(self.line)
+
+    def collect(self, points, should_stop=lambda: False, timeout=10,
+                interval=0.05, settle=1):
+        """ Waits for each meter to store a number of points, and returns
+        their records from bulk transfers of their buffers, as a dictionary
+        of names and structured numpy arrays. A meter that missed triggers
+        never stores every point, so its buffer is collected once the number
+        of stored points has not grown for the settling time, or at the
+        timeout, and the missing points are cut by :meth:`~.align`.
+
+        :param points: The number of points to wait for
+        :param should_stop: A function that returns True to stop waiting early
+        :param timeout: A time in seconds after which the remaining buffers
+                        are collected, shared by all of the meters
+        :param interval: The maximum time in seconds between checks of the buffers
+        :param settle: A time in seconds without new points after which a
+                       buffer is collected
+        """
+        records = {}
+        deadline = time() + timeout
+        for name, meter in self.meters.items():
+            try:
+                meter.wait_for(self._count_settled(meter, points, settle),
+                               timeout=max(deadline - time(), 0),
+                               should_stop=should_stop,
+                               max_interval=interval)
+            except TimeoutError:
+                pass
+            records[name] = meter.triggered_records()
+            if len(records[name]) < points:
+                log.warning("'%s' stored %d of the %d points" % (
+                    name, len(records[name]), points))
+        return records
+
+    @staticmethod
+    def _count_settled(meter, points, settle):
+        """ Returns a condition that is True once the meter has stored the
+        points, or the number of stored points has not grown for the
+        settling time.
+        """
+        last_count, last_time = None, None
+
+        def condition():
+            nonlocal last_count, last_time
+            count, now = meter.buffer_count, time()
+            if count >= points:
+                return True
+            if count != last_count:
+                last_count, last_time = count, now
+                return False
+            return now - last_time >= settle
+        return condition
+
+    def run(self, points, should_stop=lambda: False, timeout=60, settle=1):
+        """ Arms all of the instruments, runs the sweep of the source once,
+        and collects every buffer. The records are aligned by index, cut to
+        the number of points that every instrument took, and returned as a
+        single structured numpy array, with fields named by the instrument
+        and the field, e.g. :code:`'dmm_reading'`.
+
+        :param points: The number of points of the sweep
+        :param should_stop: A function that returns True to stop the sweep early
+        :param timeout: A time in seconds after which a TimeoutError is raised
+        :param settle: A time in seconds without new points after which the
+                       buffer of a meter that missed triggers is collected
+        """
+        self.arm(points)
+        try:
+            source_records = self.source.run_sweep(should_stop, timeout)
+        finally:
+            self.source.disable_output_trigger()
+        records = {self.source_name: source_records}
+        records.update(self.collect(len(source_records), should_stop, timeout,
+                                    settle=settle))
+        return self.align(records)
+
+    @staticmethod
+    def align(records):
+        """ Returns a single structured numpy array from a dictionary of
+        names and structured arrays, aligned by index and cut to the length
+        of the shortest array.
+
+        :param records: A dictionary of names and structured numpy arrays
+        """
+        length = min(len(array) for array in records.values())
+        fields = [("%s_%s" % (name, field), array.dtype[field])
+                  for name, array in records.items()
+                  for field in array.dtype.names]
+        aligned = np.empty(length, dtype=fields)
+        for name, array in records.items():
+            if len(array) > length:
+                log.warning("Dropping %d points of '%s' that were not taken "
+                            "by every instrument" % (len(array) - length, name))
+            for field in array.dtype.names:
+                aligned["%s_%s" % (name, field)] = array[field][:length]
+        return aligned
@@ -22,6 +22,167 @@
 # THE SOFTWARE.
 #
 
+from bisect import bisect_left
+from numbers import Real
+
+import numpy as np
+
+# np.isin needs numpy 1.13, while np.in1d is removed in numpy 2.4
+_in1d = getattr(np, 'in1d', None) or np.isin
+
+
+def _isclose(a, b, rel_tol=1e-9, abs_tol=0.0):
+    """ Returns True if two numbers are equal within a relative or an
+    absolute tolerance, as :func:`math.isclose` does in Python 3.5 and later.
+    """
+    return abs(a - b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
+
+
+class DiscreteSet(object):
+    """ An immutable set of valid values that is indexed once, so that the
+    discrete set validators do not have to search or sort the values on
+    every call. Membership is tested in O(1) through a hash set, and for
+    numeric values through an arithmetic progression (start, step, count)
+    when the values are evenly spaced, or a bisection of the sorted values
+    otherwise. Numeric values compare with a float tolerance, so that
+    :code:`0.3` is found in :code:`DiscreteSet(np.arange(0, 1, 0.1))`.
+    Evenly spaced floats are rounded to the decimals of their start and
+    step, so that the members are :code:`0.3` rather than
+    :code:`0.30000000000000004`.
+
+    .. code-block:: python
+
+        values=DiscreteSet(np.arange(0, 65.1, 0.1))
+
+    :param values: An iterable of valid values (list, range, numpy array, etc.)
+    :param rel_tol: Relative tolerance for comparing numeric values
+    :param abs_tol: Absolute tolerance for comparing numeric values, or None
+                    for a millionth of the smallest spacing of the values
+
+    :ivar array: A numpy array of the values, sorted if they are numeric
+    """
+
+    def __init__(self, values, rel_tol=1e-9, abs_tol=None):
+        if hasattr(values, 'tolist'):  # Use Python scalars for numpy arrays
+            values = values.tolist()
+        values = list(values)
+        if len(values) == 0:
+            raise ValueError("DiscreteSet requires at least one value")
+        self.rel_tol = rel_tol
+        self._numeric = all(isinstance(v, Real) for v in values)
+        self._progression = None
+        if self._numeric:
+            values = sorted(set(values))
+            self._progression = self._find_progression(values)
+            if self._progression is not None:
+                values = self._round_progression(values)
+            if abs_tol is None:
+                gaps = np.diff(values)
+                abs_tol = 1e-6 * float(gaps.min()) if len(gaps) else 0.0
+        self.abs_tol = abs_tol or 0.0
+        self._members = frozenset(values)
+        self._sorted = values
+        self.array = np.asarray(self._sorted)
+
+    @staticmethod
+    def _find_progression(values):
+        """ Returns (start, step, count) if the sorted values are evenly
+        spaced, and None otherwise.
+        """
+        count = len(values)
+        if count < 3:
+            return None
+        start = values[0]
+        step = (values[-1] - start) / (count - 1)
+        for i in range(1, count):
+            if not _isclose(values[i] - values[i - 1], step, rel_tol=1e-6):
+                return None
+        return start, step, count
+
+    def _round_progression(self, values):
+        """ Returns the values of a progression of floats as
+        :code:`start + i*step`, rounded to the decimals of the start and
+        step, and updates the progression to the rounded start and step.
+        """
+        if all(isinstance(v, int) for v in values):
+            return values
+        start, step, count = self._progression
+        for decimals in range(16):
+            if (_isclose(round(step, decimals), step, rel_tol=1e-6) and
+                    _isclose(round(start, decimals), start, abs_tol=1e-6 * step)):
+                start, step = round(start, decimals), round(step, decimals)
+                self._progression = start, step, count
+                return [round(start + i * step, decimals) for i in range(count)]
+        return values
+
+    def _isclose(self, a, b):
+        return _isclose(a, b, rel_tol=self.rel_tol, abs_tol=self.abs_tol)
+
+    def _index(self, value):
+        """ Returns the index of the first sorted value that is not less
+        than the value, as :func:`bisect.bisect_left` would.
+        """
+        values = self._sorted
+        if self._progression is None:
+            return bisect_left(values, value)
+        start, step, count = self._progression
+        i = int((value - start) // step) + 1
+        i = min(max(i, 0), count)
+        # Correct for rounding in the progression estimate
+        while i > 0 and values[i - 1] >= value:
+            i -= 1
+        while i < count and values[i] < value:
+            i += 1
+        return i
+
+    def find(self, value):
+        """ Returns the member that matches the value within the tolerance,
+        or None if there is no such member.
+        """
+        try:
+            if value in self._members:
+                return value
+        except TypeError:  # Unhashable values are never members
+            return None
+        if not (self._numeric and isinstance(value, Real)):
+            return None
+        i = self._index(value)
+        for j in (i - 1, i):
+            if 0 <= j < len(self._sorted) and self._isclose(self._sorted[j], value):
+                return self._sorted[j]
+        return None
+
+    def truncate(self, value):
+        """ Returns the member that matches the value, otherwise the smallest
+        member that is larger than the value, or the largest member if the
+        value is above all of them.
+        """
+        i = self._index(value)
+        if i > 0 and self._isclose(self._sorted[i - 1], value):
+            return self._sorted[i - 1]
+        if i == len(self._sorted):
+            return self._sorted[-1]
+        return self._sorted[i]
+
+    def __contains__(self, value):
+        return self.find(value) is not None
+
+    def __iter__(self):
+        return iter(self._sorted)
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def __repr__(self):
+        if self._progression is not None:
+            start, step, count = self._progression
+            return "DiscreteSet(start={:g}, step={:g}, count={:d})".format(
+                start, step, count)
+        if len(self._sorted) > 10:
+            return "DiscreteSet([{}, ..., {}], {:d} values)".format(
+                self._sorted[0], self._sorted[-1], len(self._sorted))
+        return "DiscreteSet({})".format(self._sorted)
+
 
 def strict_range(value, values):
     """ Provides a validator function that returns the value
@@ -45,15 +206,18 @@ def strict_discrete_set(value, values):
     if it is in the discrete set. Otherwise it raises a ValueError.
 
     :param value: A value to test
-    :param values: A set of values that are valid
+    :param values: A set of values that are valid, or a :class:`.DiscreteSet`
     :raises: ValueError if the value is not in the set
     """
-    if value in values:
+    if isinstance(values, DiscreteSet):
+        member = values.find(value)
+        if member is not None:
+            return member
+    elif value in values:
         return value
-    else:
-        raise ValueError('Value of {} is not in the discrete set {}'.format(
-            value, values
-        ))
+    raise ValueError('Value of {} is not in the discrete set {}'.format(
+        value, values
+    ))
 
 
 def truncated_range(value, values):
@@ -103,16 +267,16 @@ def truncated_discrete_set(value, values):
     value that is larger than the value.
 
     :param value: A value to test
-    :param values: A set of values that are valid
+    :param values: A set of values that are valid, or a :class:`.DiscreteSet`
     """
+    if isinstance(values, DiscreteSet):
+        return values.truncate(value)
     # Force the values to be sorted
-    values = list(values)
-    values.sort()
-    for v in values:
-        if value <= v:
-            return v
-
-    return values[-1]
+    values = sorted(values)
+    i = bisect_left(values, value)
+    if i == len(values):
+        return values[-1]
+    return values[i]
 
 
 def joined_validators(*validators):
@@ -132,6 +296,137 @@ def joined_validators(*validators):
     return validate
 
 
+class ArrayValueError(ValueError):
+    """ Raised by the array validators when some elements of an array are
+    not valid. The positions of the offending elements are available
+    through :attr:`indices`.
+    """
+
+    def __init__(self, message, indices):
+        self.indices = indices
+        shown = ", ".join(str(i) for i in indices[:10])
+        if len(indices) > 10:
+            shown += ", ..."
+        super().__init__("{} at {:d} indices [{}]".format(
+            message, len(indices), shown))
+
+
+def _check_array(array, valid, message):
+    """ Raises an :class:`.ArrayValueError` listing the indices where
+    the boolean array :code:`valid` is False.
+    """
+    if not valid.all():
+        raise ArrayValueError(message, np.flatnonzero(~valid))
+
+
+def strict_range_array(value, values):
+    """ Provides a validator function for arrays that returns the values as
+    a numpy array if all of them are within the range. Otherwise it
+    raises an :class:`.ArrayValueError` that reports the offending indices.
+
+    :param value: An array of values to test
+    :param values: A range of values (range, list, etc.)
+    :raises: ArrayValueError if any value is out of the range
+    """
+    array = np.asarray(value, dtype=float)
+    low, high = min(values), max(values)
+    _check_array(array, (array >= low) & (array <= high),
+                 'Values are not in range [{:g},{:g}]'.format(low, high))
+    return array
+
+
+def truncated_range_array(value, values):
+    """ Provides a validator function for arrays that returns the values as
+    a numpy array, where those outside of the range are replaced by the
+    closest range bound.
+
+    :param value: An array of values to test
+    :param values: A range of values (range, list, etc.)
+    """
+    return np.clip(np.asarray(value, dtype=float), min(values), max(values))
+
+
+def modular_range_array(value, values):
+    """ Provides a validator function for arrays that returns the values as
+    a numpy array, modulo the max of the range.
+
+    :param value: An array of values to test
+    :param values: A range of values (range, list, etc.)
+    """
+    return np.mod(np.asarray(value, dtype=float), max(values))
+
+
+def strict_discrete_set_array(value, values):
+    """ Provides a validator function for arrays that returns the values as
+    a numpy array if all of them are in the discrete set. Otherwise it
+    raises an :class:`.ArrayValueError` that reports the offending indices.
+    Numeric values are compared with the tolerance of a :class:`.DiscreteSet`
+    and are replaced by the matching members.
+
+    :param value: An array of values to test
+    :param values: A set of values that are valid, or a :class:`.DiscreteSet`
+    :raises: ArrayValueError if any value is not in the set
+    """
+    array = np.asarray(value)
+    if isinstance(values, DiscreteSet):
+        members = values.array
+    else:
+        members = np.asarray(list(values))
+    if array.dtype.kind not in 'iuf' or members.dtype.kind not in 'iuf':
+        _check_array(array, _in1d(array, members).reshape(array.shape),
+                     'Values are not in the discrete set')
+        return array
+    if isinstance(values, DiscreteSet):
+        rtol, atol = values.rel_tol, values.abs_tol
+    else:
+        rtol, atol = 1e-9, 0.0
+        members = np.unique(members)
+    array = array.astype(float)
+    # Compare each value with its neighbours in the sorted members
+    upper = np.clip(np.searchsorted(members, array), 0, len(members) - 1)
+    lower = np.clip(upper - 1, 0, len(members) - 1)
+    result = np.empty_like(array)
+    valid = np.zeros(array.shape, dtype=bool)
+    for index in (upper, lower):
+        candidates = members[index]
+        close = np.abs(candidates - array) <= np.maximum(
+            rtol * np.maximum(np.abs(candidates), np.abs(array)), atol)
+        result[close] = candidates[close]
+        valid |= close
+    _check_array(array, valid, 'Values are not in the discrete set')
+    return result
+
+
+def joined_validators_array(*validators):
+    """ Join a list of array validators together as a single, so that each
+    element of an array is valid if any of the validators accepts it.
+    Expects a list of array validator functions and values.
+
+    :param validators: an iterable of array validators
+    """
+
+    def validate(value, values):
+        array = np.asarray(value)
+        result = np.empty(array.shape, dtype=float)
+        remaining = np.arange(array.size)
+        flat = array.reshape(-1)
+        for validator, vals in zip(validators, values):
+            try:
+                accepted = remaining
+                result.flat[accepted] = validator(flat[accepted], vals)
+            except ArrayValueError as e:
+                accepted = np.delete(remaining, e.indices)
+                result.flat[accepted] = validator(flat[accepted], vals)
+            except (ValueError, TypeError):
+                continue
+            remaining = np.setdiff1d(remaining, accepted, assume_unique=True)
+            if remaining.size == 0:
+                return result
+        raise ArrayValueError("Values not in chained validator set", remaining)
+
+    return validate
+
+
 def discreteTruncate(number, discreteSet):
     """ Truncates the number to the closest element in the positive discrete set.
     Returns False if the number is larger than the maximum value or negative.
@@ -24,7 +24,11 @@
 
 import logging
 
+import numpy as np
+import pytest
+
 from pymeasure.adapters import FakeAdapter
+from pymeasure.adapters.adapter import decode_block, encode_block
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -37,3 +41,33 @@ def test_adapter_values():
     assert a.values("X,Y,Z") == ['X', 'Y', 'Z']
     assert a.values("X,Y,Z", cast=str) == ['X', 'Y', 'Z']
     assert a.values("X.Y.Z", separator='.') == ['X', 'Y', 'Z']
+
+
+def test_adapter_binary_block():
+    a = FakeAdapter()
+    data = np.arange(4, dtype='>f4').tobytes()
+    a.write(("#216" + data.decode('latin-1') + "\n"))
+    assert list(a.binary_block("", dtype='>f4')) == [0, 1, 2, 3]
+
+
+def test_decode_block():
+    data = np.array([1.5, -2], dtype='<f8').tobytes()
+    assert list(decode_block(b"#0" + data + b"\n", '<f8')) == [1.5, -2]
+    assert list(decode_block(b"#216" + data, '<f8')) == [1.5, -2]
+    with pytest.raises(ValueError):
+        decode_block(b"#232" + data, '<f8')
+
+
+def test_encode_block():
+    values = np.arange(-2, 3)
+    block = encode_block(values, '>i2')
+    assert block.startswith(b"#210")
+    assert list(decode_block(block, '>i2')) == [-2, -1, 0, 1, 2]
+
+
+def test_adapter_write_block():
+    a = FakeAdapter()
+    a.write_block("DATA ", [0.5, 1], '<f4')
+    raw = a.read_raw()
+    assert raw.startswith(b"DATA #18")
+    assert list(decode_block(raw, '<f4')) == [0.5, 1]
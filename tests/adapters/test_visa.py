@@ -22,7 +22,7 @@
 # THE SOFTWARE.
 #
 
-from pymeasure.adapters import VISAAdapter
+from pymeasure.adapters.visa import VISAAdapter
 
 def test_visa_version():
   assert VISAAdapter.has_supported_version()
@@ -22,9 +22,52 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 
+from pymeasure.adapters import FakeAdapter
+
 
 def pytest_addoption(parser):
     parser.addoption("--runslow", action="store_true",
                      help="run slow tests")
+
+
+class ScriptedAdapter(FakeAdapter):
+    """ Provides a :class:`FakeAdapter` that records the commands written to
+    it, and responds to queries from a dictionary of responses, which are
+    strings, bytes, or functions that return either of them. Commands
+    without a response read back as empty.
+    """
+
+    def __init__(self, responses=None):
+        self.responses = dict(responses or {})
+        self.commands = []
+
+    def write(self, command):
+        self.commands.append(command)
+        response = self.responses.get(command)
+        if callable(response):
+            response = response()
+        if isinstance(response, bytes):
+            response = response.decode('latin-1')
+        if response is not None:
+            self._buffer += response
+
+    def write_raw(self, data):
+        self.commands.append(data)
+
+    def binary_values(self, command, header_bytes=0, dtype=np.float32):
+        self.write(command)
+        return np.frombuffer(self.read_raw()[header_bytes:], dtype=dtype)
+
+    def read_bytes(self, count):
+        result, self._buffer = self._buffer[:count], self._buffer[count:]
+        return result.encode('latin-1')
+
+
+@pytest.fixture
+def scripted_adapter():
+    """ Returns the :class:`ScriptedAdapter` class, to be created with the
+    responses of each test. """
+    return ScriptedAdapter
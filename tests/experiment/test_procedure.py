@@ -25,6 +25,8 @@
 import pytest
 import pickle
 
+import numpy as np
+
 from pymeasure.experiment.procedure import Procedure, ProcedureWrapper
 from pymeasure.experiment.parameters import Parameter
 
@@ -55,4 +57,18 @@ def test_procedure_wrapper():
     new_wrapper = pickle.loads(pickle.dumps(wrapper))
     assert hasattr(new_wrapper, 'procedure')
     assert new_wrapper.procedure.iterations == 101
-    assert RandomProcedure.iterations.value == 100
\ No newline at end of file
+    assert RandomProcedure.iterations.value == 100
+
+
+def test_emit_block():
+    records = np.zeros(3, dtype=[('voltage', 'f4'), ('current', 'f4')])
+    records['voltage'] = [1, 2, 3]
+    procedure = Procedure()
+    emitted = []
+    procedure.emit = lambda topic, record: emitted.append((topic, record))
+    procedure.emit_block('results', records, columns={'voltage': 'Voltage (V)'})
+    assert emitted == [('results', {'Voltage (V)': v}) for v in [1, 2, 3]]
+    emitted.clear()
+    procedure.emit_block('results', {'x': [1, 2], 'y': np.array([3, 4])})
+    assert emitted == [('results', {'x': 1, 'y': 3}),
+                       ('results', {'x': 2, 'y': 4})]
@@ -0,0 +1,84 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters.adapter import encode_block
+from pymeasure.errors import InstrumentError
+from pymeasure.instruments.agilent import Agilent4156
+
+DISABLE_ALL = (":PAGE:CHAN:SMU1:DIS;:PAGE:CHAN:SMU2:DIS;:PAGE:CHAN:SMU3:DIS;"
+               ":PAGE:CHAN:SMU4:DIS;:PAGE:CHAN:VMU1:DIS;:PAGE:CHAN:VMU2:DIS;"
+               "*OPC?")
+
+
+def test_disable_all(scripted_adapter):
+    adapter = scripted_adapter({DISABLE_ALL: "1", "*STB?": "0"})
+    Agilent4156(adapter).disable_all()
+    assert adapter.commands == [DISABLE_ALL, "*STB?"]
+
+
+def test_disable_all_raises_errors(scripted_adapter):
+    errors = iter(['-113,"Undefined header"', '0,"No error"'])
+    adapter = scripted_adapter({
+        DISABLE_ALL: "1",
+        "*STB?": "4",
+        ":SYST:ERR?": lambda: next(errors),
+    })
+    with pytest.raises(InstrumentError, match="Undefined header"):
+        Agilent4156(adapter).disable_all()
+
+
+def test_get_data_binary(scripted_adapter):
+    adapter = scripted_adapter({
+        "*OPC?": "1",
+        ":PAGE:DISP:LIST?": "VG,ID",
+        ":PAGE:DISP:DVAR?": "",
+        ":DATA? 'VG'": encode_block([0, 0.5, 1], '>f8'),
+        ":DATA? 'ID'": encode_block([1e-9, 2e-6, 3e-3], '>f8'),
+    })
+    df = Agilent4156(adapter).get_data()
+    assert list(df.columns) == ['VG', 'ID']
+    assert list(df['VG']) == [0, 0.5, 1]
+    assert list(df['ID']) == [1e-9, 2e-6, 3e-3]
+    assert adapter.commands[3:5] == [":FORM:BORD NORM", ":FORM:DATA REAL,64"]
+    assert adapter.commands[-1] == ":FORM:DATA ASC"
+
+
+def test_stream_data(scripted_adapter):
+    points = iter([2, 2, 2, 3])
+    blocks = iter([[1, 2], [1, 2, 3]])
+    adapter = scripted_adapter({
+        ":PAGE:DISP:LIST?": "@TIME",
+        ":PAGE:DISP:DVAR?": "",
+        ":PAGE:MEAS:SAMP:IINT?": "0.001",
+        ":DATA:POIN? '@TIME'": lambda: str(next(points)),
+        ":DATA? '@TIME'": lambda: encode_block(next(blocks), '>f8'),
+    })
+    stream = Agilent4156(adapter).stream_data(timeout=1, min_interval=0.001)
+    assert list(next(stream)['@TIME']) == [1, 2]
+    assert list(next(stream)['@TIME']) == [3]
+    # The data is only read once the number of points has grown
+    assert adapter.commands.count(":DATA? '@TIME'") == 2
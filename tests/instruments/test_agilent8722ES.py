@@ -0,0 +1,64 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.instruments.agilent import Agilent8722ES
+
+
+def test_frequencies_are_cached(scripted_adapter):
+    adapter = scripted_adapter({
+        "STAR?": "1E9",
+        "STOP?": "2E9",
+        "POIN?": "3.000000E+00",
+    })
+    vna = Agilent8722ES(adapter)
+    assert list(vna.frequencies) == [1e9, 1.5e9, 2e9]
+    vna.scan_continuous()
+    vna.frequencies
+    assert adapter.commands.count("STAR?") == 1
+    vna.stop_frequency = 3e9
+    vna.frequencies
+    assert adapter.commands.count("STAR?") == 2
+
+
+def test_trace(scripted_adapter):
+    values = np.array([1, -1, 0.5, 0.25], dtype='>f4')
+    adapter = scripted_adapter({
+        "FORM2;OUTPDATA": b"#A\x00\x10" + values.tobytes(),
+    })
+    trace = Agilent8722ES(adapter).trace()
+    assert trace.dtype == np.complex64
+    assert list(trace) == [1 - 1j, 0.5 + 0.25j]
+
+
+def test_acquire(scripted_adapter):
+    values = np.array([1, 2], dtype='>f8')
+    adapter = scripted_adapter({
+        "OPC?;SING": "1",
+        "FORM3;OUTPDATA": b"#A\x00\x10" + values.tobytes(),
+    })
+    traces = list(Agilent8722ES(adapter).acquire(2, dtype=np.complex128))
+    assert [list(trace) for trace in traces] == [[1 + 2j], [1 + 2j]]
+    assert adapter.commands == ["AVERO0"] + ["OPC?;SING", "FORM3;OUTPDATA"]*2
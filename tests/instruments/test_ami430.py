@@ -0,0 +1,57 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+
+from pymeasure.instruments.ami import ami430 as ami430_module
+
+
+@pytest.fixture
+def magnet(monkeypatch, scripted_adapter):
+    def create(states, fields):
+        states, fields = iter(states), iter(fields)
+        adapter = scripted_adapter({
+            "STATE?": lambda: next(states),
+            "FIELD:MAG?": lambda: next(fields),
+        })
+        monkeypatch.setattr(ami430_module, 'VISAAdapter',
+                            lambda *args, **kwargs: adapter)
+        return ami430_module.AMI430("ASRL1::INSTR")
+    return create
+
+
+def test_scan_field_waits_for_the_ramp_to_start(magnet):
+    # Holding before the ramp, still holding right after RAMP, then ramping
+    states = ["2", "2", "1", "1", "2"]
+    fields = ["0", "0", "0.5", "0.9", "1"]
+    records = magnet(states, fields).scan_field(1, 0.1, {})
+    assert records['position'].tolist() == [0, 0.5, 0.9, 1]
+
+
+def test_scan_field_ends_at_the_target(magnet):
+    # The ramp is too short to be seen, but the field is at the target
+    states = ["2", "2"]
+    fields = ["1", "1"]
+    records = magnet(states, fields).scan_field(1, 0.1, {})
+    assert records['position'].tolist() == [1]
@@ -0,0 +1,78 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments import InstrumentError
+from pymeasure.instruments.anritsu import AnritsuMS9710C
+
+
+def test_read_memory_decodes_binary(scripted_adapter):
+    power = np.array([-10000, -12345, 2500], dtype='>i4')
+    adapter = scripted_adapter({
+        "DCA?": "1550,1552,3",
+        "DCB?": "1540,1560,3",
+        "DBA?": power.tobytes(),
+        "DBB?": power[::-1].tobytes(),
+    })
+    osa = AnritsuMS9710C(adapter)
+    wavelengths, values = osa.read_memory("A")
+    assert wavelengths.tolist() == [1550, 1551, 1552]
+    assert values.tolist() == pytest.approx([-10, -12.345, 2.5])
+    wavelengths, values = osa.read_memory("b")
+    assert wavelengths.tolist() == [1540, 1550, 1560]
+    assert values.tolist() == pytest.approx([2.5, -12.345, -10])
+
+
+def test_read_memory_continues_early_reads(scripted_adapter):
+    # The second value contains a line feed, which ends the first read
+    data = np.array([-1000, 10 << 8, -3000], dtype='>i4').tobytes()
+    chunks = iter([data[:7], data[7:]])
+    adapter = scripted_adapter({"DCA?": "1550,1552,3"})
+    adapter.read_raw = lambda: next(chunks)
+    osa = AnritsuMS9710C(adapter)
+    assert osa._read_binary_memory("A", 3).tolist() == pytest.approx(
+        [-1, 2.56, -3])
+
+
+def test_read_memory_raises_on_empty_reads(scripted_adapter):
+    adapter = scripted_adapter({
+        "DCA?": "1550,1552,3",
+        "DBA?": np.array([-1000], dtype='>i4').tobytes(),
+    })
+    osa = AnritsuMS9710C(adapter)
+    with pytest.raises(InstrumentError, match="returned 4 of the 12 bytes"):
+        osa.read_memory("A")
+
+
+def test_wavelengths_are_cached_until_the_span_changes(scripted_adapter):
+    adapter = scripted_adapter({"STA?": "1500", "STO?": "1600", "MPT?": "101"})
+    osa = AnritsuMS9710C(adapter)
+    assert osa.wavelengths[[0, -1]].tolist() == [1500, 1600]
+    osa.wavelengths
+    assert adapter.commands.count("MPT?") == 1
+    osa.sampling_points = 51
+    osa.wavelengths
+    assert adapter.commands.count("MPT?") == 2
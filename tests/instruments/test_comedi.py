@@ -0,0 +1,204 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+from numpy.polynomial.polynomial import polyval
+from pymeasure.instruments.comedi import SynchronousAI, physical_polynomial
+
+
+class FakeConverter(object):
+
+    def __init__(self, coefficients, origin):
+        self.coefficients = coefficients
+        self.origin = origin
+
+    def get_to_physical_coefficients(self):
+        return self.coefficients
+
+    def get_to_physical_expansion_origin(self):
+        return self.origin
+
+    def to_physical(self, data):
+        return polyval(np.asarray(data, dtype=np.float64) - self.origin,
+                       self.coefficients)
+
+
+class FakeLinearConverter(object):
+    """ Converter without polynomial accessors """
+
+    def to_physical(self, data):
+        return 1e-3*np.asarray(data, dtype=np.float64)
+
+
+class FakeFlags(object):
+    running = False
+
+
+class FakeDevice(object):
+
+    def __init__(self, file):
+        self.file = file
+
+
+class FakeSubdevice(object):
+
+    def __init__(self, file):
+        self.device = FakeDevice(file)
+
+    def get_dtype(self):
+        return np.uint16
+
+    def command_test(self):
+        return None
+
+    def command(self):
+        pass
+
+    def get_flags(self):
+        return FakeFlags()
+
+    def cancel(self):
+        pass
+
+
+class TrickleFile(object):
+    """ File that returns a few bytes per read, splitting the scans, and
+    reports no data available on every other read """
+
+    def __init__(self, data, size):
+        self.data = data
+        self.size = size
+        self.empty = False
+
+    def readinto(self, view):
+        self.empty = not self.empty
+        if self.empty:
+            return None
+        size = min(self.size, len(view), len(self.data))
+        view[:size] = self.data[:size]
+        self.data = self.data[size:]
+        return size
+
+
+class FakeChannel(object):
+
+    def __init__(self, subdevice, converter):
+        self.subdevice = subdevice
+        self.converter = converter
+
+    def get_converter(self):
+        return self.converter
+
+
+class FakeSynchronousAI(SynchronousAI):
+
+    def __init__(self, *args, **kwargs):
+        self.progress = []
+        self.blocks = []
+        self.scans = []
+        super().__init__(*args, **kwargs)
+
+    def _command(self):
+        return None
+
+    def _trigger(self):
+        pass
+
+    def emit_progress(self, progress):
+        self.progress.append(progress)
+
+    def emit_block(self, block):
+        self.blocks.append(block.copy())
+        super().emit_block(block)
+
+    def emit_data(self, data):
+        self.scans.append(data.copy())
+
+
+def make_ai(tmpdir, raw, samples, chunk_samples):
+    path = tmpdir.join('subdevice.bin')
+    path.write_binary(raw.astype(np.uint16).tobytes())
+    subdevice = FakeSubdevice(open(str(path), 'rb'))
+    channels = [
+        FakeChannel(subdevice, FakeConverter([-10., 20./65535], 0.)),
+        FakeChannel(subdevice, FakeLinearConverter()),
+    ]
+    return FakeSynchronousAI(channels, 1, samples,
+                             chunk_samples=chunk_samples)
+
+
+def test_physical_polynomial():
+    coefficients, origin = physical_polynomial(FakeConverter([1, 2], 3))
+    assert list(coefficients) == [1., 2.]
+    assert origin == 3.
+    assert physical_polynomial(FakeLinearConverter()) is None
+
+
+def test_measure(tmpdir):
+    raw = (np.arange(2000)*31 % 65536).reshape(1000, 2)
+    ai = make_ai(tmpdir, raw, 1000, chunk_samples=64)
+    ai.measure()
+    expected = np.column_stack((-10. + raw[:, 0]*20./65535, 1e-3*raw[:, 1]))
+    assert np.allclose(ai.data, expected, rtol=1e-6)
+    assert ai.progress[-1] == 100.
+    assert sum(len(block) for block in ai.blocks) == 1000
+    assert max(len(block) for block in ai.blocks) <= 64
+
+
+def test_measure_ends_with_file(tmpdir):
+    raw = np.ones((10, 2))
+    ai = make_ai(tmpdir, raw, 100, chunk_samples=4)
+    ai.measure()
+    assert sum(len(block) for block in ai.blocks) == 10
+
+
+def test_measure_aborts(tmpdir):
+    raw = np.ones((100, 2))
+    ai = make_ai(tmpdir, raw, 100, chunk_samples=10)
+    ai.measure(hasAborted=lambda: len(ai.blocks) >= 2)
+    assert len(ai.blocks) == 2
+    assert ai.progress[-1] == 20.
+
+
+def test_measure_rows(tmpdir):
+    raw = np.arange(20).reshape(10, 2)
+    ai = make_ai(tmpdir, raw, 10, chunk_samples=4)
+    ai.measure()
+    assert len(ai.scans) == 10
+    assert all(scan.shape == (2,) for scan in ai.scans)
+    assert np.allclose(ai.scans, ai.data)
+
+
+def test_measure_keeps_partial_scans():
+    raw = (np.arange(40)*1000).reshape(20, 2)
+    subdevice = FakeSubdevice(TrickleFile(raw.astype(np.uint16).tobytes(), 7))
+    channels = [
+        FakeChannel(subdevice, FakeLinearConverter()),
+        FakeChannel(subdevice, FakeLinearConverter()),
+    ]
+    ai = FakeSynchronousAI(channels, 1, 20, chunk_samples=8)
+    ai.measure()
+    assert np.allclose(ai.data, 1e-3*raw)
+    # Each read of 7 bytes completes one or two scans of 4 bytes
+    assert [len(block) for block in ai.blocks][:4] == [1, 2, 2, 2]
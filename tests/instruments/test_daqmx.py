@@ -0,0 +1,141 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import ctypes
+import time
+
+import numpy as np
+from pymeasure.instruments.ni.daqmx import (DAQmx,
+                                            DAQmx_Err_BufferOverwritten,
+                                            DAQmx_Err_SamplesNotYetAvailable)
+
+
+class FakeNIDAQ(object):
+    """ Fake NI-DAQmx library, which reads consecutive integers """
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.value = 0
+        self.calls = []
+
+    def DAQmxCreateTask(self, name, handle):
+        handle._obj.value = 1
+        return 0
+
+    def DAQmxCreateAIVoltageChan(self, *args):
+        return 0
+
+    def DAQmxCfgSampClkTiming(self, *args):
+        return 0
+
+    def DAQmxStartTask(self, task):
+        self.calls.append('start')
+        return 0
+
+    def DAQmxStopTask(self, task):
+        self.calls.append('stop')
+        return 0
+
+    def DAQmxClearTask(self, task):
+        self.calls.append('clear')
+        return 0
+
+    def DAQmxReadAnalogF64(self, task, samples, timeout, fill, data, size,
+                           read, reserved):
+        if self.errors:
+            return self.errors.pop(0)
+        values = (ctypes.c_double*size).from_address(data)
+        for i in range(size):
+            values[i] = self.value
+            self.value += 1
+        read._obj.value = samples
+        return 0
+
+    def DAQmxGetErrorString(self, err, buf, size):
+        return 0
+
+
+def test_read_blocks():
+    library = FakeNIDAQ()
+    daq = DAQmx('Dev1', library=library)
+    daq.start_continuous([0, 1], 10, blocks=4)
+    blocks = []
+    for block in daq.read_blocks(lambda: len(blocks) >= 6, timeout=5):
+        blocks.append(block.copy())
+    daq.stop_continuous()
+    assert len(blocks) == 6
+    assert blocks[0].dtype.names == ('ai0', 'ai1')
+    for block in blocks:
+        assert np.all(np.diff(block['ai0']) == 2)
+        assert np.all(block['ai1'] - block['ai0'] == 1)
+    assert library.calls[-2:] == ['stop', 'clear']
+
+
+def test_callback():
+    blocks = []
+    daq = DAQmx('Dev1', library=FakeNIDAQ())
+    daq.start_continuous([3], 5, callback=lambda b: blocks.append(b.copy()))
+    while len(blocks) < 3:
+        time.sleep(0.01)
+    daq.stop_continuous()
+    assert blocks[0].dtype.names == ('ai3',)
+    assert list(blocks[0]['ai3']) == [0, 1, 2, 3, 4]
+
+
+def test_overruns():
+    library = FakeNIDAQ(errors=[DAQmx_Err_BufferOverwritten])
+    daq = DAQmx('Dev1', library=library)
+    daq.start_continuous([0], 5, blocks=3)
+    block = next(daq.read_blocks(timeout=5))
+    daq.stop_continuous()
+    assert daq.overruns >= 1
+    assert library.calls[:3] == ['start', 'stop', 'start']
+    assert block['ai0'][0] == 0
+
+
+def test_warnings_do_not_stop_reading():
+    # Positive codes are warnings, with the samples still read
+    library = FakeNIDAQ()
+    read = library.DAQmxReadAnalogF64
+    library.DAQmxReadAnalogF64 = lambda *args: read(*args) or 200015
+    daq = DAQmx('Dev1', library=library)
+    daq.start_continuous([0], 5, blocks=3)
+    blocks = []
+    for block in daq.read_blocks(lambda: len(blocks) >= 3, timeout=5):
+        blocks.append(block.copy())
+    daq.stop_continuous()
+    assert len(blocks) == 3
+
+
+def test_stop_while_waiting_for_samples():
+    class SlowNIDAQ(FakeNIDAQ):
+        def DAQmxReadAnalogF64(self, task, samples, timeout, *args):
+            time.sleep(timeout.value)
+            return DAQmx_Err_SamplesNotYetAvailable
+
+    daq = DAQmx('Dev1', library=SlowNIDAQ())
+    daq.start_continuous([0], 5, blocks=3, timeout=10)
+    start = time.time()
+    daq.stop_continuous()
+    assert time.time() - start < 1
@@ -0,0 +1,52 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.ametek import Ametek7270
+
+
+def test_snap(scripted_adapter):
+    adapter = scripted_adapter({"XY.": "3e-3,4e-3"})
+    lockin = Ametek7270(adapter)
+    values = lockin.snap()
+    assert adapter.commands == ["XY."]
+    assert np.isclose(values['mag'], 5e-3)
+    assert np.isclose(values['phase'], np.degrees(np.arctan2(4, 3)))
+    assert list(lockin.snap(('x',))) == ['x']
+    with pytest.raises(ValueError):
+        lockin.snap(('noise',))
+
+
+def test_buffer_records(scripted_adapter):
+    adapter = scripted_adapter({
+        "M": "0,0,0,3",
+        "SEN.": "18",  # 1 mV
+        "DCB 1": np.array([10000, -5000, 0], dtype='>i2').tobytes(),
+        "DCB 3": np.array([9000, -4500, 0], dtype='>i2').tobytes(),
+    })
+    lockin = Ametek7270(adapter)
+    assert np.allclose(lockin.buffer_records('y'), [1e-3, -0.5e-3, 0])
+    assert np.allclose(lockin.get_buffer('phase'), [90, -45, 0])
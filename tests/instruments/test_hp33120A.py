@@ -0,0 +1,72 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments import InstrumentError
+from pymeasure.instruments.hp import HP33120A
+
+
+def test_upload_waveform(scripted_adapter):
+    adapter = scripted_adapter({"*OPC?": "1", "*STB?": "0"})
+    generator = HP33120A(adapter)
+    waveform = np.linspace(-0.5, 0.5, 8)
+    generator.upload_waveform(waveform, 'ramp_up')
+    dac = np.rint(np.linspace(-1, 1, 8) * 2047).astype('>i2').tobytes()
+    assert adapter.commands[1:] == [
+        "FORM:BORD NORM",
+        b"DATA:DAC VOLATILE, #216" + dac,
+        "DATA:COPY RAMP_UP, VOLATILE",
+        "*OPC?",
+        "*STB?",
+        "FUNC:USER RAMP_UP;:FUNC:SHAP USER",
+    ]
+    del adapter.commands[:]
+    generator.upload_waveform(waveform, 'ramp_up')
+    assert adapter.commands == ["FUNC:USER RAMP_UP;:FUNC:SHAP USER"]
+    # The same points under another name are not sent again
+    del adapter.commands[:]
+    generator.upload_waveform(waveform, 'ramp')
+    assert adapter.commands == ["FUNC:USER RAMP_UP;:FUNC:SHAP USER"]
+    # New points under the same name replace the remembered waveform
+    del adapter.commands[:]
+    generator.upload_waveform(-waveform, 'ramp_up')
+    assert "DATA:COPY RAMP_UP, VOLATILE" in adapter.commands
+    assert list(generator._waveforms.values()) == ['RAMP_UP']
+
+
+def test_upload_waveform_is_not_remembered_on_errors(scripted_adapter):
+    errors = iter(['-781,"Not enough memory to store new arb waveform"',
+                   '0,"No error"'])
+    adapter = scripted_adapter({
+        "*OPC?": "1",
+        "*STB?": "4",
+        ":SYST:ERR?": lambda: next(errors),
+    })
+    generator = HP33120A(adapter)
+    with pytest.raises(InstrumentError, match="Not enough memory"):
+        generator.upload_waveform(np.linspace(-1, 1, 8), 'RAMP_UP')
+    assert generator._waveforms == {}
+    assert "FUNC:USER RAMP_UP;:FUNC:SHAP USER" not in adapter.commands
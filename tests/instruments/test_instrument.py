@@ -22,9 +22,11 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 from pymeasure.instruments.instrument import Instrument, FakeInstrument
-from pymeasure.instruments.validators import strict_discrete_set, strict_range
+from pymeasure.instruments.validators import (strict_discrete_set, strict_range,
+                                              strict_range_array)
 
 
 def test_fake_instrument():
@@ -150,6 +152,23 @@ def test_control_get_process():
     assert fake.x == 5
 
 
+def test_control_array():
+    class Fake(FakeInstrument):
+        x = Instrument.control(
+            "", "LIST %s", "",
+            validator=strict_range_array,
+            values=[0, 10],
+        )
+
+    fake = Fake()
+    fake.x = np.array([0.5, 1, 10])
+    assert fake.read() == 'LIST 0.5,1.0,10.0'
+    with pytest.raises(ValueError):
+        fake.x = np.array([0.5, 11])
+    fake.write('1.5,2.5')
+    assert fake.x == [1.5, 2.5]
+
+
 def test_measurement_dict_str_map():
     class Fake(FakeInstrument):
         x = Instrument.measurement(
@@ -179,3 +198,117 @@ def test_setting_process():
     assert fake.read() == 'OUT 0'
     fake.x = 2
     assert fake.read() == 'OUT 1'
+
+
+def test_wait_for_condition():
+    fake = FakeInstrument()
+    calls = []
+
+    def condition():
+        calls.append(1)
+        return len(calls) >= 3
+
+    assert fake.wait_for(condition, timeout=1, interval=1e-4)
+    assert len(calls) == 3
+
+
+def test_wait_for_should_stop():
+    fake = FakeInstrument()
+    assert not fake.wait_for(lambda: False, timeout=1,
+                             should_stop=lambda: True)
+
+
+def test_wait_for_timeout():
+    fake = FakeInstrument()
+    with pytest.raises(TimeoutError):
+        fake.wait_for(lambda: False, timeout=0.05, interval=1e-3)
+
+
+def test_wait_for_srq():
+    fake = FakeInstrument()
+    requests = []
+
+    def wait_for_srq(timeout):
+        requests.append(timeout)
+        if len(requests) < 2:
+            raise TimeoutError()
+
+    fake.adapter.wait_for_srq = wait_for_srq
+    assert fake.wait_for(lambda: True, timeout=1, srq=True, max_interval=0.1)
+    assert requests == [0.1, 0.1]
+
+
+def test_wait_for_srq_unsupported():
+    fake = FakeInstrument()
+    assert fake.wait_for(lambda: True, timeout=1, srq=True)
+
+
+class FakeErrorInstrument(FakeInstrument):
+    """ Reports an error for each command that sets x to a negative value.
+    """
+    x = Instrument.control(
+        "", "VOLT %d", "",
+        check_set_errors=True,
+    )
+
+    def __init__(self):
+        super().__init__()
+        self.checks = 0
+
+    def check_errors(self):
+        self.checks += 1
+
+    def read_errors(self):
+        self.read()
+        return [(-222, "Data out of range")
+                for c in self.history if c.startswith("VOLT -")]
+
+
+def test_defer_errors():
+    fake = FakeErrorInstrument()
+    fake.x = 1
+    assert fake.checks == 1
+    with fake.defer_errors():
+        for value in range(5):
+            fake.x = value
+    assert fake.checks == 1
+
+
+def test_sync_errors_attribution():
+    fake = FakeErrorInstrument()
+    with fake.defer_errors():
+        fake.x = 1
+        fake.x = -2
+        fake.x = 3
+        errors = fake.sync_errors()
+    assert errors == [(-222, "Data out of range", ['VOLT 1', 'VOLT -2', 'VOLT 3'])]
+
+
+def test_defer_errors_every():
+    fake = FakeErrorInstrument()
+    synced = []
+
+    def sync_errors():
+        synced.append(list(fake.history)[-fake._unchecked_commands:])
+        fake._unchecked_commands = 0
+
+    fake.sync_errors = sync_errors
+    with fake.defer_errors(every=2):
+        for value in range(5):
+            fake.x = value
+    assert synced == [['VOLT 0', 'VOLT 1'], ['VOLT 2', 'VOLT 3'], ['VOLT 4']]
+
+
+def test_cache_commands():
+    class Fake(FakeInstrument):
+        CACHE_COMMANDS = {'_axis': ('FREQ', '*RST')}
+
+    fake = Fake()
+    for command, cleared in [(":SENS:FREQ:STAR 1E9", True),
+                             ("INIT; FREQ:SPAN 1E6", True),
+                             ("*RST", True),
+                             (":SENS:BAND 1E3", False),
+                             ("INIT;:INIT:CONT OFF", False)]:
+        fake._axis = 'cached'
+        fake.write(command)
+        assert (fake._axis is None) == cleared
@@ -0,0 +1,159 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters.adapter import encode_block
+from pymeasure.instruments.keithley import Keithley2000, Keithley2400
+
+
+def records_block(start, count):
+    """ Returns a binary block of 2400 buffer records, with the index of
+    each reading as its voltage. """
+    data = np.zeros((count, 5), dtype='<f4')
+    data[:, 0] = np.arange(start, start + count)
+    return encode_block(data.ravel(), '<f4')
+
+
+def test_stream_buffer_slices_the_buffer(scripted_adapter):
+    counts = iter([2, 2, 2, 5, 5])
+    blocks = iter([records_block(0, 2), records_block(0, 5)])
+    adapter = scripted_adapter({
+        ":TRAC:POIN?": "5",
+        ":TRAC:POIN:ACT?": lambda: str(next(counts)),
+        ":FORM:ELEM?": "VOLT,CURR,RES,TIME,STAT",
+        ":TRAC:DATA?": lambda: next(blocks),
+    })
+    smu = Keithley2400(adapter)
+    chunks = list(smu.stream_buffer(timeout=1))
+    assert [list(chunk['voltage']) for chunk in chunks] == [[0, 1], [2, 3, 4]]
+    assert not any(":TRAC:DATA:SEL?" in c for c in adapter.commands)
+
+
+def test_stream_buffer_reads_new_readings(scripted_adapter):
+    counts = iter([2, 2, 2, 5, 5])
+    adapter = scripted_adapter({
+        ":TRAC:POIN?": "5",
+        ":TRAC:POIN:ACT?": lambda: str(next(counts)),
+        ":FORM:ELEM?": "VOLT,CURR,RES,TIME,STAT",
+        ":TRAC:DATA:SEL? 0,2": records_block(0, 2),
+        ":TRAC:DATA:SEL? 2,3": records_block(2, 3),
+    })
+    smu = Keithley2400(adapter)
+    smu.BUFFER_RANGE_QUERY = ":TRAC:DATA:SEL? %d,%d"
+    chunks = list(smu.stream_buffer(timeout=1))
+    assert [list(chunk['voltage']) for chunk in chunks] == [[0, 1], [2, 3, 4]]
+    assert ":TRAC:DATA?" not in adapter.commands
+
+
+def test_keithley2000_buffer_count(scripted_adapter):
+    adapter = scripted_adapter({":TRAC:FREE?": "94176,4128"})
+    meter = Keithley2000(adapter)
+    assert meter.buffer_count == 43
+    assert adapter.commands == [":TRAC:FREE?"]
+
+
+def test_list_sweep_chunks_and_trigger(scripted_adapter):
+    adapter = scripted_adapter({":SOUR:FUNC?": "VOLT"})
+    smu = Keithley2400(adapter)
+    smu.LIST_CHUNK_SIZE = 2
+    smu.config_list_sweep([0, 0.5, 1.0000000001, 2, 3], delay=0.01)
+    assert adapter.commands[:10] == [
+        ":SOUR:FUNC?",
+        ":SOUR:SWE:RANG BEST",
+        ":SOUR:VOLT:MODE LIST",
+        ":SOUR:LIST:VOLT 0.0,0.5",
+        ":SOUR:LIST:VOLT:APP 1.0000000001,2.0",
+        ":SOUR:LIST:VOLT:APP 3.0",
+        ":ARM:SOUR IMM;:ARM:COUN 1;:TRIG:SOUR IMM;",
+        ":STAT:PRES;*CLS;*SRE 1;:STAT:MEAS:ENAB 512;",
+        ":TRAC:CLEAR;",
+        ":TRAC:POIN 5",
+    ]
+    assert ":TRIG:COUN 5" in adapter.commands
+
+
+def test_arm_on_external_passes_the_arm_layer(scripted_adapter):
+    adapter = scripted_adapter()
+    smu = Keithley2400(adapter)
+    smu.arm_on_external(10, line=2)
+    assert ":TRAC:POIN 10" in adapter.commands
+    assert adapter.commands[-2:] == [
+        ":ARM:SOUR IMM;:ARM:COUN 1;:TRIG:SOUR TLIN;:TRIG:ILIN 2;",
+        ":INIT",
+    ]
+    assert not any("ARM:SOUR TLIN" in c for c in adapter.commands)
+
+
+def test_sweep_checks_range_and_compliance(scripted_adapter):
+    adapter = scripted_adapter({":SENS:CURR:PROT?": "1.05"})
+    smu = Keithley2400(adapter)
+    with pytest.raises(ValueError):
+        smu.config_list_sweep([0, 2.5], source='voltage', source_range=2.1)
+    with pytest.raises(ValueError):
+        smu.config_staircase_sweep(0, 100, 11, source='voltage')
+    assert adapter.commands == [":SENS:CURR:PROT?"]
+    smu.config_staircase_sweep(0, 100, 11, source='voltage',
+                               compliance=0.1, source_range=200)
+    assert ":SOUR:VOLT:RANG:AUTO 0;:SOUR:VOLT:RANG 200" in adapter.commands
+    assert ":SOUR:SWE:RANG FIX" in adapter.commands
+
+
+def test_run_sweep_requires_config(scripted_adapter):
+    smu = Keithley2400(scripted_adapter())
+    with pytest.raises(Exception, match="config_list_sweep"):
+        smu.run_sweep()
+
+
+def test_keithley2000_burst(scripted_adapter):
+    data = np.array([[1.5, 0], [2.5, 0.01], [3.5, 0.02]], dtype='<f4')
+    adapter = scripted_adapter({
+        ":CONF?": '"VOLT:DC"',
+        ":SENS:VOLT:DC:NPLC?": "1",
+        ":SYST:AZER:STAT?": "1",
+        ":DISP:ENAB?": "1",
+        ":SAMP:COUN?": "1",
+        ":TRIG:COUN?": "1",
+        ":TRIG:SEQ:DEL?": "0",
+        ":TRIG:SOUR?": "EXT",
+        "*STB?": "65",
+        ":SYST:ERR?": '0,"No error"',
+        ":FORM:ELEM?": "READ",
+        ":TRAC:DATA?": encode_block(data.ravel(), '<f4'),
+    })
+    meter = Keithley2000(adapter)
+    records = meter.burst(3, nplc=0.01)
+    assert list(records['reading']) == [1.5, 2.5, 3.5]
+    assert np.allclose(records['time'], [0, 0.01, 0.02])
+    commands = adapter.commands
+    assert ":SENS:VOLT:DC:NPLC 0.01" in commands
+    assert ":SAMP:COUN 3;:TRIG:COUN 1;:TRIG:SOUR IMM" in commands
+    assert ":FORM:ELEM READ,TST;:FORM:DATA SREAL;:FORM:BORD SWAP" in commands
+    assert commands.index(":INIT") < commands.index(":TRAC:DATA?")
+    # The settings are restored afterwards
+    assert commands[-6:] == [
+        ":SENS:VOLT:DC:NPLC 1;:TRIG:SOUR EXT", ":SYST:AZER:STAT 1",
+        ":DISP:ENAB 1", ":SAMP:COUN 1", ":TRIG:COUN 1", ":TRIG:SEQ:DEL 0",
+    ]
@@ -0,0 +1,88 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.newport import ESP300
+from pymeasure.instruments.parker import ParkerGV6
+
+
+def test_esp300_move_group(scripted_adapter):
+    adapter = scripted_adapter()
+    controller = ESP300(adapter)
+    controller.move_group({controller.x: 1.5, 3: -2})
+    assert adapter.commands == ["1PA1.5;3PA-2"]
+
+
+def test_esp300_group_status(scripted_adapter):
+    adapter = scripted_adapter({"1MD?;1TP;1DP?;2MD?;2TP;2DP?": "1,1.5,1.5,0,0.25,2"})
+    controller = ESP300(adapter)
+    done, position, error = controller.group_status([controller.x, 2])
+    assert done.tolist() == [True, False]
+    assert position.tolist() == [1.5, 0.25]
+    assert error.tolist() == [0, 1.75]
+
+
+def test_esp300_wait_for_group(scripted_adapter):
+    responses = iter(["1,0,1,0,0,2", "1,1,1,1,2,2"])
+    adapter = scripted_adapter({"1MD?;1TP;1DP?;2MD?;2TP;2DP?": lambda: next(responses)})
+    controller = ESP300(adapter)
+    assert controller.wait_for_group([1, 2], interval=0)
+    assert len(adapter.commands) == 2
+
+
+def gv6(response, scripted_adapter):
+    # Bypasses the constructor, which opens the serial port
+    motor = ParkerGV6.__new__(ParkerGV6)
+    Instrument.__init__(motor, scripted_adapter(), "Parker GV6 Motor Controller",
+                        includeSCPI=False)
+    motor.connection = motor.adapter
+    motor.ask = lambda command: response[command]
+    return motor
+
+
+def test_gv6_motion_status(scripted_adapter):
+    motor = gv6({
+        "TAS:TPE:TPER": "*TAS1100_0000_0000_0000_0000_0000_0000_0000\r\n"
+                        "*TPE-1200\r\n*TPER25"
+    }, scripted_adapter)
+    assert motor.motion_status() == (True, -1200, 25)
+    motor = gv6({
+        "TAS:TPE:TPER": "*TAS0100_0000_0000_0000_0000_0000_0000_0000\r\n"
+                        "*TPE200000\r\n*TPER-3"
+    }, scripted_adapter)
+    assert motor.motion_status() == (False, 200000, -3)
+
+
+def test_gv6_motion_status_on_errors(scripted_adapter):
+    motor = gv6({"TAS:TPE:TPER": "?"}, scripted_adapter)
+    assert motor.motion_status() == (True, None, None)
+
+
+def test_gv6_move_to(scripted_adapter):
+    motor = gv6({
+        "TAS:TPE:TPER": "*TAS0000_0000_0000_0000_0000_0000_0000_0000\r\n"
+                        "*TPE1000\r\n*TPER0"
+    }, scripted_adapter)
+    assert motor.move_to(1000, interval=0)
+    assert motor.adapter.commands == ["D1000:GO\r"]
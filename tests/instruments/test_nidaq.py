@@ -0,0 +1,131 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+
+class FakeQuantity(object):
+
+    def __init__(self, magnitude, units):
+        self.magnitude = np.asarray(magnitude)
+        self.units = units
+
+    def __getitem__(self, index):
+        return FakeQuantity(self.magnitude[index], self.units)
+
+    def to(self, units):
+        return self
+
+
+class FakeTask(object):
+    """ Task of the fake instrumental backend, which reads the channel
+    number and records the values written """
+
+    tasks = []
+
+    def __init__(self, *channels):
+        self.channels = channels
+        self.written = []
+        FakeTask.tasks.append(self)
+
+    def read(self):
+        return {chan: FakeQuantity([float(chan[2:])], 'V')
+                for chan in self.channels}
+
+    def write(self, values):
+        self.written.append(
+            {chan: float(value.magnitude[0]) for chan, value in values.items()})
+
+
+class FakeDAQ(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def get_AI_channels(self):
+        return ['ai0', 'ai1']
+
+    def get_AO_channels(self):
+        return ['ao0', 'ao1']
+
+    def __getattr__(self, name):
+        return name
+
+
+@pytest.fixture
+def nidaq(monkeypatch):
+    """ Returns the nidaq module, imported with a fake instrumental """
+    instrumental = types.ModuleType('instrumental')
+    instrumental.u = types.SimpleNamespace(Quantity=FakeQuantity)
+    ni = types.ModuleType('instrumental.drivers.daq.ni')
+    ni.NIDAQ = FakeDAQ
+    ni.Task = FakeTask
+    modules = {
+        'instrumental': instrumental,
+        'instrumental.drivers': types.ModuleType('instrumental.drivers'),
+        'instrumental.drivers.daq': types.ModuleType('instrumental.drivers.daq'),
+        'instrumental.drivers.daq.ni': ni,
+    }
+    modules['instrumental.drivers.daq'].ni = ni
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.delitem(sys.modules, 'pymeasure.instruments.ni.nidaq',
+                        raising=False)
+    FakeTask.tasks = []
+    yield importlib.import_module('pymeasure.instruments.ni.nidaq')
+    # The module is not kept with the fake instrumental
+    sys.modules.pop('pymeasure.instruments.ni.nidaq')
+    del sys.modules['pymeasure.instruments.ni'].nidaq
+
+
+def test_channels_are_per_instance(nidaq):
+    daq = nidaq.NIDAQ('Dev1')
+    assert daq.ai1 == 1.
+    assert daq.get.ai0() == 0.
+    assert daq.ao0 is None
+    daq.ao0 = 1.5
+    assert daq.ao0 == 1.5
+    assert FakeTask.tasks[-1].written == [{'ao0': 1.5}]
+    with pytest.raises(AttributeError):
+        daq.ai0 = 1
+    with pytest.raises(AttributeError):
+        daq.ai2
+    # The class is not modified by the channels of the instance
+    assert type(daq) is nidaq.NIDAQ
+    assert not hasattr(nidaq.NIDAQ, 'ai0')
+
+
+def test_tasks_are_cached(nidaq):
+    daq = nidaq.NIDAQ('Dev1')
+    assert list(daq.read_channels(['ai0', 'ai1'])) == [0., 1.]
+    daq.read_channels(['ai0', 'ai1'])
+    daq.write_channels({'ao0': 1, 'ao1': -1})
+    assert len(FakeTask.tasks) == 2
+    assert FakeTask.tasks[1].written == [{'ao0': 1., 'ao1': -1.}]
+    assert daq.ao1 == -1
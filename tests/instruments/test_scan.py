@@ -0,0 +1,79 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.instruments.scan import bin_scan, continuous_scan, record_motion
+
+
+def test_continuous_scan():
+    positions = iter(np.arange(10.))
+    state = {'position': 0}
+
+    def position():
+        state['position'] = next(positions)
+        return state['position']
+
+    samples = []
+    records = continuous_scan(
+        position, {'double': lambda: 2*state['position']},
+        is_done=lambda: state['position'] >= 5, callback=samples.append
+    )
+    assert records.dtype.names == ('time', 'position', 'double')
+    # The sample after the actuator stops is included
+    assert list(records['position']) == [0, 1, 2, 3, 4, 5, 6]
+    assert list(records['double']) == [0, 2, 4, 6, 8, 10, 12]
+    assert np.all(np.diff(records['time']) >= 0)
+    assert samples[-1]['position'] == 6
+
+
+def test_continuous_scan_should_stop():
+    records = continuous_scan(lambda: 1, {}, is_done=lambda: False,
+                              should_stop=lambda: True)
+    assert len(records) == 1
+
+
+def test_bin_scan():
+    records = np.zeros(6, dtype=[('time', float), ('position', float),
+                                 ('value', float)])
+    records['position'] = [-0.2, 0.1, 0.9, 1.1, 1.4, 5]
+    records['value'] = [1, 3, 10, 20, 30, 100]
+    binned = bin_scan(records, [2, 1, 0])
+    assert list(binned['position']) == [2, 1, 0]
+    assert list(binned['count']) == [0, 3, 2]
+    assert np.isnan(binned['value'][0])
+    assert list(binned['value'][1:]) == [20, 2]
+
+
+def test_record_motion():
+    positions = iter(range(10))
+
+    def status():
+        position = next(positions)
+        return position >= 6, (position, -position)
+
+    records = record_motion(status, ['position', 'error'], interval=0, size=2)
+    assert records.dtype.names == ('time', 'position', 'error')
+    assert list(records['position']) == list(range(7))
+    assert list(records['error']) == [-p for p in range(7)]
@@ -0,0 +1,135 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments import Instrument, InstrumentError
+from pymeasure.instruments.agilent import Agilent8257D
+from pymeasure.instruments.anritsu import AnritsuMG3692C
+from pymeasure.instruments.listsweep import ListSweepMixin
+from pymeasure.instruments.rohdeschwarz import RohdeSMB100A
+from pymeasure.instruments.srs import SG380
+
+
+def test_8257d_list_sweep(scripted_adapter):
+    adapter = scripted_adapter()
+    generator = Agilent8257D(adapter)
+    generator.config_list_sweep([1e9, 1.123456789012e9], powers=-10.25,
+                                dwell=[1e-3, 2e-3], trigger='external')
+    assert adapter.commands == [
+        ":SOUR:LIST:TYPE LIST;"
+        ":SOUR:LIST:FREQ 1000000000.0,1123456789.012;"
+        ":SOUR:LIST:POW -10.25,-10.25;"
+        ":SOUR:LIST:DWEL:TYPE LIST;"
+        ":SOUR:LIST:DWEL 0.001,0.002;"
+        ":SOUR:LIST:TRIG:SOUR EXT;"
+        ":TRIG:SOUR IMM;"
+        ":SOUR:FREQ:MODE LIST;"
+        ":SOUR:POW:MODE LIST"
+    ]
+    generator.start_list_sweep()
+    generator.trigger()
+    generator.stop_list_sweep()
+    assert adapter.commands[1:] == [
+        ":INIT:CONT OFF;:INIT", "*TRG",
+        ":ABOR;:SOUR:FREQ:MODE CW;:SOUR:POW:MODE FIX",
+    ]
+
+
+def test_list_sweep_is_validated_before_writing(scripted_adapter):
+    adapter = scripted_adapter()
+    generator = Agilent8257D(adapter)
+    with pytest.raises(ValueError):
+        generator.config_list_sweep([1e9, 100e9])
+    with pytest.raises(ValueError):
+        generator.config_list_sweep(np.full(1602, 1e9))
+    with pytest.raises(ValueError):
+        generator.config_list_sweep([1e9], trigger='software')
+    with pytest.raises(ValueError):
+        AnritsuMG3692C(adapter).config_list_sweep([1e9, 2e9], dwell=[1, 2])
+    with pytest.raises(ValueError):
+        SG380(adapter).config_list_sweep([1e9], dwell=1e-3)
+    assert adapter.commands == []
+
+
+def test_list_sweep_must_be_written_by_instruments(scripted_adapter):
+    class Generator(ListSweepMixin, Instrument):
+        pass
+
+    with pytest.raises(TypeError):
+        Generator(scripted_adapter, "Generator")
+
+
+def test_mg3692c_list_sweep(scripted_adapter):
+    adapter = scripted_adapter()
+    generator = AnritsuMG3692C(adapter)
+    generator.config_list_sweep([1e9, 2e9, 3e9], dwell=0.01,
+                                trigger='immediate')
+    assert adapter.commands == [
+        ":LIST:IND 0;:LIST:FREQ 1000000000.0,2000000000.0,3000000000.0;"
+        ":LIST:DWEL 0.01;:LIST:STAR 0;:LIST:STOP 2;:TRIG:SOUR IMM;"
+        ":FREQ:MODE LIST"
+    ]
+
+
+def test_smb100a_list_sweep(scripted_adapter):
+    adapter = scripted_adapter({":POW?": "-20", "*STB?": "0"})
+    generator = RohdeSMB100A(adapter)
+    del adapter.commands[:]
+    generator.config_list_sweep([1e9, 2e9], dwell=0.01, name='hops')
+    assert adapter.commands[:2] == [
+        ":POW?",
+        "SOUR:LIST:SEL 'hops';:SOUR:LIST:FREQ 1000000000.0,2000000000.0;"
+        ":SOUR:LIST:POW -20.0,-20.0;:SOUR:LIST:DWEL 0.01;"
+        ":SOUR:LIST:MODE STEP;:SOUR:LIST:TRIG:SOUR SING",
+    ]
+    generator.start_list_sweep()
+    generator.stop_list_sweep()
+    assert adapter.commands[-2:] == ["SOUR:LIST:RES;:SOUR:FREQ:MODE LIST",
+                                     "SOUR:FREQ:MODE CW"]
+
+
+def test_smb100a_list_sweep_raises_errors(scripted_adapter):
+    errors = iter(['-222,"Data out of range;SOUR:LIST:FREQ"', '0,"No error"'])
+    adapter = scripted_adapter({
+        "*STB?": "4",
+        ":SYST:ERR?": lambda: next(errors),
+    })
+    generator = RohdeSMB100A(adapter)
+    with pytest.raises(InstrumentError, match="Data out of range"):
+        generator.config_list_sweep([1e9, 2e9], powers=[-10, -20])
+
+
+def test_sg380_list_sweep(scripted_adapter):
+    adapter = scripted_adapter()
+    generator = SG380(adapter)
+    generator.config_list_sweep([1e9, 1.5e9], powers=[-10, -12.5])
+    assert adapter.commands == [
+        "LSTD", "LSTC2",
+        "LSTP0,1000000000.0,N,N,N,-10.0" + ",N" * 10,
+        "LSTP1,1500000000.0,N,N,N,-12.5" + ",N" * 10,
+    ]
+    generator.start_list_sweep()
+    assert adapter.commands[-1] == "LSTI0;LSTE1"
@@ -0,0 +1,96 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.adapters.adapter import encode_block
+from pymeasure.instruments.agilent import AgilentE4408B
+from pymeasure.instruments.rohdeschwarz import RohdeFSQ
+
+
+def test_e4408b_frequencies_are_cached(scripted_adapter):
+    adapter = scripted_adapter({
+        ":SENS:FREQ:STAR?;": "1E9",
+        ":SENS:FREQ:STOP?;": "2E9",
+        ":SENSe:SWEEp:POINts?;": "3",
+    })
+    sa = AgilentE4408B(adapter)
+    assert list(sa.frequencies) == [1e9, 1.5e9, 2e9]
+    sa.write(":INIT:CONT OFF;")
+    sa.frequencies
+    assert adapter.commands.count(":SENS:FREQ:STAR?;") == 1
+    sa.frequency_points = 401
+    sa.frequencies
+    assert adapter.commands.count(":SENS:FREQ:STAR?;") == 2
+
+
+def test_e4408b_markers(scripted_adapter):
+    query = ":CALC:MARK1:X?;:CALC:MARK1:Y?;:CALC:MARK3:X?;:CALC:MARK3:Y?"
+    adapter = scripted_adapter({query: "1E9;-10.5;2E9;-20"})
+    assert AgilentE4408B(adapter).markers(1, 3) == [(1e9, -10.5), (2e9, -20)]
+
+
+def test_e4408b_waterfall(scripted_adapter):
+    traces = iter([[1, 2], [3, 4], [5, 6]])
+    adapter = scripted_adapter({
+        ":INIT:IMM;*OPC?": "1",
+        ":TRACE:DATA? TRACE1;": lambda: encode_block(next(traces), '<f4'),
+    })
+    image = np.zeros((2, 2))
+    rows = AgilentE4408B(adapter).waterfall(2, sweeps=3, out=image)
+    assert [list(row) for row in rows] == [[1, 2], [3, 4], [5, 6]]
+    assert image.tolist() == [[5, 6], [3, 4]]
+    assert adapter.commands[:4] == [
+        ":INIT:CONT OFF;", ":INIT:IMM;*OPC?",
+        ":FORMat:TRACe:DATA REAL,32;:FORMat:BORDer SWAP;",
+        ":TRACE:DATA? TRACE1;",
+    ]
+
+
+def test_fsq_trace_and_markers(scripted_adapter):
+    query = ":CALC:MARK1:X?;:CALC:MARK1:Y?;:CALC:MARK2:X?;:CALC:MARK2:Y?"
+    adapter = scripted_adapter({
+        "TRAC:DATA? TRACE2": encode_block([-50, -60.5], '<f4'),
+        query: "1E9;-10;1.5E9;-12.5",
+    })
+    sa = RohdeFSQ(adapter)
+    assert list(sa.trace(2)) == [-50, -60.5]
+    assert adapter.commands[0] == "FORM REAL,32;:FORM:BORD SWAP"
+    assert sa.get_markers(1, 2) == [(1e9, -10), (1.5e9, -12.5)]
+
+
+def test_fsq_frequencies_are_cached(scripted_adapter):
+    adapter = scripted_adapter({
+        ":FREQ:STAR?": "1E9",
+        ":FREQ:STOP?": "2E9",
+        "SWE:POIN?": "3",
+    })
+    sa = RohdeFSQ(adapter)
+    assert list(sa.frequencies) == [1e9, 1.5e9, 2e9]
+    sa.write("INIT;*WAI")
+    sa.frequencies
+    assert adapter.commands.count(":FREQ:STAR?") == 1
+    sa.write(":FREQ:STOP 3GHz")
+    sa.frequencies
+    assert adapter.commands.count(":FREQ:STAR?") == 2
@@ -0,0 +1,79 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.srs import SR830
+
+
+def test_stream_buffer(scripted_adapter):
+    counts = iter([3, 3, 5, 5])
+    adapter = scripted_adapter({
+        "SPTS?": lambda: str(next(counts)),
+        "TRCB?1,0,3": np.arange(3, dtype='<f4').tobytes(),
+        "TRCB?2,0,3": (-np.arange(3, dtype='<f4')).tobytes(),
+        "TRCB?1,3,2": np.arange(3, 5, dtype='<f4').tobytes(),
+        "TRCB?2,3,2": (-np.arange(3, 5, dtype='<f4')).tobytes(),
+    })
+    lockin = SR830(adapter)
+    ch1, ch2 = lockin.acquire_buffer(5, timeout=1)
+    assert list(ch1) == [0, 1, 2, 3, 4]
+    assert list(ch2) == [0, -1, -2, -3, -4]
+    assert adapter.commands[0] == "REST;SEND0;FAST0;STRD"
+    assert adapter.commands[-1] == "PAUS"
+
+
+def test_stream_buffer_fast(scripted_adapter):
+    data = np.array([[30000, -15000], [0, 3000]], dtype='<i2')
+    adapter = scripted_adapter({
+        "SENS?": "17",  # 1 mV
+        "REST;SEND0;FAST2;STRD": data.tobytes(),
+    })
+    lockin = SR830(adapter)
+    stream = lockin.stream_buffer(2, fast=True)
+    x, y = next(stream)
+    assert np.allclose(x, [1e-3, 0])
+    assert np.allclose(y, [-0.5e-3, 0.1e-3])
+    stream.close()
+    assert adapter.commands[-1] == "PAUS;FAST0"
+
+
+def test_snap(scripted_adapter):
+    adapter = scripted_adapter({"SNAP?1,2,9": "1e-3,-2e-3,1000"})
+    lockin = SR830(adapter)
+    assert lockin.snap(('x', 'y', 'frequency')) == {
+        'x': 1e-3, 'y': -2e-3, 'frequency': 1000}
+    with pytest.raises(ValueError):
+        lockin.snap(('x',))
+
+
+def test_arm_on_external(scripted_adapter):
+    adapter = scripted_adapter({})
+    lockin = SR830(adapter)
+    lockin.arm_on_external(100)
+    # STRT waits for the first trigger, where STRD would delay it by 0.5 s
+    assert adapter.commands == ["REST;SEND0;FAST0;TSTR0;SRAT14;STRT"]
+    with pytest.raises(ValueError):
+        lockin.arm_on_external(SR830.BUFFER_SIZE + 1)
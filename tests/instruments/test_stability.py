@@ -0,0 +1,73 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.stability import StabilityDetector
+
+
+def settle(detector, tau, noise=0.002, dt=0.5, duration=1000):
+    rng = np.random.RandomState(0)
+    for t in np.arange(0, duration, dt):
+        value = 300 - 10*np.exp(-t/tau) + rng.normal(0, noise)
+        if detector.update(t, value):
+            return t
+    return None
+
+
+def test_stable_once_settled():
+    detector = StabilityDetector(300, tolerance=0.05, rate=2e-3, window=30)
+    t = settle(detector, tau=20)
+    assert t is not None
+    # The approach is within the tolerance after 20*ln(10/0.05) = 106 s
+    assert 100 <= t <= 130
+    assert detector.final_value == pytest.approx(300, abs=0.05)
+
+
+def test_not_stable_away_from_setpoint():
+    detector = StabilityDetector(310, tolerance=0.05, rate=2e-3, window=30)
+    assert settle(detector, tau=20) is None
+    assert detector.final_value == pytest.approx(300, abs=0.1)
+
+
+def test_reset():
+    detector = StabilityDetector(300, tolerance=0.05, rate=2e-3, min_points=3)
+    for t in range(3):
+        assert detector.update(t, 300) is (t == 2)
+    detector.reset(setpoint=310)
+    assert detector.final_value is None
+    assert not detector.update(3, 300)
+
+
+def test_lookahead_decides_early():
+    detector = StabilityDetector(300, tolerance=0.05, rate=2e-3, window=30,
+                                 lookahead=20)
+    t = settle(detector, tau=20)
+    assert t is not None
+    # The approach is predicted within the tolerance 20 s ahead, and the
+    # rate below 2e-3 K/s, from 20*ln(250) - 20 = 90 s
+    assert 80 <= t < 100
+    # The present value is still outside of the tolerance
+    assert 10*np.exp(-t/20) > 0.05
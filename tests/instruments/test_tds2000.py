@@ -0,0 +1,62 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.adapters.adapter import encode_block
+from pymeasure.instruments.tektronix import TDS2000
+
+PREAMBLE = "WFMP:YMU?;YOF?;YZE?;XIN?;XZE?;PT_O?"
+
+
+def test_capture(scripted_adapter):
+    adapter = scripted_adapter({
+        "ACQ:STOPA SEQ;:ACQ:STATE RUN;*OPC?": "1",
+        PREAMBLE: "0.01;10;0.5;1e-3;-2e-3;0",
+        "CURV?": encode_block([10, 20, -90], 'i1'),
+    })
+    scope = TDS2000(adapter)
+    waveform = scope.capture(['CH1'])
+    assert np.allclose(waveform['CH1'], [0.5, 0.6, -0.5])
+    assert np.allclose(waveform['time'], [-2e-3, -1e-3, 0])
+    assert adapter.commands == [
+        "DAT:ENC RIB;WID 1",
+        "ACQ:STOPA SEQ;:ACQ:STATE RUN;*OPC?",
+        "HEAD OFF;DAT:SOU CH1",
+        PREAMBLE,
+        "DAT:SOU CH1",
+        "CURV?",
+    ]
+
+
+def test_preamble_cache(scripted_adapter):
+    adapter = scripted_adapter({PREAMBLE: "0.01;10;0.5;1e-3;-2e-3;0"})
+    scope = TDS2000(adapter)
+    scope.preamble('CH1')
+    scope.write("DAT:SOU CH2")
+    scope.preamble('CH1')
+    assert adapter.commands.count(PREAMBLE) == 1
+    scope.write("CH1:SCA 0.5")
+    scope.preamble('CH1')
+    assert adapter.commands.count(PREAMBLE) == 2
@@ -0,0 +1,116 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from time import sleep, time
+
+import numpy as np
+
+from pymeasure.instruments.trigger import TriggerCoordinator
+
+
+class FakeSource(object):
+
+    def __init__(self, points):
+        self.points = points
+        self.meters = []
+        self.line = None
+
+    def output_trigger_on_external(self, line):
+        self.line = line
+
+    def disable_output_trigger(self):
+        self.line = None
+
+    def run_sweep(self, should_stop, timeout):
+        records = np.zeros(self.points, dtype=[('voltage', 'f4')])
+        records['voltage'] = np.arange(self.points)
+        for meter in self.meters:
+            meter.fire(self.points, self.line)
+        return records
+
+
+class FakeMeter(object):
+
+    def __init__(self, field, missed=0):
+        self.field = field
+        self.missed = missed
+        self.buffer_count = 0
+
+    def arm_on_external(self, points, line):
+        self.armed = (points, line)
+
+    def fire(self, points, line):
+        assert line == self.armed[1]
+        self.buffer_count = min(points, self.armed[0]) - self.missed
+
+    def wait_for(self, condition, timeout=60, should_stop=lambda: False,
+                 max_interval=0.5):
+        deadline = time() + timeout
+        while not condition():
+            if should_stop():
+                return False
+            if time() > deadline:
+                raise TimeoutError("Timed out waiting for the fake meter")
+            sleep(0.001)
+        return True
+
+    def triggered_records(self):
+        records = np.zeros(self.buffer_count, dtype=[(self.field, 'f8')])
+        records[self.field] = 10*np.arange(self.buffer_count)
+        return records
+
+
+def test_trigger_coordinator():
+    source = FakeSource(5)
+    source.meters = [FakeMeter('reading'), FakeMeter('ch1', missed=1)]
+    coordinator = TriggerCoordinator(
+        source, {'dmm': source.meters[0], 'lockin': source.meters[1]}, line=2)
+    records = coordinator.run(5, settle=0.01)
+    assert source.line is None
+    assert records.dtype.names == ('source_voltage', 'dmm_reading', 'lockin_ch1')
+    assert len(records) == 4
+    assert list(records['dmm_reading']) == [0, 10, 20, 30]
+    assert list(records['source_voltage']) == [0, 1, 2, 3]
+
+
+def test_collect_missed_triggers_at_timeout():
+    meter = FakeMeter('reading', missed=2)
+    meter.arm_on_external(5, 1)
+    meter.fire(5, 1)
+    coordinator = TriggerCoordinator(FakeSource(5), {'dmm': meter})
+    records = coordinator.collect(5, timeout=0.01, settle=10)
+    assert list(records['dmm']['reading']) == [0, 10, 20]
+
+
+def test_collect_shares_the_timeout():
+    meters = {}
+    for name in ('a', 'b', 'c'):
+        meters[name] = FakeMeter('reading', missed=1)
+        meters[name].arm_on_external(5, 1)
+        meters[name].fire(5, 1)
+    coordinator = TriggerCoordinator(FakeSource(5), meters)
+    start = time()
+    records = coordinator.collect(5, timeout=0.1, settle=10)
+    assert time() - start < 0.2
+    assert all(len(records[name]) == 4 for name in meters)
@@ -22,12 +22,15 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 from pymeasure.instruments.validators import (
     strict_range, strict_discrete_set,
     truncated_range, truncated_discrete_set,
     modular_range, modular_range_bidirectional,
-    joined_validators
+    joined_validators, DiscreteSet,
+    strict_range_array, truncated_range_array, modular_range_array,
+    strict_discrete_set_array, joined_validators_array, ArrayValueError
 )
 
 
@@ -59,6 +62,54 @@ def test_truncated_discrete_set():
     assert truncated_discrete_set(11, range(10)) == 9
     assert truncated_discrete_set(-10, range(10)) == 0
 
+
+def test_discrete_set_progression():
+    values = DiscreteSet(np.arange(0, 65.1, 0.1))
+    assert len(values) == 651
+    assert 0.3 in values
+    assert 65 in values
+    assert 0.35 not in values
+    assert 66 not in values
+    assert strict_discrete_set(0.3, values) == pytest.approx(0.3)
+    assert truncated_discrete_set(0.3, values) == pytest.approx(0.3)
+    assert truncated_discrete_set(0.31, values) == pytest.approx(0.4)
+    assert truncated_discrete_set(-1, values) == 0
+    assert truncated_discrete_set(100, values) == pytest.approx(65)
+    with pytest.raises(ValueError):
+        strict_discrete_set(0.35, values)
+
+
+def test_discrete_set_members_are_clean():
+    values = DiscreteSet(np.arange(-100, 100, 0.01))
+    assert 0 in values
+    assert truncated_discrete_set(0, values) == 0
+    assert strict_discrete_set(0.3, values) == 0.3
+    assert strict_discrete_set(5, values) == 5
+    values = DiscreteSet(np.arange(0, 65.1, 0.1))
+    assert truncated_discrete_set(0.29, values) == 0.3
+    assert truncated_discrete_set(4.95, values) == 5
+
+
+def test_discrete_set_matches_plain_values():
+    plain = [1e-3, 2e-3, 10e-3, 0.5, 1, 20]
+    values = DiscreteSet(plain)
+    for value in [-1, 0, 1e-3, 1.5e-3, 0.1, 0.5, 3, 20, 100]:
+        assert (truncated_discrete_set(value, values) ==
+                truncated_discrete_set(value, plain))
+    assert strict_discrete_set(10e-3, values) == 10e-3
+    with pytest.raises(ValueError):
+        strict_discrete_set(5, values)
+
+
+def test_discrete_set_strings():
+    values = DiscreteSet(['OFF', 'ON'])
+    assert strict_discrete_set('ON', values) == 'ON'
+    with pytest.raises(ValueError):
+        strict_discrete_set('AUTO', values)
+    with pytest.raises(ValueError):
+        strict_discrete_set(1, values)
+
+
 def test_modular_range():
     assert modular_range(5, range(10)) == 5
     assert abs(modular_range(5.1, range(10)) - 5.1) < 1e-6
@@ -87,3 +138,46 @@ def test_joined_validators():
         tst_validator("OUT", [["ON", "OFF"], range(10)])
     with pytest.raises(ValueError) as e_info:
         tst_validator(20, [["ON", "OFF"], range(10)])
+
+
+def test_strict_range_array():
+    values = np.linspace(0, 9, 10000)
+    assert np.array_equal(strict_range_array(values, range(10)), values)
+    values[[3, 700]] = [20, -1]
+    with pytest.raises(ArrayValueError) as e_info:
+        strict_range_array(values, range(10))
+    assert list(e_info.value.indices) == [3, 700]
+    with pytest.raises(ValueError):
+        strict_range_array([1, np.nan], range(10))
+
+
+def test_truncated_range_array():
+    result = truncated_range_array([-10, 5.1, 20], range(10))
+    assert list(result) == [0, 5.1, 9]
+
+
+def test_modular_range_array():
+    result = modular_range_array([5, 11, -7.1], range(10))
+    assert np.allclose(result, [5, 2, 1.9])
+
+
+def test_strict_discrete_set_array():
+    values = DiscreteSet(np.arange(0, 65.1, 0.1))
+    result = strict_discrete_set_array([0.3, 1, 65], values)
+    assert np.allclose(result, [0.3, 1, 65])
+    with pytest.raises(ArrayValueError) as e_info:
+        strict_discrete_set_array([0.3, 0.35, 70], values)
+    assert list(e_info.value.indices) == [1, 2]
+    assert list(strict_discrete_set_array([1, 3], [1, 2, 3])) == [1, 3]
+    with pytest.raises(ArrayValueError):
+        strict_discrete_set_array(['ON', 'AUTO'], ['ON', 'OFF'])
+
+
+def test_joined_validators_array():
+    tst_validator = joined_validators_array(strict_discrete_set_array,
+                                            strict_range_array)
+    result = tst_validator([100, 5.5, 200], [[100, 200], range(10)])
+    assert list(result) == [100, 5.5, 200]
+    with pytest.raises(ArrayValueError) as e_info:
+        tst_validator([100, 50, 5], [[100, 200], range(10)])
+    assert list(e_info.value.indices) == [1]
@@ -0,0 +1,89 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2017 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pymeasure.instruments import _vendors
+
+# Below Python 3.7 the vendor packages and adapters are imported eagerly
+lazy_imports = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="requires module __getattr__")
+
+# Optional or heavy packages that must not be loaded by the base imports
+HEAVY_MODULES = ['visa', 'pyvisa', 'serial', 'pandas']
+
+
+def imported_modules(statement):
+    """ Returns the names of the modules imported by a statement in a
+    fresh interpreter, as reported by :code:`python -X importtime`.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        cwd=root, universal_newlines=True, check=True
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            modules.add(line.split('|')[-1].strip())
+    return modules
+
+
+@lazy_imports
+@pytest.mark.parametrize("statement", [
+    "import pymeasure.instruments",
+    "import pymeasure.adapters",
+])
+def test_no_heavy_imports(statement):
+    modules = imported_modules(statement)
+    assert modules, "python -X importtime reported no imports"
+    for name in HEAVY_MODULES:
+        assert name not in modules
+    for vendor in _vendors:
+        assert 'pymeasure.instruments.' + vendor not in modules
+
+
+@lazy_imports
+def test_vendor_import_is_isolated():
+    modules = imported_modules(
+        "from pymeasure.instruments.keithley import Keithley2400")
+    assert 'pymeasure.instruments.keithley' in modules
+    assert 'pymeasure.instruments.agilent' not in modules
+    for name in HEAVY_MODULES:
+        assert name not in modules
+
+
+def test_lazy_attributes():
+    import pymeasure.instruments
+    import pymeasure.adapters
+    assert pymeasure.instruments.keithley.Keithley2400.__name__ == 'Keithley2400'
+    assert 'keithley' in dir(pymeasure.instruments)
+    assert pymeasure.adapters.VISAAdapter.__name__ == 'VISAAdapter'
+    with pytest.raises(AttributeError):
+        pymeasure.instruments.not_a_vendor